@@ -1,33 +1,25 @@
-from selenium import webdriver
-# from selenium.webdriver.chrome.service import Service # Tidak perlu lagi Service secara eksplisit jika pakai ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 import time
+import os
+import sys
 
-# Import ChromeDriverManager
-from webdriver_manager.chrome import ChromeDriverManager
+# Tambahkan folder 'scraping' ke sys.path agar modul bersama (common/) bisa di-import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from common.browser_pool import create_driver
 
 # --- Konfigurasi Awal ---
-# CHROMEDRIVER_PATH = r'D:\Codingan\Phyton code\Web Scraping\drivers\chromedriver.exe' # Baris ini tidak lagi dibutuhkan
 
 URL = 'https://www.asus.com/id/laptops/for-gaming/rog-zephyrus/rog-zephyrus-g14-2023/'
 
 # --- Setup Selenium WebDriver ---
-options = webdriver.ChromeOptions()
-# options.add_argument('--headless')
-options.add_argument('--disable-gpu')
-options.add_argument('--window-size=1920,1080')
-options.add_argument('--no-sandbox')
-options.add_argument('--disable-dev-shm-usage')
-options.add_argument('--log-level=3') # Opsional: Mengurangi output log Selenium yang terlalu banyak
-
 driver = None
 try:
     print("Membuka browser...")
-    # Gunakan ChromeDriverManager untuk menginstal dan menjalankan driver
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    # Driver Chrome diunduh otomatis oleh Selenium Manager (bawaan Selenium 4)
+    driver = create_driver(headless=False, extra_arguments=('--log-level=3',))
 
     driver.get(URL)
     print(f"Mengakses: {URL}")
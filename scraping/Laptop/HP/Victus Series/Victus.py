@@ -1,16 +1,22 @@
-import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from selenium_stealth import stealth
 import time
 import re
 from datetime import datetime
 import random
+import os
+import sys
+
+# Tambahkan folder 'scraping' ke sys.path agar modul bersama (common/) bisa di-import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from common.browser_pool import BrowserPool, consent_warmup, open_page, wait_for_navigation
+from common.dom_extract import extract_record
+from common.row_sink import StreamingRowWriter
+from sources.hp_store import crawl_category, wide_row
 
 # ==============================================================================
 # KONFIGURASI
@@ -19,7 +25,21 @@ CONFIG = {
     'start_url': "https://www.hp.com/id-id/shop/laptops-tablets/personal-laptops/victus-laptops.html",
     'max_retries': 3,
     'retry_delay_seconds': 5,
-    'wait_timeout': 30
+    'wait_timeout': 30,
+    'headless': False,  # Ubah ke True jika tidak ingin melihat jendela browser
+    'browser_pool_size': 3,  # Jumlah browser yang mengambil detail produk secara paralel
+    'block_resources': True,  # Gambar, font, media & skrip pelacak tidak diunduh
+    # Ambil data lewat HTTP dari JSON tertanam (sources/hp_store.py); browser hanya dipakai jika gagal
+    'use_http_extractor': True
+}
+
+# Field & tabel spesifikasi halaman produk; diambil sekaligus dengan satu execute_script
+PRODUCT_FIELDS = {
+    'name': "h1[data-ui-id='page-title-wrapper']",
+    'price': "span.price-wrapper span.price",
+}
+PRODUCT_TABLES = {
+    'specs': {'rows': "table.additional-attributes tbody tr", 'key': "th.col.label", 'value': "td.col.data"},
 }
 
 
@@ -27,25 +47,12 @@ CONFIG = {
 # FUNGSI-FUNGSI
 # ==============================================================================
 
-def setup_driver():
-    """Menginisialisasi Selenium WebDriver dengan mode Stealth untuk menghindari deteksi."""
-    print("🔧 Inisialisasi WebDriver dengan mode Stealth (Anti-Bot)...")
-    options = webdriver.ChromeOptions()
-    # options.add_argument("--headless") # Bisa diaktifkan jika tidak ingin melihat browser
-    options.add_argument("--start-maximized")
-    options.add_argument("--disable-gpu")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-    driver = webdriver.Chrome(options=options)
-
-    stealth(driver,
-            languages=["en-US", "en"],
-            vendor="Google Inc.",
-            platform="Win32",
-            webgl_vendor="Intel Inc.",
-            renderer="Intel Iris OpenGL Engine",
-            fix_hairline=True)
-    return driver
+def setup_browser_pool():
+    """Menyiapkan pool browser mode Stealth (Anti-Bot); cookie diterima sekali per browser."""
+    print("🔧 Inisialisasi browser pool dengan mode Stealth (Anti-Bot)...")
+    return BrowserPool(size=CONFIG['browser_pool_size'], headless=CONFIG['headless'], stealth=True,
+                       block_resources=CONFIG['block_resources'], site="hp.com",
+                       warmup=consent_warmup(CONFIG['start_url'], "#onetrust-accept-btn-handler", timeout=10))
 
 
 def get_all_product_links(driver, start_url):
@@ -54,19 +61,8 @@ def get_all_product_links(driver, start_url):
     Ini mengadopsi logika dari kode dasar yang Anda berikan.
     """
     all_links = []
-    driver.get(start_url)
     print(f"🌐 Membuka halaman awal: {start_url}")
-    time.sleep(3)
-
-    # Menangani cookie jika ada
-    try:
-        cookie_button = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "#onetrust-accept-btn-handler")))
-        cookie_button.click()
-        print("🍪 Tombol cookie diterima.")
-        time.sleep(2)
-    except TimeoutException:
-        print("👍 Tidak ada popup cookie yang ditemukan.")
+    open_page(driver, start_url)
 
     current_page = 1
     while True:
@@ -102,7 +98,8 @@ def get_all_product_links(driver, start_url):
             driver.execute_script("arguments[0].click();", next_button)
             print("    ➡️ Mengklik tombol 'Berikutnya'...")
             current_page += 1
-            time.sleep(random.uniform(4, 6))  # Jeda lebih lama untuk memuat halaman baru
+            # Tunggu halaman lama dibuang; kontainer produk ditunggu di awal putaran berikutnya
+            wait_for_navigation(driver, next_button, timeout=CONFIG['wait_timeout'])
         except NoSuchElementException:
             print("\n✅ Tidak ada tombol 'Berikutnya'. Pengumpulan tautan selesai.")
             break
@@ -115,8 +112,10 @@ def get_all_product_links(driver, start_url):
 def scrape_product_details(driver, url):
     """
     Mengunjungi URL produk, melakukan scroll manusiawi, mengklik tombol,
-    dan mengambil detailnya dengan mekanisme retry.
+    dan mengambil detailnya dengan mekanisme retry. Dijalankan paralel oleh browser pool.
     """
+    # Jeda acak per browser sebelum membuka produk berikutnya
+    time.sleep(random.uniform(3, 6))
     for attempt in range(CONFIG['max_retries']):
         try:
             driver.get(url)
@@ -150,23 +149,12 @@ def scrape_product_details(driver, url):
             )
             print("    ✍️ Ambil data dari tabel spesifikasi lengkap...")
 
-            product_data["Nama Produk"] = driver.find_element(By.CSS_SELECTOR,
-                                                              "h1[data-ui-id='page-title-wrapper']").text.strip()
-            try:
-                price_text = driver.find_element(By.CSS_SELECTOR, "span.price-wrapper span.price").text
-                product_data["Harga"] = re.sub(r'[^\d]', '', price_text)
-            except NoSuchElementException:
-                product_data["Harga"] = "N/A"
-
-            spec_rows = driver.find_elements(By.CSS_SELECTOR, "table.additional-attributes tbody tr")
-            for row in spec_rows:
-                try:
-                    spec_name = row.find_element(By.CSS_SELECTOR, "th.col.label").text.strip()
-                    spec_value = row.find_element(By.CSS_SELECTOR, "td.col.data").text.strip()
-                    if spec_name and spec_value:
-                        product_data[spec_name] = spec_value
-                except NoSuchElementException:
-                    continue
+            fields, tables = extract_record(driver, PRODUCT_FIELDS, PRODUCT_TABLES)
+            product_data["Nama Produk"] = fields['name'] or "N/A"
+            product_data["Harga"] = re.sub(r'[^\d]', '', fields['price']) if fields['price'] is not None else "N/A"
+            for _, spec_name, spec_value in tables['specs']:
+                if spec_name and spec_value:
+                    product_data[spec_name] = spec_value
 
             return product_data
 
@@ -183,65 +171,59 @@ def scrape_product_details(driver, url):
                 return None
 
 
-# ==============================================================================
-# PROSES UTAMA
-# ==============================================================================
-if __name__ == '__main__':
-    driver = setup_driver()
-    all_laptops_data = []
-
-    print("\n" + "=" * 80)
-    print("🚀 MEMULAI PROSES SCRAPING (PENGEMBANGAN DARI KODE DASAR)")
-    print("=" * 80)
-
+def scrape_with_browser(pool, writer):
+    """Jalur Selenium: kumpulkan tautan di satu browser, lalu detail produk paralel di pool."""
     # Langkah 1: Kumpulkan semua link dari semua halaman
-    product_links = get_all_product_links(driver, CONFIG['start_url'])
+    with pool.lease() as driver:
+        product_links = get_all_product_links(driver, CONFIG['start_url'])
 
     if not product_links:
         print("❌ Tidak ada produk yang bisa di-scrape. Program berhenti.")
-    else:
-        # Langkah 2: Kunjungi setiap link untuk scraping detail
-        print(f"\n🕵️  Memulai pengambilan detail untuk {len(product_links)} produk...")
-        for i, url in enumerate(product_links):
-            print(f"\n--- [PROSES PRODUK {i + 1}/{len(product_links)}] URL: {url} ---")
+        return
 
-            laptop_details = scrape_product_details(driver, url)
+    # Langkah 2: Kunjungi setiap link untuk scraping detail
+    print(f"\n🕵️  Memulai pengambilan detail untuk {len(product_links)} produk...")
+    for i, (url, laptop_details) in enumerate(pool.map(scrape_product_details, product_links), 1):
+        print(f"\n--- [PROSES PRODUK {i}/{len(product_links)}] URL: {url} ---")
 
-            if laptop_details:
-                all_laptops_data.append(laptop_details)
-                print(f"    ✅ [SUKSES] Data untuk '{laptop_details.get('Nama Produk', 'N/A')}' berhasil diambil.")
-            else:
-                print(f"    ❌ [GAGAL] Melewati produk ini setelah beberapa kali percobaan.")
-
-            delay = random.uniform(3, 6)
-            print(f"    ⏳ Jeda {delay:.2f} detik sebelum lanjut ke produk berikutnya...")
-            time.sleep(delay)
-
-        # Langkah 3: Simpan semua data yang terkumpul ke CSV
-        print("\n" + "-" * 60)
-        print("📦 Proses scraping selesai. Menyimpan data ke file CSV...")
-
-        if not all_laptops_data:
-            print("    ⚠️ Tidak ada data valid yang berhasil dikumpulkan. Tidak ada file CSV yang dibuat.")
+        if laptop_details:
+            writer.write(laptop_details)
+            print(f"    ✅ [SUKSES] Data untuk '{laptop_details.get('Nama Produk', 'N/A')}' berhasil diambil.")
         else:
-            df = pd.DataFrame(all_laptops_data)
+            print(f"    ❌ [GAGAL] Melewati produk ini setelah beberapa kali percobaan.")
 
-            first_cols = ['Nama Produk', 'Harga', 'URL']
-            existing_first_cols = [col for col in first_cols if col in df.columns]
-            other_cols = sorted([col for col in df.columns if col not in existing_first_cols])
-            final_columns = existing_first_cols + other_cols
 
-            df = df.reindex(columns=final_columns).fillna("N/A")
-            df.insert(0, 'No', range(1, 1 + len(df)))
+# ==============================================================================
+# PROSES UTAMA
+# ==============================================================================
+if __name__ == '__main__':
+    # Baris langsung ditulis ke disk begitu diambil; header CSV disusun saat writer ditutup
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    all_laptops_data = StreamingRowWriter(f"hp_victus_laptops_lengkap_{timestamp}.csv",
+                                          first_columns=['Nama Produk', 'Harga', 'URL'], catalogue_source='hp')
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            nama_file_output = f"hp_victus_laptops_lengkap_{timestamp}.csv"
+    print("\n" + "=" * 80)
+    print("🚀 MEMULAI PROSES SCRAPING (PENGEMBANGAN DARI KODE DASAR)")
+    print("=" * 80)
 
-            df.to_csv(nama_file_output, index=False, encoding="utf-8-sig", sep=";")
+    # Jalur utama: seluruh kategori via HTTP tanpa browser; Selenium hanya jika HTML statis tidak memuat produk
+    products = crawl_category(CONFIG['start_url']) if CONFIG['use_http_extractor'] else None
+    if products is not None:
+        all_laptops_data.write_many(wide_row(product) for product in products)
+        print(f"\n✅ {len(products)} produk diambil via HTTP (JSON tertanam), tanpa browser.")
+    else:
+        # Semua Chrome di pool ditutup meskipun crawl berhenti karena error atau Ctrl-C
+        with setup_browser_pool() as pool:
+            scrape_with_browser(pool, all_laptops_data)
 
-            print(f"    ✅ Data berhasil disimpan ke: '{nama_file_output}'")
-            print(f"    - Total Produk Disimpan: {len(df)}")
-        print("-" * 60)
+    # Langkah 3: Simpan semua data yang terkumpul ke CSV
+    print("\n" + "-" * 60)
+    print("📦 Proses scraping selesai. Menyimpan data ke file CSV...")
 
-    driver.quit()
+    if not all_laptops_data.close():
+        print("    ⚠️ Tidak ada data valid yang berhasil dikumpulkan. Tidak ada file CSV yang dibuat.")
+    else:
+        print(f"    ✅ Data berhasil disimpan ke: '{all_laptops_data.output_file}'")
+        print(f"    - Total Produk Disimpan: {len(all_laptops_data)}")
+    print("-" * 60)
     print("\n🎉 SELURUH PROSES SCRAPING TELAH SELESAI 🎉")
@@ -3,6 +3,14 @@ from bs4 import BeautifulSoup
 import pandas as pd
 import time
 import json  # Diperlukan untuk beberapa website yang menyimpan data di script tag
+import os
+import sys
+
+# Tambahkan folder 'scraping' ke sys.path agar modul bersama (common/) bisa di-import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from common.http_cache import enable_cache
+from common.http_session import http_get
+from common.catalogue import upsert_into_catalogue
 
 # ==============================================================================
 # KONFIGURASI GLOBAL
@@ -12,9 +20,8 @@ import json  # Diperlukan untuk beberapa website yang menyimpan data di script t
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
     'Accept-Language': 'en-US,en;q=0.9,id;q=0.8',
-    'Accept-Encoding': 'gzip, deflate, br',
-    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-    'Connection': 'keep-alive'
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8'
+    # Accept-Encoding & keep-alive diatur oleh session bersama (common/http_session.py)
 }
 
 # ==============================================================================
@@ -82,7 +89,7 @@ def get_phone_urls(brand_config):
     print(f"Mengambil URL produk dari: {brand_config['phone_list_url']}")
     phone_urls = []
     try:
-        response = requests.get(brand_config['phone_list_url'], headers=HEADERS)
+        response = http_get(brand_config['phone_list_url'], headers=HEADERS, use_cache=False)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, 'html.parser')
 
@@ -121,7 +128,7 @@ def scrape_product_details(product_url, brand_config):
 
     try:
         # Ambil halaman utama produk
-        response_main = requests.get(product_url, headers=HEADERS)
+        response_main = http_get(product_url, headers=HEADERS)
         response_main.raise_for_status()
         soup_main = BeautifulSoup(response_main.text, 'html.parser')
 
@@ -129,7 +136,7 @@ def scrape_product_details(product_url, brand_config):
         # Jika halaman spesifikasi terpisah, ambil halamannya
         if brand_config.get('spec_page_suffix'):
             print(f"     -> Mengambil halaman spesifikasi: {spec_url}")
-            response_specs = requests.get(spec_url, headers=HEADERS)
+            response_specs = http_get(spec_url, headers=HEADERS)
             response_specs.raise_for_status()
             soup_specs = BeautifulSoup(response_specs.text, 'html.parser')
 
@@ -176,6 +183,7 @@ def main():
     Fungsi utama yang mengorkestrasi proses scraping untuk semua brand di konfigurasi.
     """
     all_brands_data = []
+    enable_cache()  # Halaman produk & spesifikasi yang tidak berubah cukup divalidasi ulang (304)
 
     for brand, config in WEBSITE_CONFIGS.items():
         print(f"\n{'=' * 20}\nMEMULAI SCRAPING UNTUK BRAND: {brand}\n{'=' * 20}")
@@ -222,6 +230,7 @@ def main():
         print(f"\nData gabungan berhasil disimpan ke:")
         print(f"1. File CSV: '{output_csv}'")
         print(f"2. File Excel: '{output_excel}'")
+        upsert_into_catalogue('brand_sites', df=df)
     except Exception as e:
         print(f"Gagal menyimpan file: {e}")
 
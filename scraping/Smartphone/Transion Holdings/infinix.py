@@ -1,25 +1,44 @@
-import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-import time
+from selenium.common.exceptions import TimeoutException
 import re
 from datetime import datetime
-
-
-def setup_driver():
-    """Menginisialisasi dan mengkonfigurasi Selenium WebDriver."""
-    print("🔧 Menyiapkan Selenium WebDriver...")
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36")
-    driver = webdriver.Chrome(options=options)
-    return driver
+import os
+import sys
+
+# Tambahkan folder 'scraping' ke sys.path agar modul bersama (common/) bisa di-import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from common.browser_pool import BrowserPool, consent_warmup
+from common.dom_extract import extract_record
+from common.row_sink import StreamingRowWriter
+
+# Urutan kolom agar lebih rapi; kolom spesifikasi lain menyusul urut abjad
+PREFERRED_COLUMNS = [
+    'Phone Name', 'Product URL', 'Estimated_Price', 'Popularity_Fans',
+    'Network_Technology', 'Launch_Announced', 'Launch_Status',
+    'Body_Dimensions', 'Body_Weight', 'Display_Type', 'Display_Size',
+    'Platform_OS', 'Platform_Chipset', 'Memory_Internal', 'Battery_Type'
+]
+
+# Field & tabel spesifikasi halaman perangkat; diambil sekaligus dengan satu execute_script
+DEVICE_FIELDS = {
+    'name': "h1.specs-phone-name-title",
+    'price_html': {'css': 'button[data-spec="price"]', 'attr': 'innerHTML'},
+    'fans': ".specs-fans > a",
+}
+DEVICE_TABLES = {
+    'specs': {'groups': "#specs-list table", 'group_title': "th", 'rows': "tr", 'key': "td.ttl", 'value': "td.nfo"},
+}
+
+
+def setup_browser_pool():
+    """Menyiapkan pool browser headless; banner cookie GSMArena diterima sekali per browser."""
+    print("🔧 Menyiapkan browser pool Selenium...")
+    return BrowserPool(
+        warmup=consent_warmup("https://www.gsmarena.com/", "onetrust-accept-btn-handler", by=By.ID, timeout=3),
+        block_resources=True, site="gsmarena.com",
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36")
 
 
 def get_phone_links_from_page(driver, page_url):
@@ -27,17 +46,7 @@ def get_phone_links_from_page(driver, page_url):
     driver.get(page_url)
     wait = WebDriverWait(driver, 10)
     try:
-        # Menambahkan penanganan cookie untuk stabilitas
-        try:
-            cookie_button = WebDriverWait(driver, 3).until(
-                EC.element_to_be_clickable((By.ID, "onetrust-accept-btn-handler")))
-            print("    - Banner cookie ditemukan, mengklik 'Accept'...")
-            cookie_button.click()
-            time.sleep(1)
-        except TimeoutException:
-            print("    - Banner cookie tidak ditemukan, melanjutkan proses.")
-            pass  # Lanjut jika banner tidak ada
-
+        # Banner cookie sudah diterima saat warmup browser pool
         wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.makers > ul > li > a")))
         product_links_elements = driver.find_elements(By.CSS_SELECTOR, "div.makers > ul > li > a")
         return [elem.get_attribute("href") for elem in product_links_elements]
@@ -64,115 +73,77 @@ def is_smartphone(specs):
 
 def scrape_device_details(driver, url):
     """
-    Mengambil semua data detail dari satu URL perangkat.
+    Mengambil semua data detail dari satu URL perangkat (dijalankan paralel oleh browser pool).
     """
     driver.get(url)
     wait = WebDriverWait(driver, 10)
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "h1.specs-phone-name-title")))
+    fields, tables = extract_record(driver, DEVICE_FIELDS, DEVICE_TABLES)
     device_data = {"Product URL": url}
-    spec_columns = set()
-    device_data["Phone Name"] = driver.find_element(By.CSS_SELECTOR, "h1.specs-phone-name-title").text.strip()
-    try:
-        price_button = driver.find_element(By.CSS_SELECTOR, 'button[data-spec="price"]')
-        price_html = price_button.get_attribute('innerHTML')
-        match = re.search(r'About\s*([\d,]+\s*\w+)', price_html, re.IGNORECASE)
-        device_data["Estimated_Price"] = match.group(1) if match else "N/A"
-    except NoSuchElementException:
-        device_data["Estimated_Price"] = "N/A"
-    spec_columns.add("Estimated_Price")
-    try:
-        fans_element = driver.find_element(By.CSS_SELECTOR, ".specs-fans > a")
-        device_data["Popularity_Fans"] = fans_element.text.strip().split('\n')[0]
-    except NoSuchElementException:
-        device_data["Popularity_Fans"] = "N/A"
-    spec_columns.add("Popularity_Fans")
-    spec_tables = driver.find_elements(By.CSS_SELECTOR, "#specs-list table")
-    for table in spec_tables:
-        try:
-            category = table.find_element(By.CSS_SELECTOR, "th").text.strip()
-            rows = table.find_elements(By.CSS_SELECTOR, "tr")
-            for row in rows:
-                try:
-                    title = row.find_element(By.CSS_SELECTOR, "td.ttl").text.strip()
-                    value = row.find_element(By.CSS_SELECTOR, "td.nfo").text.strip()
-                    if title and value:
-                        clean_category = re.sub(r'[^A-Za-z0-9_]+', '', category)
-                        clean_title = re.sub(r'[^A-Za-z0-9_]+', '', title)
-                        column_name = f"{clean_category}_{clean_title}"
-                        # Membersihkan data dari baris baru agar rapi di CSV
-                        device_data[column_name] = " ".join(value.splitlines())
-                        spec_columns.add(column_name)
-                except NoSuchElementException:
-                    continue
-        except NoSuchElementException:
+    device_data["Phone Name"] = fields['name']
+    match = re.search(r'About\s*([\d,]+\s*\w+)', fields['price_html'] or '', re.IGNORECASE)
+    device_data["Estimated_Price"] = match.group(1) if match else "N/A"
+    device_data["Popularity_Fans"] = fields['fans'].split('\n')[0] if fields['fans'] is not None else "N/A"
+    spec_columns = {"Estimated_Price", "Popularity_Fans"}
+    for category, title, value in tables['specs']:
+        # Tabel tanpa judul kategori (<th>) dilewati seperti sebelumnya
+        if category is None or not title or not value:
             continue
+        clean_category = re.sub(r'[^A-Za-z0-9_]+', '', category)
+        clean_title = re.sub(r'[^A-Za-z0-9_]+', '', title)
+        column_name = f"{clean_category}_{clean_title}"
+        # Membersihkan data dari baris baru agar rapi di CSV
+        device_data[column_name] = " ".join(value.splitlines())
+        spec_columns.add(column_name)
     return device_data, spec_columns
 
 
 def main(keyword, num_pages):
     """Fungsi utama untuk mengorkestrasi proses scraping."""
-    driver = setup_driver()
     print(f"🚀 Memulai proses scraping untuk '{keyword}' pada {num_pages} halaman dengan FOKUS PADA SMARTPHONE...")
 
-    ponsel_list = []
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Nama file akan otomatis menggunakan kata kunci yang baru
+    # Baris langsung ditulis ke disk begitu valid; header CSV disusun saat writer ditutup
+    ponsel_list = StreamingRowWriter(f"gsmarena_smartphones_{keyword}_{timestamp}.csv",
+                                     first_columns=PREFERRED_COLUMNS, catalogue_source='gsmarena')
     all_spec_columns = set()
     item_counter = 1
     scraped_counter = 0
-    for page_num in range(1, num_pages + 1):
-        list_page_url = f"https://www.gsmarena.com/results.php3?sQuickSearch=yes&sName={keyword}&iPage={page_num}"
-        print(f"\n🔄 Mengakses Halaman Daftar Perangkat #{page_num}: {list_page_url}")
-        product_links = get_phone_links_from_page(driver, list_page_url)
-        if not product_links:
-            print(f"    ⚠️ Tidak ditemukan perangkat di halaman {page_num}. Mungkin sudah halaman terakhir.")
-            break
-        print(f"    🔗 Ditemukan {len(product_links)} tautan. Memulai validasi dan scraping...")
-        for url in product_links:
-            try:
+    # Semua Chrome di pool ditutup meskipun crawl berhenti karena error atau Ctrl-C
+    with setup_browser_pool() as pool:
+        for page_num in range(1, num_pages + 1):
+            list_page_url = f"https://www.gsmarena.com/results.php3?sQuickSearch=yes&sName={keyword}&iPage={page_num}"
+            print(f"\n🔄 Mengakses Halaman Daftar Perangkat #{page_num}: {list_page_url}")
+            with pool.lease() as driver:
+                product_links = get_phone_links_from_page(driver, list_page_url)
+            if not product_links:
+                print(f"    ⚠️ Tidak ditemukan perangkat di halaman {page_num}. Mungkin sudah halaman terakhir.")
+                break
+            print(f"    🔗 Ditemukan {len(product_links)} tautan. Memulai validasi dan scraping...")
+            for url, result in pool.map(scrape_device_details, product_links):
                 scraped_counter += 1
                 print(f"    [Cek #{scraped_counter}] Memeriksa: {url}")
-                device_data, new_columns = scrape_device_details(driver, url)
+                if result is None:
+                    # Error sudah dicetak oleh worker pool; lanjut ke perangkat berikutnya
+                    continue
+                device_data, new_columns = result
                 if is_smartphone(device_data):
                     print(f"        ✅ VALID: '{device_data['Phone Name']}' adalah smartphone. Menyimpan data...")
-                    ponsel_list.append(device_data)
+                    ponsel_list.write(device_data)
                     all_spec_columns.update(new_columns)
                     item_counter += 1
                 else:
                     print(f"        ❌ SKIP: '{device_data['Phone Name']}' bukan smartphone (atau tablet Wi-Fi).")
-                time.sleep(0.2)
-            except Exception as e:
-                print(f"    ❌❌❌ ERROR tak terduga saat scraping {url}: {e}")
-                print("    Melanjutkan ke perangkat berikutnya...")
-                continue
     print("\n" + "=" * 60)
     print("📊 Proses scraping selesai. Mempersiapkan data untuk disimpan ke CSV...")
-    if not ponsel_list:
+    if not ponsel_list.close():
         print("❌ Tidak ada smartphone yang berhasil di-scrape sesuai kriteria.")
     else:
-        # Mengatur urutan kolom agar lebih rapi
-        preferred_columns = [
-            'Phone Name', 'Product URL', 'Estimated_Price', 'Popularity_Fans',
-            'Network_Technology', 'Launch_Announced', 'Launch_Status',
-            'Body_Dimensions', 'Body_Weight', 'Display_Type', 'Display_Size',
-            'Platform_OS', 'Platform_Chipset', 'Memory_Internal', 'Battery_Type'
-        ]
-        other_columns = sorted(list(all_spec_columns - set(preferred_columns)))
-        final_columns = [col for col in preferred_columns if col in all_spec_columns] + other_columns
-
-        df = pd.DataFrame(ponsel_list)
-        df = df.reindex(columns=final_columns)
-        df.fillna("N/A", inplace=True)
-        df.insert(0, 'No', range(1, 1 + len(df)))
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        # Nama file akan otomatis menggunakan kata kunci yang baru
-        nama_file_output = f"gsmarena_smartphones_{keyword}_{timestamp}.csv"
-
-        df.to_csv(nama_file_output, index=False, encoding="utf-8-sig", sep=";")
-        print(f"\n✅ Data lengkap berhasil disimpan ke '{nama_file_output}'")
+        print(f"\n✅ Data lengkap berhasil disimpan ke '{ponsel_list.output_file}'")
         print(f"    - Total Perangkat Diperiksa: {scraped_counter}")
-        print(f"    - Total Smartphone Ditemukan & Disimpan: {len(df)}")
+        print(f"    - Total Smartphone Ditemukan & Disimpan: {len(ponsel_list)}")
         print(f"    - Total Kolom Spesifikasi Unik Ditemukan: {len(all_spec_columns)}")
-    driver.quit()
     print("🎉 Proses selesai. Browser telah ditutup.")
 
 
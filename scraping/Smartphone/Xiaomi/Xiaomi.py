@@ -1,23 +1,27 @@
 import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException
-import time
+from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException, TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+import os
+import sys
 
-# === SETUP CHROME DALAM MODE HEADLESS ===
-options = webdriver.ChromeOptions()
-options.add_argument("--headless")
-options.add_argument("--disable-gpu")
-options.add_argument("--window-size=1920,1080")
+# Tambahkan folder 'scraping' ke sys.path agar modul bersama (common/) bisa di-import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from common.browser_pool import create_driver, open_page, wait_for_count
+from common.catalogue import upsert_into_catalogue
 
-# Inisialisasi browser dengan opsi headless
-driver = webdriver.Chrome(options=options)
+# === SETUP CHROME DALAM MODE HEADLESS ===
+driver = create_driver(headless=True, block_resources=True, site="mi.co.id")
 
 # --- PERUBAHAN 1: MENGGANTI URL TARGET ---
 start_url = "https://www.mi.co.id/id/product-list/phone/poco/"
-driver.get(start_url)
 print(f"🔗 Membuka halaman: {start_url}")
-time.sleep(5) # Beri waktu lebih agar halaman & javascript-nya termuat penuh
+try:
+    # Daftar produk dirender JavaScript; lanjut begitu kartu produk pertama muncul
+    open_page(driver, start_url, "div.list-item")
+except TimeoutException:
+    print("⚠️ Daftar produk tidak muncul dalam batas waktu.")
 
 # --- PERUBAHAN 2: LOGIKA BARU UNTUK TOMBOL "MUAT LEBIH BANYAK" ---
 # Logika lama untuk deteksi halaman terakhir dihapus
@@ -27,19 +31,23 @@ while True:
         # Cari tombolnya
         load_more_button = driver.find_element(By.CSS_SELECTOR, ".load-more-btn")
         
-        # Gulir ke tombol agar terlihat dan bisa diklik
+        # Gulir ke tombol agar terlihat dan tunggu sampai bisa diklik
         driver.execute_script("arguments[0].scrollIntoView(true);", load_more_button)
-        time.sleep(1) # Jeda singkat setelah scroll
+        WebDriverWait(driver, 5).until(EC.element_to_be_clickable(load_more_button))
         
         # Klik tombol
+        jumlah_sebelum = len(driver.find_elements(By.CSS_SELECTOR, "div.list-item"))
         load_more_button.click()
         print("    ✅ Tombol 'Muat Lebih Banyak' diklik. Menunggu produk baru...")
-        time.sleep(3) # Tunggu produk baru dimuat
+        # Tunggu sampai produk baru benar-benar muncul, bukan jeda tetap
+        if wait_for_count(driver, "div.list-item", jumlah_sebelum + 1, timeout=10) <= jumlah_sebelum:
+            print("⚠️ Tidak ada produk baru setelah klik, proses berhenti.")
+            break
     except NoSuchElementException:
         # Jika tombol tidak lagi ditemukan, berarti semua produk sudah dimuat
         print("👍 Semua produk telah dimuat.")
         break
-    except ElementClickInterceptedException:
+    except (ElementClickInterceptedException, TimeoutException):
         # Kadang tombol tertutup elemen lain (misal: notif cookie)
         print("⚠️ Tombol tertutup elemen lain, proses berhenti. Semua produk yang terlihat akan diambil.")
         break
@@ -84,6 +92,8 @@ df = pd.DataFrame(produk_list)
 # Nama file diubah agar tidak menimpa file lama
 df.to_csv("daftar_hp_poco_xiaomi.csv", index=False, encoding="utf-8-sig", sep=";")
 print("\n✅ Data berhasil disimpan ke 'daftar_hp_poco_xiaomi.csv'")
+# Halaman daftar Xiaomi tidak punya kolom brand/URL; key katalog memakai nama produk
+upsert_into_catalogue('brand_sites', df=df.assign(Brand='Xiaomi'))
 
 # Tutup browser
 driver.quit()
\ No newline at end of file
@@ -1,9 +1,16 @@
-import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 import time
 from datetime import datetime
 import re
+import os
+import sys
+
+# Tambahkan folder 'scraping' ke sys.path agar modul bersama (common/) bisa di-import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from common.http_cache import enable_cache
+from common.http_session import http_get
+from common.row_sink import StreamingRowWriter
 
 # ==============================================================================
 # KONFIGURASI TERPUSAT UNTUK GSMARENA.ID
@@ -44,7 +51,7 @@ def get_all_phone_urls_for_brand(brand_name):
     while page_url:
         print(f"🔄 Mengambil URL dari Halaman #{page_counter}...")
         try:
-            response = requests.get(page_url, headers=CONFIG['headers'])
+            response = http_get(page_url, headers=CONFIG['headers'], use_cache=False)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
 
@@ -85,7 +92,7 @@ def scrape_product_details(url):
     Menggunakan Requests & BeautifulSoup untuk mengambil detail dari satu URL produk.
     """
     try:
-        response = requests.get(url, headers=CONFIG['headers'])
+        response = http_get(url, headers=CONFIG['headers'])
         response.raise_for_status()
         soup = BeautifulSoup(response.text, 'html.parser')
 
@@ -119,6 +126,7 @@ def scrape_product_details(url):
 def main(brand_name):
     """Fungsi utama untuk menjalankan scraper gsmarena.id."""
     print(f"\n🚀 Memulai proses scraping untuk brand '{brand_name}' dari gsmarena.id...")
+    enable_cache()  # Halaman detail yang tidak berubah cukup divalidasi ulang (304)
 
     # Langkah 1: Dapatkan semua link
     phone_urls = get_all_phone_urls_for_brand(brand_name.lower())  # Ubah ke huruf kecil untuk konsistensi URL
@@ -128,7 +136,11 @@ def main(brand_name):
         return
 
     # Langkah 2: Scrape detail dari setiap link
-    product_list = []
+    # Baris langsung ditulis ke disk begitu diambil; header CSV disusun saat writer ditutup
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    product_list = StreamingRowWriter(f"gsmarena_id_{brand_name.lower()}_{timestamp}.csv",
+                                      first_columns=['Phone Name', 'Product URL', 'Image URL'],
+                                      catalogue_source='gsmarena_id')
     total_links = len(phone_urls)
     for i, url in enumerate(phone_urls):
         # Mengambil nama dari URL untuk ditampilkan di log agar lebih informatif
@@ -136,34 +148,18 @@ def main(brand_name):
         print(f"    ({i + 1}/{total_links}) Scraping: {phone_name_from_url}")
         details = scrape_product_details(url)
         if details:
-            product_list.append(details)
+            product_list.write(details)
         time.sleep(0.5)  # Jeda sopan antar request
 
     # Langkah 3: Simpan hasil
     print("\n" + "=" * 60)
     print("📊 Proses scraping selesai. Menyimpan data...")
 
-    if not product_list:
+    if not product_list.close():
         print("❌ Tidak ada data yang berhasil di-scrape.")
     else:
-        df = pd.DataFrame(product_list)
-
-        # Atur urutan kolom
-        first_cols = ['Phone Name', 'Product URL', 'Image URL']
-        existing_first_cols = [col for col in first_cols if col in df.columns]
-        other_cols = sorted([col for col in df.columns if col not in existing_first_cols])
-        final_columns = existing_first_cols + other_cols
-
-        df = df.reindex(columns=final_columns).fillna("N/A")
-        df.insert(0, 'No', range(1, 1 + len(df)))
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_filename = f"gsmarena_id_{brand_name.lower()}_{timestamp}.csv"
-
-        df.to_csv(output_filename, index=False, encoding="utf-8-sig", sep=";")
-
-        print(f"\n✅ Data lengkap berhasil disimpan ke '{output_filename}'")
-        print(f"    - Total Produk Disimpan: {len(df)}")
+        print(f"\n✅ Data lengkap berhasil disimpan ke '{product_list.output_file}'")
+        print(f"    - Total Produk Disimpan: {len(product_list)}")
 
     print("🎉 Proses selesai.")
 
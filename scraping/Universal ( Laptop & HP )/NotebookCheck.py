@@ -1,16 +1,16 @@
-import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.keys import Keys
-from selenium_stealth import stealth
-import time
+from selenium.common.exceptions import TimeoutException
 from datetime import datetime
-import random
-from urllib.parse import quote
+from urllib.parse import quote, urljoin
+import os
+import sys
+
+# Tambahkan folder 'scraping' ke sys.path agar modul bersama (common/) bisa di-import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from common.browser_pool import BrowserPool, consent_warmup, open_page
+from common.dom_extract import extract_record
+from common.rate_limiter import HostRateLimiter
+from common.row_sink import StreamingRowWriter
 
 # ==============================================================================
 # KONFIGURASI
@@ -18,6 +18,7 @@ from urllib.parse import quote
 CONFIG = {
     # URL dasar untuk pencarian. Format: {search_term} akan diganti
     'search_url_template': "https://www.notebookcheck.net/index.php?id=129&search={search_term}&model=1&company=1&show=1",
+    'home_url': "https://www.notebookcheck.net/",  # Dibuka sekali per browser untuk menerima cookie
 
     # Definisikan brand dan kategori yang ingin di-scrape
     'brands_and_categories': {
@@ -35,7 +36,25 @@ CONFIG = {
     'max_pages_per_category': 3,  # Batasi jumlah halaman per kategori
     'max_retries': 3,
     'retry_delay_seconds': 5,
-    'wait_timeout': 20
+    'wait_timeout': 20,
+    'browser_pool_size': 3,  # Jumlah browser yang mengambil daftar & ulasan secara paralel
+    'requests_per_second': 0.5,  # Laju total halaman untuk semua browser (token bucket per host)
+    'block_resources': True  # Gambar, font, media & skrip pelacak tidak diunduh
+}
+
+
+# Selector halaman daftar & ulasan; semua field diambil dengan satu execute_script per halaman
+LISTING_FIELDS = {
+    'links': {'css': "article.news_list_item > a", 'attr': "href", 'all': True},
+    'next_page': {'css': "a.pagenav_next", 'attr': "href"},
+}
+REVIEW_FIELDS = {
+    'title': "h1",
+    'meta': "div.news_meta_data",
+    'score': "div.score-value",
+}
+REVIEW_TABLES = {
+    'specs': {'rows': "table.specs tr", 'key': "td:nth-of-type(1)", 'value': "td:nth-of-type(2)"},
 }
 
 
@@ -43,214 +62,147 @@ CONFIG = {
 # FUNGSI-FUNGSI
 # ==============================================================================
 
-def setup_driver():
-    """Menginisialisasi Selenium WebDriver dengan mode Stealth dan Headless."""
-    print("🔧 Inisialisasi WebDriver dengan mode Stealth (Headless)...")
-    options = webdriver.ChromeOptions()
-    # --- PERUBAHAN: Mengaktifkan mode headless ---
-    options.add_argument("--headless")
-    options.add_argument("--start-maximized")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")  # Penting untuk headless
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-    driver = webdriver.Chrome(options=options)
-
-    stealth(driver,
-            languages=["en-US", "en"],
-            vendor="Google Inc.",
-            platform="Win32",
-            webgl_vendor="Intel Inc.",
-            renderer="Intel Iris OpenGL Engine",
-            fix_hairline=True)
-    return driver
-
-
-def get_all_review_links(driver, search_url, max_pages):
-    """Membuka halaman pencarian, menavigasi halaman, dan mengumpulkan tautan ulasan."""
+def setup_browser_pool():
+    """Menyiapkan pool browser headless mode Stealth; cookie diterima sekali per browser."""
+    print("🔧 Inisialisasi browser pool dengan mode Stealth (Headless)...")
+    return BrowserPool(size=CONFIG['browser_pool_size'], stealth=True,
+                       block_resources=CONFIG['block_resources'], site="notebookcheck.net",
+                       warmup=consent_warmup(CONFIG['home_url'], "//button[contains(., 'ACCEPT ALL')]",
+                                             by=By.XPATH, timeout=10))
+
+
+def get_all_review_links(driver, search_url, max_pages=None):
+    """
+    Mengumpulkan tautan ulasan dari halaman pencarian. Halaman berikutnya dibuka langsung
+    lewat href tombol 'next' (tanpa klik); dijalankan paralel per kata kunci oleh browser pool.
+    """
+    max_pages = max_pages or CONFIG['max_pages_per_category']
     all_links = []
-    driver.get(search_url)
-    print(f"🌐 Membuka halaman pencarian: {search_url}")
-    time.sleep(3)
-
-    # Menangani cookie jika ada
-    try:
-        cookie_button = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'ACCEPT ALL')]")))
-        cookie_button.click()
-        print("🍪 Tombol cookie diterima.")
-        time.sleep(2)
-    except TimeoutException:
-        print("👍 Tidak ada popup cookie yang ditemukan.")
-
+    page_url = search_url
     for page_num in range(1, max_pages + 1):
-        print(f"\n📄 Memindai Halaman {page_num}/{max_pages} untuk mengumpulkan tautan...")
-
+        print(f"🌐 [{page_num}/{max_pages}] Membuka halaman pencarian: {page_url}")
         try:
-            WebDriverWait(driver, CONFIG['wait_timeout']).until(
-                EC.presence_of_element_located((By.ID, "news_list"))
-            )
+            open_page(driver, page_url, "#news_list", by=By.CSS_SELECTOR, timeout=CONFIG['wait_timeout'])
         except TimeoutException:
             print(f"❌ Gagal memuat kontainer ulasan di halaman {page_num}. Menghentikan proses.")
             break
 
-        review_elements = driver.find_elements(By.CSS_SELECTOR, "article.news_list_item > a")
-        page_links = [elem.get_attribute("href") for elem in review_elements]
-        if page_links:
-            all_links.extend(page_links)
-            print(f"    🔗 Berhasil mengumpulkan {len(page_links)} tautan dari halaman ini.")
-        else:
+        fields, _ = extract_record(driver, LISTING_FIELDS)
+        page_links = [urljoin(page_url, href) for href in fields['links'] if href]
+        if not page_links:
             print("    ⚠️ Tidak ada tautan ulasan ditemukan di halaman ini. Mungkin akhir dari hasil pencarian.")
             break
+        all_links.extend(page_links)
+        print(f"    🔗 Berhasil mengumpulkan {len(page_links)} tautan dari halaman ini.")
 
-        if page_num == max_pages:
-            print(f"\n✅ Telah mencapai batas maksimum {max_pages} halaman untuk di-scrape.")
-            break
-
-        try:
-            next_button = driver.find_element(By.CSS_SELECTOR, "a.pagenav_next")
-            driver.execute_script("arguments[0].scrollIntoView();", next_button)
-            time.sleep(1)
-            next_button.click()
-            print("    ➡️ Mengklik tombol 'next'...")
-            time.sleep(random.uniform(3, 5))
-        except NoSuchElementException:
-            print("\n✅ Tidak ada tombol 'next'. Pengumpulan tautan selesai.")
+        if not fields['next_page']:
+            print("✅ Tidak ada tombol 'next'. Pengumpulan tautan selesai.")
             break
+        page_url = urljoin(page_url, fields['next_page'])
 
-    unique_links = list(set(all_links))
-    print(f"\n📊 Pengumpulan tautan selesai. Ditemukan total {len(unique_links)} tautan ulasan unik.")
-    return unique_links
+    return list(dict.fromkeys(all_links))
 
 
-def scrape_review_details(driver, url):
-    """Mengunjungi URL ulasan dan mengambil data detailnya."""
-    for attempt in range(CONFIG['max_retries']):
-        try:
-            driver.get(url)
-            WebDriverWait(driver, CONFIG['wait_timeout']).until(
-                EC.presence_of_element_located((By.TAG_NAME, "h1"))
-            )
-
-            body = driver.find_element(By.TAG_NAME, 'body')
-            body.send_keys(Keys.PAGE_DOWN)
-            time.sleep(1)
-
-            review_data = {"URL": url}
-            review_data["Title"] = driver.find_element(By.TAG_NAME, "h1").text.strip()
-
-            try:
-                meta_data = driver.find_element(By.CSS_SELECTOR, "div.news_meta_data").text.strip()
-                review_data["Author & Date"] = meta_data
-            except NoSuchElementException:
-                review_data["Author & Date"] = "N/A"
+def plan_review_crawl(pool, rate_limiter=None):
+    """
+    Rencana crawl untuk semua brand x kategori: halaman pencarian semua kata kunci diambil
+    paralel, lalu tautan ulasan di-dedupe secara global. Mengembalikan (terms, plan):
+    terms = {search_url: (brand, category)} dan plan = {review_url: [(brand, category), ...]}
+    sehingga ulasan yang muncul di beberapa pencarian (misal "ASUS Gaming" & "ASUS ProArt")
+    hanya diambil sekali.
+    """
+    terms = {}
+    for brand, categories in CONFIG['brands_and_categories'].items():
+        for category in categories:
+            # Membuat URL pencarian yang valid dengan mengganti spasi menjadi '%20'
+            search_url = CONFIG['search_url_template'].format(search_term=quote(f"{brand} {category}"))
+            terms[search_url] = (brand, category)
 
-            try:
-                score = driver.find_element(By.CSS_SELECTOR, "div.score-value").text.strip()
-                review_data["Overall Score (%)"] = score
-            except NoSuchElementException:
-                review_data["Overall Score (%)"] = "N/A"
+    print(f"📋 Mengumpulkan tautan ulasan untuk {len(terms)} kata kunci secara paralel...")
+    links_by_term = dict(pool.map(get_all_review_links, list(terms), rate_limiter=rate_limiter))
 
-            print("    ✍️ Mengambil data dari tabel spesifikasi...")
-            try:
-                spec_rows = driver.find_elements(By.CSS_SELECTOR, "table.specs tr")
-                for row in spec_rows:
-                    try:
-                        cells = row.find_elements(By.TAG_NAME, "td")
-                        if len(cells) >= 2:
-                            spec_name = cells[0].text.strip().replace(":", "")
-                            spec_value = cells[1].text.strip()
-                            if spec_name and spec_value:
-                                review_data[f"Spec_{spec_name}"] = spec_value
-                    except Exception:
-                        continue
-            except Exception as e:
-                print(f"    ⚠️ Gagal mengambil tabel spesifikasi: {e}")
+    plan = {}
+    for search_url, term in terms.items():  # Urutan konfigurasi, bukan urutan selesai
+        links = links_by_term.get(search_url) or []
+        print(f"    🔗 {term[0]} {term[1]}: {len(links)} tautan ulasan.")
+        for link in links:
+            plan.setdefault(link, []).append(term)
+    total_links = sum(len(links or []) for links in links_by_term.values())
+    print(f"📊 {total_links} tautan dari semua pencarian -> {len(plan)} ulasan unik yang akan diambil.")
+    return terms, plan
 
-            return review_data
 
-        except Exception as e:
-            error_line = str(e).split('\n')[0]
-            print(
-                f"    ⚠️ [Percobaan {attempt + 1}/{CONFIG['max_retries']}] Gagal. Error: {type(e).__name__} - {error_line}")
-            if attempt < CONFIG['max_retries'] - 1:
-                print(f"    ⏳ Mencoba lagi dalam {CONFIG['retry_delay_seconds']} detik...")
-                time.sleep(CONFIG['retry_delay_seconds'])
-            else:
-                print(f"    ❌ [GAGAL TOTAL] Gagal mengambil data untuk URL: {url}")
-                return None
+def scrape_review_details(driver, url):
+    """
+    Mengunjungi URL ulasan dan mengambil data detailnya dengan satu execute_script
+    (dijalankan paralel oleh browser pool; retry diatur oleh `pool.map`).
+    """
+    try:
+        open_page(driver, url, "h1", by=By.TAG_NAME, timeout=CONFIG['wait_timeout'])
+        fields, tables = extract_record(driver, REVIEW_FIELDS, REVIEW_TABLES)
+    except Exception as e:
+        error_line = str(e).split('\n')[0]
+        print(f"    ⚠️ Gagal memuat ulasan. Error: {type(e).__name__} - {error_line}")
+        return None
+
+    review_data = {"URL": url}
+    review_data["Title"] = fields['title'] or ""
+    review_data["Author & Date"] = fields['meta'] or "N/A"
+    review_data["Overall Score (%)"] = fields['score'] or "N/A"
+    for _, spec_name, spec_value in tables['specs']:
+        spec_name = spec_name.replace(":", "")
+        if spec_name and spec_value:
+            review_data[f"Spec_{spec_name}"] = spec_value
+    return review_data
 
 
 # ==============================================================================
 # PROSES UTAMA
 # ==============================================================================
 if __name__ == '__main__':
-    driver = setup_driver()
-
-    # --- PERUBAHAN: Loop melalui setiap brand dan kategori ---
-    for brand, categories in CONFIG['brands_and_categories'].items():
-        for category in categories:
-            all_reviews_data = []
-            search_term = f"{brand} {category}"
-            # Membuat URL pencarian yang valid dengan mengganti spasi menjadi '+'
-            search_url = CONFIG['search_url_template'].format(search_term=quote(search_term))
-
-            print("\n" + "=" * 80)
-            print(f"🚀 MEMULAI PROSES SCRAPING UNTUK: {brand.upper()} - {category.upper()}")
-            print("=" * 80)
-
-            review_links = get_all_review_links(driver, search_url, CONFIG['max_pages_per_category'])
-
-            if not review_links:
-                print(f"❌ Tidak ada ulasan ditemukan untuk '{search_term}'. Lanjut ke kategori berikutnya.")
-                continue
-
-            print(f"\n🕵️  Memulai pengambilan detail untuk {len(review_links)} ulasan...")
-            for i, url in enumerate(review_links):
-                print(f"\n--- [PROSES ULASAN {i + 1}/{len(review_links)}] URL: {url} ---")
-
-                review_details = scrape_review_details(driver, url)
-
-                if review_details:
-                    # Menambahkan Brand dan Kategori ke data untuk identifikasi
-                    review_details['Brand'] = brand
-                    review_details['Category'] = category
-                    all_reviews_data.append(review_details)
-                    print(f"    ✅ [SUKSES] Data untuk '{review_details.get('Title', 'N/A')}' berhasil diambil.")
-                else:
-                    print(f"    ❌ [GAGAL] Melewati ulasan ini setelah beberapa kali percobaan.")
-
-                delay = random.uniform(2, 4)
-                print(f"    ⏳ Jeda {delay:.2f} detik sebelum lanjut...")
-                time.sleep(delay)
+    # Semua Chrome di pool ditutup meskipun crawl berhenti karena error atau Ctrl-C
+    with setup_browser_pool() as pool:
+        # Laju halaman total untuk semua browser (pengganti jeda acak per browser)
+        rate_limiter = HostRateLimiter(CONFIG['requests_per_second'], burst=pool.size)
+
+        print("\n" + "=" * 80)
+        print("🚀 MEMULAI PROSES SCRAPING NOTEBOOKCHECK UNTUK SEMUA BRAND & KATEGORI")
+        print("=" * 80)
+        terms, plan = plan_review_crawl(pool, rate_limiter)
+
+        # Satu file CSV per brand & kategori (seperti sebelumnya); baris ulasan yang sama ditulis ke
+        # setiap file pencarian yang memuatnya, tetapi halaman ulasannya hanya dibuka sekali
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        writers = {}
+        for brand, category in terms.values():
+            safe_brand = brand.replace(' ', '_')
+            safe_category = category.replace(' ', '_')
+            writers[(brand, category)] = StreamingRowWriter(
+                f"notebookcheck_{safe_brand}_{safe_category}_{timestamp}.csv",
+                first_columns=['Brand', 'Category', 'Title', 'Overall Score (%)', 'Author & Date', 'URL'],
+                catalogue_source='notebookcheck')
+
+        print(f"\n🕵️  Memulai pengambilan detail untuk {len(plan)} ulasan unik...")
+        scraped = pool.map(scrape_review_details, list(plan), rate_limiter=rate_limiter,
+                           max_retries=CONFIG['max_retries'], retry_delay_seconds=CONFIG['retry_delay_seconds'])
+        for i, (url, review_details) in enumerate(scraped, 1):
+            print(f"\n--- [PROSES ULASAN {i}/{len(plan)}] URL: {url} ---")
+            if review_details:
+                # Menambahkan Brand dan Kategori ke data untuk identifikasi
+                for brand, category in plan[url]:
+                    writers[(brand, category)].write({**review_details, 'Brand': brand, 'Category': category})
+                print(f"    ✅ [SUKSES] Data untuk '{review_details.get('Title', 'N/A')}' berhasil diambil.")
+            else:
+                print("    ❌ [GAGAL] Melewati ulasan ini setelah beberapa kali percobaan.")
 
+        for (brand, category), all_reviews_data in writers.items():
             print("\n" + "-" * 60)
-            print(f"📦 Proses untuk '{search_term}' selesai. Menyimpan data ke file CSV...")
-
-            if not all_reviews_data:
+            print(f"📦 Proses untuk '{brand} {category}' selesai. Menyimpan data ke file CSV...")
+            if not all_reviews_data.close():
                 print("    ⚠️ Tidak ada data valid yang berhasil dikumpulkan.")
             else:
-                df = pd.DataFrame(all_reviews_data)
-
-                first_cols = ['Brand', 'Category', 'Title', 'Overall Score (%)', 'Author & Date', 'URL']
-                existing_first_cols = [col for col in first_cols if col in df.columns]
-                other_cols = sorted([col for col in df.columns if col not in existing_first_cols])
-                final_columns = existing_first_cols + other_cols
-
-                df = df.reindex(columns=final_columns).fillna("N/A")
-                df.insert(0, 'No', range(1, 1 + len(df)))
-
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                # --- PERUBAHAN: Nama file dinamis berdasarkan brand dan kategori ---
-                safe_brand = brand.replace(' ', '_')
-                safe_category = category.replace(' ', '_')
-                nama_file_output = f"notebookcheck_{safe_brand}_{safe_category}_{timestamp}.csv"
-
-                df.to_csv(nama_file_output, index=False, encoding="utf-8-sig", sep=";")
-
-                print(f"    ✅ Data berhasil disimpan ke: '{nama_file_output}'")
-                print(f"    - Total Ulasan Disimpan: {len(df)}")
+                print(f"    ✅ Data berhasil disimpan ke: '{all_reviews_data.output_file}'")
+                print(f"    - Total Ulasan Disimpan: {len(all_reviews_data)}")
             print("-" * 60)
 
-    driver.quit()
     print("\n🎉 SELURUH PROSES SCRAPING TELAH SELESAI 🎉")
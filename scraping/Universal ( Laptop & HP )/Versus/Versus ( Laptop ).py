@@ -1,13 +1,21 @@
-import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import time
-import re
 from datetime import datetime
 import random
+import os
+import sys
+
+# Tambahkan folder 'scraping' ke sys.path agar modul bersama (common/) bisa di-import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from common.browser_pool import BrowserPool, consent_warmup, open_page, scroll_until_loaded
+from common.delta import DeltaTracker
+from common.dom_extract import extract_record
+from common.row_sink import StreamingRowWriter
+from sources.versus import crawl_details, spec_column
+from sources.versus import product_links as search_api_links
 
 # ==============================================================================
 # KONFIGURASI TERPUSAT UNTUK VERSUS.COM
@@ -22,39 +30,47 @@ CONFIG = {
         'versus_score': 'div[data-test-id="total-score-card-score"]',
         'specs_container': 'div[data-test-id="specs-list"]',
         'spec_category_title': 'div[data-test-id="category-title"]',
+        # Baris spesifikasi = anak langsung specs-list: <div>nama</div><div>nilai</div>
+        'spec_name': ':scope > div:nth-of-type(1)',
+        'spec_value': ':scope > div:nth-of-type(2)',
     },
-    'scroll_pause_time': 4,
+    'use_search_api': True,  # Daftar laptop dari API pencarian (sources/versus.py); scroll hanya sebagai fallback
+    'use_detail_json': True,  # Detail dari __NEXT_DATA__ via HTTP; browser hanya untuk halaman yang gagal
+    'scroll_pause_time': 4,  # Batas tunggu kartu baru setelah setiap scroll (detik)
     'max_retries': 3,
-    'retry_delay_seconds': 20
+    'retry_delay_seconds': 20,
+    'delta_mode': True,  # Hanya ambil laptop baru / yang sudah waktunya refresh, lalu tulis changelog
+    'delta_refresh_days': 7,  # Laptop lama diambil ulang paling lambat setelah sekian hari
+    'headless': False,  # Mode normal (jendela terlihat) seperti sebelumnya; True untuk headless
+    'browser_pool_size': 3,  # Jumlah browser yang mengambil detail laptop secara paralel
+    'block_resources': True  # Gambar, font, media & skrip pelacak tidak diunduh
+}
+
+# Spesifikasi ekstraksi halaman detail (common.dom_extract), dibangun dari selector di atas
+DETAIL_FIELDS = {
+    'name': CONFIG['selectors']['product_name'],
+    'score': CONFIG['selectors']['versus_score'],
+    'specs_container': {'css': CONFIG['selectors']['specs_container'], 'attr': 'data-test-id'},
+}
+DETAIL_TABLES = {
+    'specs': {'rows': f"{CONFIG['selectors']['specs_container']} > *",
+              'heading': CONFIG['selectors']['spec_category_title'],
+              'key': CONFIG['selectors']['spec_name'], 'value': CONFIG['selectors']['spec_value']},
 }
 
 # ==============================================================================
 # FUNGSI-FUNGSI
 # ==============================================================================
 
-def setup_driver():
-    """Menginisialisasi Selenium WebDriver dengan opsi penyamaran."""
-    print("🔧 Inisialisasi Selenium WebDriver (Mode Normal dengan Penyamaran)...")
-    options = webdriver.ChromeOptions()
-    
-    # <--- PERUBAIKAN UTAMA: Opsi untuk menyamarkan deteksi otomasi ---
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-    # --- Akhir Perbaikan Utama ---
-
-    options.add_argument("--disable-gpu")
-    options.add_argument("--start-maximized")
-    options.add_argument("--lang=en-US")
-    options.add_argument(f"user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36")
-    
-    driver = webdriver.Chrome(options=options)
-
-    # <--- PERUBAIKAN UTAMA: Menjalankan skrip untuk 'menipu' situs web ---
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-    # --- Akhir Perbaikan Utama ---
-    
-    return driver
+def setup_browser_pool():
+    """
+    Menyiapkan pool browser dengan opsi penyamaran (stealth: sembunyikan navigator.webdriver
+    di setiap dokumen baru). Cookie banner diterima sekali per browser saat warmup.
+    """
+    print("🔧 Inisialisasi browser pool Selenium (Mode Normal dengan Penyamaran)...")
+    return BrowserPool(size=CONFIG['browser_pool_size'], headless=CONFIG['headless'], stealth=True,
+                       extra_arguments=("--lang=en-US",), block_resources=CONFIG['block_resources'], site="versus.com",
+                       warmup=consent_warmup(CONFIG['start_url'], CONFIG['selectors']['cookie_button'], timeout=10))
 
 
 def get_all_laptop_links_with_scrolling(driver):
@@ -63,33 +79,16 @@ def get_all_laptop_links_with_scrolling(driver):
     semua laptop, lalu mengumpulkan semua link produk.
     """
     print(f"🌍 Mengakses halaman utama: {CONFIG['start_url']}")
-    driver.get(CONFIG['start_url'])
-
     try:
-        cookie_button = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, CONFIG['selectors']['cookie_button'])))
-        cookie_button.click()
-        print("    ✅ Cookie banner diterima.")
-        time.sleep(2)
+        open_page(driver, CONFIG['start_url'], CONFIG['selectors']['product_card'], timeout=25)
     except TimeoutException:
-        print("    ℹ️ Tidak ada cookie banner yang ditemukan atau sudah diterima.")
+        print("    ⚠️ Kartu laptop belum muncul, tetap mencoba scroll...")
 
     print("📜 Memulai proses 'infinite scroll' untuk memuat semua laptop...")
-    last_height = driver.execute_script("return document.body.scrollHeight")
-    while True:
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        print("    ...scrolling...")
-        time.sleep(CONFIG['scroll_pause_time'])
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
-            # Lakukan satu scroll terakhir untuk memastikan
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(CONFIG['scroll_pause_time'])
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                 print("    🏁 Telah mencapai bagian bawah halaman.")
-                 break
-        last_height = new_height
+    # Scroll berhenti begitu tidak ada kartu laptop baru dalam 'scroll_pause_time' detik
+    total_cards = scroll_until_loaded(driver, CONFIG['selectors']['product_card'], timeout=CONFIG['scroll_pause_time'],
+                                      max_rounds=500)
+    print(f"    🏁 Telah mencapai bagian bawah halaman ({total_cards} kartu laptop).")
 
     try:
         print("\n🔗 Mengumpulkan semua tautan laptop dari halaman...")
@@ -117,39 +116,28 @@ def get_all_laptop_links_with_scrolling(driver):
 def scrape_laptop_details(driver, url):
     """
     Menggunakan Selenium untuk membuka halaman detail dan mengambil semua spesifikasi.
+    Dijalankan paralel oleh browser pool.
     """
+    # Jeda acak per browser sebelum membuka laptop berikutnya
+    time.sleep(random.uniform(3, 8))
     try:
         driver.get(url)
         WebDriverWait(driver, 20).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, CONFIG['selectors']['product_name'])))
 
+        # Seluruh halaman (nama, skor, semua baris spesifikasi) diambil dengan satu execute_script
+        selectors = CONFIG['selectors']
+        fields, tables = extract_record(driver, DETAIL_FIELDS, DETAIL_TABLES)
+        if fields['specs_container'] is None:
+            raise NoSuchElementException(f"Elemen '{selectors['specs_container']}' tidak ditemukan")
+
         laptop_data = {"Product URL": url}
-        
-        laptop_data["Device Name"] = driver.find_element(By.CSS_SELECTOR, CONFIG['selectors']['product_name']).text.strip()
-        try:
-            laptop_data["Versus Score"] = driver.find_element(By.CSS_SELECTOR, CONFIG['selectors']['versus_score']).text.strip()
-        except NoSuchElementException:
-            laptop_data["Versus Score"] = "N/A"
-
-        specs_container = driver.find_element(By.CSS_SELECTOR, CONFIG['selectors']['specs_container'])
-        all_children = specs_container.find_elements(By.XPATH, "./*")
-
-        current_category = "General"
-        for child in all_children:
-            if child.get_attribute("data-test-id") == "category-title":
-                current_category = child.text.strip().replace(' ', '_').replace('&', 'and')
-            else:
-                try:
-                    spec_parts = child.find_elements(By.XPATH, "./div")
-                    if len(spec_parts) >= 2:
-                        spec_name = spec_parts[0].text.strip()
-                        spec_value = spec_parts[1].text.strip()
-                        clean_title = re.sub(r'[^A-Za-z0-9_]+', '', spec_name.replace(' ', '_'))
-                        column_name = f"{current_category}_{clean_title}"
-                        laptop_data[column_name] = spec_value
-                except Exception:
-                    continue
-        
+        laptop_data["Device Name"] = fields['name'] or ""
+        laptop_data["Versus Score"] = fields['score'] if fields['score'] is not None else "N/A"
+
+        for category, spec_name, spec_value in tables['specs']:
+            laptop_data[spec_column(category, spec_name)] = spec_value
+
         return laptop_data
     except TimeoutException:
         print(f"        ❌ Timeout saat memuat detail dari URL: {url}")
@@ -160,69 +148,73 @@ def scrape_laptop_details(driver, url):
 
 
 if __name__ == '__main__':
-    driver = setup_driver()
-    all_laptops_data = []
+    # Baris langsung ditulis ke disk begitu diambil; header CSV disusun saat writer ditutup
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    all_laptops_data = StreamingRowWriter(f"versus_laptops_{timestamp}.csv",
+                                          first_columns=['Device Name', 'Versus Score', 'Product URL'],
+                                          catalogue_source='versus')
+    delta = DeltaTracker('versus_laptops', 'Product URL', 'Device Name', CONFIG['delta_mode'], CONFIG['delta_refresh_days'])
 
     print("\n" + "=" * 80)
     print("🚀 MEMULAI PROSES SCRAPING LAPTOP DARI VERSUS.COM")
     print("=" * 80)
 
-    product_links = get_all_laptop_links_with_scrolling(driver)
+    # Semua Chrome di pool ditutup meskipun crawl berhenti karena error atau Ctrl-C
+    with setup_browser_pool() as pool:
+        product_links = search_api_links('laptop') if CONFIG['use_search_api'] else None
+        if product_links is None:
+            print("🔁 Menggunakan infinite scroll (Selenium) untuk menemukan laptop...")
+            with pool.lease() as driver:
+                product_links = get_all_laptop_links_with_scrolling(driver)
 
-    if not product_links:
-        print("❌ Tidak ada tautan produk yang berhasil dikumpulkan. Proses dihentikan.")
-    else:
-        print(f"\n🕵️  Memulai pengambilan detail untuk {len(product_links)} laptop...")
-        
-        for i, url in enumerate(product_links):
-            print(f"\n    [PROSES {i + 1}/{len(product_links)}] URL: {url}")
-
-            laptop_details = None
-            for attempt in range(CONFIG['max_retries']):
-                scraped_data = scrape_laptop_details(driver, url)
-                if scraped_data:
-                    laptop_details = scraped_data
-                    print(f"        👍 [VALID] Data untuk '{laptop_details.get('Device Name', 'N/A')}' berhasil diambil.")
-                    break
-                else:
-                    print(f"        [GAGAL] Percobaan {attempt + 1}/{CONFIG['max_retries']} gagal.")
-                    if attempt < CONFIG['max_retries'] - 1:
-                        print(f"        ⏳ Mencoba lagi dalam {CONFIG['retry_delay_seconds']} detik...")
-                        time.sleep(CONFIG['retry_delay_seconds'])
-            
-            if laptop_details:
-                all_laptops_data.append(laptop_details)
-            else:
-                print(f"        ❌ [FINAL] Gagal total mengambil data untuk URL setelah {CONFIG['max_retries']} percobaan. Melewati URL ini.")
-
-            delay = random.uniform(3, 8) 
-            print(f"        ⏳ Jeda acak {delay:.2f} detik sebelum lanjut...")
-            time.sleep(delay)
-
-        print("\n" + "-" * 60)
-        print("📦 Proses scraping selesai. Menyimpan data ke file CSV...")
-        if not all_laptops_data:
-            print("    ⚠️ Tidak ada data laptop valid yang terkumpul. Tidak ada file CSV yang dibuat.")
+        if not product_links:
+            print("❌ Tidak ada tautan produk yang berhasil dikumpulkan. Proses dihentikan.")
         else:
-            df = pd.DataFrame(all_laptops_data)
-            
-            first_cols = ['Device Name', 'Versus Score', 'Product URL']
-            existing_first_cols = [col for col in first_cols if col in df.columns]
-            other_cols = sorted([col for col in df.columns if col not in existing_first_cols])
-            final_columns = existing_first_cols + other_cols
+            # Mode delta: hanya laptop baru / yang sudah waktunya refresh yang dibuka di browser
+            plan = delta.plan('laptop', 'versus_laptops', product_links)
+            all_laptops_data.write_many(plan.carried_rows.values())
+            print(f"\n🕵️  Memulai pengambilan detail untuk {len(plan.to_fetch)} laptop...")
+
+            # Tahap 1: detail dari state JSON halaman (HTTP, paralel); yang gagal dibuka dengan browser
+            browser_urls = plan.to_fetch
+            if CONFIG['use_detail_json']:
+                browser_urls = []
+                for i, (url, laptop_details) in enumerate(crawl_details(plan.to_fetch), 1):
+                    if isinstance(laptop_details, dict):
+                        print(f"    👍 [HTTP {i}/{len(plan.to_fetch)}] '{laptop_details['Device Name']}' berhasil diambil.")
+                        all_laptops_data.write(delta.track(plan, url, laptop_details))
+                    else:
+                        browser_urls.append(url)
+                if browser_urls:
+                    print(f"\n🔁 {len(browser_urls)} laptop diambil dengan browser (tanpa __NEXT_DATA__ / request gagal)...")
+
+            # Tahap 2: browser pool paralel; setiap URL dicoba ulang hingga max_retries kali
+            scraped = pool.map(scrape_laptop_details, browser_urls, max_retries=CONFIG['max_retries'],
+                               retry_delay_seconds=CONFIG['retry_delay_seconds'])
+            for i, (url, laptop_details) in enumerate(scraped, 1):
+                print(f"\n    [PROSES {i}/{len(browser_urls)}] URL: {url}")
+                if laptop_details:
+                    print(f"        👍 [VALID] Data untuk '{laptop_details.get('Device Name', 'N/A')}' berhasil diambil.")
 
-            df = df.reindex(columns=final_columns).fillna("N/A")
-            df.insert(0, 'No', range(1, 1 + len(df)))
+                laptop_details = delta.track(plan, url, laptop_details)
+                if laptop_details:
+                    all_laptops_data.write(laptop_details)
+                else:
+                    print(f"        ❌ [FINAL] Gagal total mengambil data untuk URL setelah {CONFIG['max_retries']} percobaan. Melewati URL ini.")
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            nama_file_output = f"versus_laptops_{timestamp}.csv"
-            df.to_csv(nama_file_output, index=False, encoding="utf-8-sig", sep=";")
+            delta.write_changelog(plan, all_laptops_data.iter_rows())
 
-            print(f"    ✅ Data berhasil disimpan ke: '{nama_file_output}'")
-            print(f"    - Total Laptop Disimpan: {len(df)}")
-        print("-" * 60)
+            print("\n" + "-" * 60)
+            print("📦 Proses scraping selesai. Menyimpan data ke file CSV...")
+            if not all_laptops_data.close():
+                print("    ⚠️ Tidak ada data laptop valid yang terkumpul. Tidak ada file CSV yang dibuat.")
+            else:
+                print(f"    ✅ Data berhasil disimpan ke: '{all_laptops_data.output_file}'")
+                print(f"    - Total Laptop Disimpan: {len(all_laptops_data)}")
+            delta.mark_scope_done(plan)
+            print("-" * 60)
 
-    driver.quit()
+    all_laptops_data.close()  # Membuang spool kosong jika tidak ada tautan sama sekali
     print("\n\n" + "=" * 80)
     print("🎉 SELURUH PROSES SCRAPING TELAH SELESAI 🎉")
     print("=" * 80)
@@ -1,30 +1,24 @@
 import time
 import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+import os
+import sys
 
+# Tambahkan folder 'scraping' ke sys.path agar modul bersama (common/) bisa di-import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from common.browser_pool import BrowserPool, consent_warmup, open_page
+from common.catalogue import upsert_into_catalogue
+from sources.pricebook import PRICEBOOK_CONFIG, crawl_catalogue, listing_page_url
 
-def setup_driver():
-    """Menyiapkan driver Chrome dengan mode headless dan opsi lainnya."""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920x1080")
-    chrome_options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-
-    service = ChromeService(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    return driver
+BASE_URL = "https://www.pricebook.co.id/smartphone"
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+# Tombol pop-up cookies yang ditutup sekali per browser saat warmup
+COOKIE_BUTTON_XPATH = "//button[contains(text(), 'Tutup') or contains(text(), 'Setuju')]"
+# Ambil daftar & detail lewat HTTP (sources/pricebook.py); browser hanya untuk yang gagal
+USE_HTTP_CRAWLER = True
 
 
 def scrape_detail_page(driver):
@@ -73,91 +67,68 @@ def scrape_detail_page(driver):
     }
 
 
-def scrape_pricebook_interactive():
-    """Fungsi utama untuk melakukan scraping dengan metode interaktif."""
-    driver = setup_driver()
-    base_url = "https://www.pricebook.co.id/smartphone"
-    scraped_data = []
+def scrape_product(driver, url):
+    """Membuka halaman detail langsung lewat URL kartu produk; dijalankan paralel oleh browser pool."""
+    print(f"Mengambil: {url}")
+    driver.get(url)
+    return scrape_detail_page(driver)
+
+
+def harvest_links_with_browser(pool):
+    """Kumpulkan href kartu produk dari setiap halaman daftar (buka lewat URL, tanpa klik/back)."""
+    links = []
+    with pool.lease() as driver:
+        for page_num in range(1, PRICEBOOK_CONFIG['max_pages'] + 1):
+            page_url = listing_page_url(PRICEBOOK_CONFIG, page_num)
+            print(f"Mengakses halaman daftar #{page_num}: {page_url}")
+            try:
+                open_page(driver, page_url, "div.pr-card-default > a", timeout=20)
+            except TimeoutException:
+                if page_num == 1:
+                    print("Gagal menemukan kartu produk. Website mungkin berubah atau lambat merespon.")
+                break
+            product_cards = driver.find_elements(By.CSS_SELECTOR, "div.pr-card-default > a")
+            new_links = [href for href in dict.fromkeys(card.get_attribute("href") for card in product_cards)
+                         if href and href not in links]
+            if not new_links:
+                break
+            links.extend(new_links)
+    print(f"Berhasil menemukan {len(links)} produk. Memulai proses scraping...")
+    return links
 
-    print(f"Mengakses halaman utama: {base_url}")
-    driver.get(base_url)
 
-    # Menunggu dan mencoba menutup pop-up cookies
-    try:
-        wait = WebDriverWait(driver, 10)
-        cookie_button = wait.until(
-            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Tutup') or contains(text(), 'Setuju')]")))
-        cookie_button.click()
-        print("Pop-up cookies berhasil ditutup.")
-    except (TimeoutException, NoSuchElementException):
-        print("Tidak ada pop-up cookies yang ditemukan.")
-
-    # Dapatkan jumlah produk di halaman pertama untuk loop
-    try:
-        product_cards = WebDriverWait(driver, 20).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.pr-card-default > a"))
-        )
-        num_products = len(product_cards)
-        print(f"Berhasil menemukan {num_products} produk di halaman pertama. Memulai proses scraping...")
-    except TimeoutException:
-        print("Gagal menemukan kartu produk. Website mungkin berubah atau lambat merespon.")
-        driver.quit()
-        return
-
-    # Loop berdasarkan jumlah produk yang ditemukan
-    for i in range(num_products):
-        print(f"\n--- Memproses produk ke-{i + 1} dari {num_products} ---")
-        try:
-            # PENTING: Cari ulang semua elemen di setiap iterasi untuk menghindari StaleElementReferenceException
-            product_cards = WebDriverWait(driver, 20).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.pr-card-default > a"))
-            )
-
-            # Pilih kartu produk untuk iterasi saat ini
-            card_to_click = product_cards[i]
-
-            # Scroll ke elemen sebelum klik untuk memastikan elemen terlihat
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card_to_click)
-            time.sleep(1)  # Beri jeda setelah scroll
-
-            # Klik produk untuk pindah ke halaman detail
-            product_name_on_list = card_to_click.find_element(By.CSS_SELECTOR, ".pr-card-default__title").text
-            print(f"Mengklik: {product_name_on_list}")
-            card_to_click.click()
-
-            # Scrape data dari halaman detail
-            product_info = scrape_detail_page(driver)
-            scraped_data.append(product_info)
-            print(f"-> Data untuk '{product_info['Nama Produk']}' berhasil diambil.")
-
-            # Kembali ke halaman list
-            print("Kembali ke halaman daftar produk...")
-            driver.back()
-
-            # PENTING: Tunggu hingga halaman list dimuat ulang sepenuhnya
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.pr-card-default > a"))
-            )
-            print("Halaman daftar produk berhasil dimuat ulang.")
-
-        except (StaleElementReferenceException, IndexError):
-            print("Error: Elemen menjadi 'stale'. Mencoba lagi pada iterasi berikutnya.")
-            # Muat ulang halaman untuk me-refresh semua elemen jika terjadi error serius
-            driver.refresh()
-            continue
-        except Exception as e:
-            print(f"Terjadi error pada produk ke-{i + 1}: {e}")
-            print("Mencoba kembali ke halaman utama untuk melanjutkan.")
-            driver.get(base_url)  # Kembali ke halaman utama jika terjadi error tak terduga
-            continue
-
-    driver.quit()
+def scrape_pricebook_interactive():
+    """
+    Fungsi utama: kumpulkan tautan kartu produk dari semua halaman daftar, lalu ambil detailnya
+    via HTTP secara paralel; browser pool hanya dipakai untuk halaman yang gagal via HTTP.
+    """
+    # Browser baru dinyalakan saat pertama kali dipinjam; `with` menutupnya meskipun terjadi error/Ctrl-C
+    with BrowserPool(warmup=consent_warmup(BASE_URL, COOKIE_BUTTON_XPATH, by=By.XPATH, timeout=10),
+                     user_agent=USER_AGENT, block_resources=True, site="pricebook.co.id") as pool:
+        result = crawl_catalogue() if USE_HTTP_CRAWLER else None
+        if result is not None:
+            product_links, http_rows, browser_links = result
+            scraped = {row["Link Produk"]: row for row in http_rows}
+        else:
+            print("🔁 Menggunakan Selenium (browser pool) untuk mengambil data...")
+            product_links = harvest_links_with_browser(pool)
+            browser_links, scraped = product_links, {}
+
+        for i, (url, product_info) in enumerate(pool.map(scrape_product, browser_links), 1):
+            print(f"\n--- Produk ke-{i} dari {len(browser_links)} (browser) ---")
+            if product_info:
+                scraped[url] = product_info
+                print(f"-> Data untuk '{product_info['Nama Produk']}' berhasil diambil.")
+            else:
+                print(f"Terjadi error pada produk: {url}")
+    scraped_data = [scraped[url] for url in product_links if url in scraped]
 
     # Simpan data ke CSV
     if scraped_data:
         df = pd.DataFrame(scraped_data)
         df.to_csv("pricebook_smartphone_detailed.csv", index=False, encoding='utf-8-sig')
         print("\nScraping selesai! Data telah disimpan ke file 'pricebook_smartphone_detailed.csv'")
+        upsert_into_catalogue('pricebook', df=df)
     else:
         print("\nTidak ada data yang berhasil diambil.")
 
@@ -1,5 +1,3 @@
-import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -10,6 +8,15 @@ import time
 import re
 from datetime import datetime
 import random
+import os
+import sys
+
+# Tambahkan folder 'scraping' ke sys.path agar modul bersama (common/) bisa di-import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from common.delta import DeltaTracker
+from common.http_cache import enable_cache
+from common.http_session import http_get
+from common.row_sink import StreamingRowWriter
 
 # Konfigurasi tidak berubah
 CONFIG_LENOVO = {
@@ -24,7 +31,9 @@ CONFIG_LENOVO = {
         'tech_specs_container': '#tech_specs_container-scroll', 'spec_row': 'div.feature-container',
         'spec_title': 'div.feature-label', 'spec_value': 'div.feature-value',
     },
-    'max_retries': 3, 'retry_delay_seconds': 20
+    'max_retries': 3, 'retry_delay_seconds': 20,
+    'delta_mode': True,  # Hanya ambil laptop baru / yang sudah waktunya refresh, lalu tulis changelog
+    'delta_refresh_days': 7  # Laptop lama diambil ulang paling lambat setelah sekian hari
 }
 
 
@@ -84,7 +93,7 @@ def get_all_laptop_links_from_lenovo(driver):
 
 def scrape_lenovo_laptop_details(url):
     try:
-        response = requests.get(url, headers=CONFIG_LENOVO['headers']);
+        response = http_get(url, headers=CONFIG_LENOVO['headers']);
         response.raise_for_status()
         soup = BeautifulSoup(response.text, 'html.parser');
         laptop_data = {"Product_URL": url}
@@ -113,7 +122,9 @@ if __name__ == '__main__':
     print("🚀 MEMULAI PROSES SCRAPING SEMUA LAPTOP DARI SITUS RESMI LENOVO INDONESIA")
     print("=" * 80)
 
-    all_laptops_data = []
+    enable_cache()  # Detail laptop yang tidak berubah cukup divalidasi ulang (304)
+    delta = DeltaTracker(os.path.splitext(os.path.basename(__file__))[0], 'Product_URL', 'Product_Name',
+                         CONFIG_LENOVO['delta_mode'], CONFIG_LENOVO['delta_refresh_days'])
     driver = setup_driver()
     laptop_links = get_all_laptop_links_from_lenovo(driver)
 
@@ -128,19 +139,28 @@ if __name__ == '__main__':
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         nama_file_txt = f"spesifikasi_laptop_{timestamp}.txt"
         nama_file_csv = f"lenovo_all_laptops_{timestamp}.csv"
+        # Baris tabel langsung ditulis ke disk; header CSV disusun saat writer ditutup
+        all_laptops_data = StreamingRowWriter(nama_file_csv, first_columns=['Product_Name', 'Price', 'Product_URL'],
+                                              catalogue_source='lenovo')
+
+        # Mode delta: hanya laptop baru / yang sudah waktunya refresh yang diambil ulang
+        plan = delta.plan('laptops', 'lenovo_all_laptops', laptop_links)
+        all_laptops_data.write_many(plan.carried_rows.values())
 
-        print(f"\n🕵️  Memulai pengambilan detail untuk {len(laptop_links)} laptop...")
+        print(f"\n🕵️  Memulai pengambilan detail untuk {len(plan.to_fetch)} laptop "
+              f"({len(plan.carried_rows)} dibawa dari snapshot sebelumnya)...")
         print(f"    📄 Hasil copy-paste akan disimpan di: {nama_file_txt}")
         print(f"    📊 Hasil data tabel akan disimpan di: {nama_file_csv}")
 
-        for i, url in enumerate(laptop_links):
-            print(f"\n    [PROSES {i + 1}/{len(laptop_links)}] URL: {url}")
+        for i, url in enumerate(plan.to_fetch):
+            print(f"\n    [PROSES {i + 1}/{len(plan.to_fetch)}] URL: {url}")
             # Logika scraping tetap sama
             laptop_data = scrape_lenovo_laptop_details(url)  # Menggunakan versi ringkas tanpa retry
+            laptop_data = delta.track(plan, url, laptop_data)
 
             if laptop_data:
                 print(f"        👍 [BERHASIL] Data untuk '{laptop_data.get('Product_Name', 'N/A')}' berhasil diambil.")
-                all_laptops_data.append(laptop_data)  # Tetap kumpulkan data untuk CSV
+                all_laptops_data.write(laptop_data)  # Tetap kumpulkan data untuk CSV
 
                 # --- PERUBAHAN: Tulis data ke file .txt dengan format rapi ---
                 try:
@@ -164,20 +184,15 @@ if __name__ == '__main__':
             time.sleep(random.uniform(1, 3))  # Jeda singkat antar request
 
         # --- Penyimpanan ke CSV (logika ini tidak berubah) ---
+        delta.write_changelog(plan, all_laptops_data.iter_rows())
+
         print("\n" + "-" * 60)
         print("📦 Menyimpan data tabel ke file CSV...")
-        if all_laptops_data:
-            df = pd.DataFrame(all_laptops_data)
-            first_cols = ['Product_Name', 'Price', 'Product_URL']
-            existing_first_cols = [col for col in first_cols if col in df.columns]
-            other_cols = sorted([col for col in df.columns if col not in existing_first_cols])
-            final_columns = existing_first_cols + other_cols
-            df = df.reindex(columns=final_columns).fillna("N/A")
-            df.insert(0, 'No', range(1, 1 + len(df)))
-            df.to_csv(nama_file_csv, index=False, encoding="utf-8-sig", sep=";")
+        if all_laptops_data.close():
             print(f"    ✅ Data tabel berhasil disimpan ke: '{nama_file_csv}'")
         else:
             print("    ⚠️ Tidak ada data untuk disimpan ke CSV.")
+        delta.mark_scope_done(plan)
         print("-" * 60)
 
     print("\n\n" + "=" * 80)
@@ -0,0 +1,96 @@
+"""
+Benchmark resolusi entitas: semua pasangan (O(n²)) vs indeks blok (brand, token).
+
+Perangkat referensi diambil dari file `gsmarena_*.csv` yang sudah tersimpan. Nama versi
+"toko" dibuat dari nama tersebut (huruf besar, kapasitas "8/256GB", kata promosi) sehingga
+kebenarannya diketahui. Baseline menilai setiap nama toko terhadap semua perangkat kanonik;
+versi baru memakai `resolve_entities`. Hasil keduanya dibandingkan agar identik.
+
+Jalankan dari folder 'scraping':  python benchmarks/bench_entity_resolution.py
+"""
+import glob
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from common.catalogue import catalogue_records
+from common.entity_resolution import ENTITY_CONFIG, pair_score, parse_records, resolve_entities
+
+CSV_GLOB = os.path.join(os.path.dirname(__file__), '..', 'Universal ( Laptop & HP )', 'Gsm Arena',
+                        'gsmarena_*_20*.csv')
+RETAIL_ROWS = 5000
+SUFFIXES = ('8/256GB', '12GB+512GB', '256 GB Garansi Resmi', 'Resmi Indonesia', 'Free Case', '')
+
+
+def load_reference():
+    records = {}
+    for path in glob.glob(CSV_GLOB):
+        df = pd.read_csv(path, sep=';', encoding='utf-8-sig', dtype=str, keep_default_na=False)
+        for key, _, _, brand, name, *_ in catalogue_records('gsmarena', df):
+            records[key] = ('gsmarena', key, brand, name)
+    return list(records.values())
+
+
+def make_retail(reference):
+    random.seed(0)
+    retail, truth = [], {}
+    for i in range(RETAIL_ROWS):
+        _, key, _, name = random.choice(reference)
+        name = f"{name} {random.choice(SUFFIXES)}".strip()
+        retail.append(('shopee', f'shopee-{i}', None, name.upper() if i % 2 else name))
+        truth[f'shopee-{i}'] = key
+    return retail, truth
+
+
+def resolve_all_pairs(records):
+    """Baseline: setiap nama toko dinilai terhadap semua perangkat kanonik (tanpa blok)."""
+    reference = set(ENTITY_CONFIG['reference_sources'])
+    parsed, weights, _ = parse_records(records, reference, ENTITY_CONFIG['threshold'])
+    canonical = [r for r in parsed if r['source'] in reference]
+    links = {}
+    for record in parsed:
+        if record['source'] in reference:
+            continue
+        best, best_score = None, 0.0
+        for candidate in canonical:
+            if candidate['brand'] != record['brand']:
+                continue
+            score = pair_score(record, candidate, weights[record['brand']])
+            if score > best_score:
+                best, best_score = candidate, score
+        if best is not None and best_score >= ENTITY_CONFIG['threshold']:
+            links[record['key']] = best['key']
+    return links
+
+
+def main():
+    reference = load_reference()
+    retail, truth = make_retail(reference)
+    records = reference + retail
+    print(f"Katalog: {len(reference)} perangkat referensi + {len(retail)} nama toko\n")
+
+    start = time.perf_counter()
+    baseline = resolve_all_pairs(records)
+    t_pairs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    links = resolve_entities(records)
+    t_blocked = time.perf_counter() - start
+
+    canonical_key = {cid: key for source, key, cid, _ in links if source == 'gsmarena'}
+    blocked = {key: canonical_key[cid] for source, key, cid, _ in links if source == 'shopee'}
+    assert blocked == baseline
+    correct = sum(truth[key] == ref for key, ref in blocked.items())
+
+    print(f"{'semua pasangan':<18}{t_pairs * 1000:>10.1f} ms")
+    print(f"{'indeks blok':<18}{t_blocked * 1000:>10.1f} ms   ({t_pairs / t_blocked:.1f}x)")
+    print(f"\nTertaut: {len(blocked)}/{len(retail)} nama toko, {correct} ke perangkat yang benar.")
+    print("✅ Hasil kedua cara identik.")
+
+
+if __name__ == '__main__':
+    main()
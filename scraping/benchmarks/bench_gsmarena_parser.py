@@ -0,0 +1,107 @@
+"""
+Micro-benchmark parser halaman spesifikasi GSMArena.
+
+Halaman HTML direkonstruksi dari file `gsmarena_*_smartphone_*.csv` yang sudah tersimpan
+(satu tabel per kategori, baris `td.ttl`/`td.nfo`, ditambah navigasi & script sebagai
+"noise" seperti halaman aslinya), lalu di-parsing dengan setiap backend yang tersedia.
+Baseline `bs4-html.parser` sama dengan cara lama di `scrape_details_with_requests`.
+
+Jalankan dari folder 'scraping':  python benchmarks/bench_gsmarena_parser.py
+"""
+import glob
+import html
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from common.html_parser import BACKEND_PRIORITY, available_backends
+from sources.gsmarena import GSMARENA_CONFIG as CONFIG, parse_device_page
+
+CSV_GLOB = os.path.join(os.path.dirname(__file__), '..', 'Universal ( Laptop & HP )', 'Gsm Arena',
+                        'gsmarena_*_smartphone_*.csv')
+META_COLUMNS = {'No', 'Brand', 'Device Name', 'Product URL', 'Estimated_Price', 'Popularity_Fans'}
+PAGE_NOISE = ''.join(f'<li><a href="/brand-{i}.php">Brand {i}</a></li>' for i in range(300))
+PAGE_SCRIPTS = '<script>var x = {};</script>' * 50
+
+
+def build_page(row):
+    """Membuat ulang halaman spesifikasi dari satu baris CSV."""
+    tables = {}
+    for column, value in row.items():
+        if column in META_COLUMNS or value in ('', 'N/A'):
+            continue
+        category, _, title = column.partition('_')
+        # Baris baru di CSV tersimpan sebagai CRLF; halaman asli memakai LF
+        tables.setdefault(category, []).append((title, value.replace('\r\n', '\n')))
+
+    parts = [f'<html><head>{PAGE_SCRIPTS}</head><body><ul class="nav">{PAGE_NOISE}</ul>',
+             f'<h1 class="specs-phone-name-title">{html.escape(row["Device Name"])}</h1>',
+             f'<button data-spec="price">About {html.escape(row.get("Estimated_Price", ""))}</button>',
+             f'<div class="specs-fans"><a>{html.escape(row.get("Popularity_Fans", ""))}\nBecome a fan</a></div>',
+             '<div id="specs-list">']
+    for category, rows in tables.items():
+        parts.append(f'<table><tr><th rowspan="{len(rows)}">{category}</th>')
+        for i, (title, value) in enumerate(rows):
+            if i:
+                parts.append('<tr>')
+            parts.append(f'<td class="ttl"><a href="#">{html.escape(title)}</a></td>'
+                         f'<td class="nfo">{html.escape(value)}</td></tr>')
+        parts.append('</table>')
+    parts.append('</div></body></html>')
+    return ''.join(parts)
+
+
+def parse_device_page_legacy(html_text, url):
+    """Salinan logika lama (BeautifulSoup + html.parser + re.sub per sel) sebagai pembanding."""
+    soup = BeautifulSoup(html_text, 'html.parser')
+    device_data = {"Product URL": url}
+    device_data["Device Name"] = soup.select_one(CONFIG['selectors']['phone_name']).text.strip()
+    price_button = soup.select_one(CONFIG['selectors']['price_button'])
+    match = re.search(r'About\s*([\d,.]+\s*\w+)', price_button.decode_contents(), re.IGNORECASE)
+    device_data["Estimated_Price"] = match.group(1).strip() if match else "N/A"
+    fans_element = soup.select_one(CONFIG['selectors']['popularity_fans'])
+    device_data["Popularity_Fans"] = fans_element.text.strip().split('\n')[0] if fans_element else "N/A"
+    for table in soup.select(CONFIG['selectors']['spec_tables']):
+        category = table.select_one(CONFIG['selectors']['table_category']).text.strip()
+        for row in table.select(CONFIG['selectors']['table_row']):
+            title_tag = row.select_one(CONFIG['selectors']['spec_title_cell'])
+            value_tag = row.select_one(CONFIG['selectors']['spec_value_cell'])
+            if title_tag and value_tag:
+                clean_category = re.sub(r'[^A-Za-z0-9_]+', '', category)
+                clean_title = re.sub(r'[^A-Za-z0-9_]+', '', title_tag.text.strip())
+                device_data[f"{clean_category}_{clean_title}"] = value_tag.text.strip()
+    return device_data
+
+
+def main():
+    pages = []
+    for path in sorted(glob.glob(CSV_GLOB)):
+        df = pd.read_csv(path, sep=';', encoding='utf-8-sig', dtype=str, keep_default_na=False)
+        pages.extend((row['Product URL'], build_page(row)) for row in df.to_dict('records'))
+    print(f"📄 {len(pages)} halaman direkonstruksi dari {len(glob.glob(CSV_GLOB))} file CSV.")
+
+    start = time.perf_counter()
+    expected = [parse_device_page_legacy(page, url) for url, page in pages]
+    baseline = time.perf_counter() - start
+    print(f"\n{'Backend':<22}{'Total (s)':>12}{'ms/halaman':>14}{'Speedup':>10}  Hasil sama?")
+    print(f"{'legacy html.parser':<22}{baseline:>12.3f}{baseline / len(pages) * 1000:>14.2f}{1:>9.1f}x")
+
+    missing = [name for name in BACKEND_PRIORITY if name not in available_backends()]
+    if missing:
+        print(f"⚠️ Backend tidak terpasang (dilewati): {', '.join(missing)}")
+
+    for backend in available_backends() + ['bs4-html.parser']:
+        start = time.perf_counter()
+        results = [parse_device_page(CONFIG, page, url, backend=backend) for url, page in pages]
+        elapsed = time.perf_counter() - start
+        same = "ya" if results == expected else "TIDAK"
+        print(f"{backend:<22}{elapsed:>12.3f}{elapsed / len(pages) * 1000:>14.2f}{baseline / elapsed:>9.1f}x  {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark normalisasi spesifikasi: regex per baris vs `str.extract` per kolom.
+
+Katalog dibangun dari file `gsmarena_*.csv` yang sudah tersimpan lalu digandakan hingga
+sekitar 10.000 perangkat. Baseline memanggil `classify_device` dan regex angka untuk setiap
+baris (cara lama); versi baru memakai `normalize_specs` + `classify_devices` sekali per kolom.
+Hasil kedua cara dibandingkan agar identik.
+
+Jalankan dari folder 'scraping':  python benchmarks/bench_spec_normalize.py
+"""
+import glob
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from common.spec_normalize import NULL_VALUES, normalize_specs
+from sources.gsmarena import classify_device, classify_devices
+
+CSV_GLOB = os.path.join(os.path.dirname(__file__), '..', 'Universal ( Laptop & HP )', 'Gsm Arena',
+                        'gsmarena_*_20*.csv')
+TARGET_ROWS = 10000
+ROW_PATTERNS = {
+    'Weight_g': ('Body_Weight', re.compile(r'(\d[\d,.]*)\s*g\b')),
+    'Battery_mAh': ('Battery_Type', re.compile(r'(\d[\d,.]*)\s*mAh')),
+    'Display_Size_inches': ('Display_Size', re.compile(r'(\d[\d,.]*)\s*inches')),
+}
+
+
+def normalize_per_row(rows):
+    """Baseline: satu regex per kolom per baris, lalu klasifikasi per baris."""
+    out = []
+    for row in rows:
+        parsed = {}
+        for name, (source, pattern) in ROW_PATTERNS.items():
+            value = row.get(source)
+            match = pattern.search(value) if isinstance(value, str) else None
+            parsed[name] = float(match.group(1).replace(',', '')) if match else None
+        parsed['Class'] = classify_device({k: v for k, v in row.items() if isinstance(v, str)})
+        out.append(parsed)
+    return pd.DataFrame(out)
+
+
+def main():
+    paths = glob.glob(CSV_GLOB)
+    raw = pd.concat([pd.read_csv(path, sep=';', encoding='utf-8-sig', dtype=str, na_values=list(NULL_VALUES),
+                                 keep_default_na=False) for path in paths], ignore_index=True)
+    catalogue = pd.concat([raw] * (TARGET_ROWS // len(raw) + 1), ignore_index=True).head(TARGET_ROWS)
+    rows = catalogue.to_dict('records')
+    print(f"Katalog: {len(catalogue)} perangkat dari {len(paths)} file CSV\n")
+
+    start = time.perf_counter()
+    per_row = normalize_per_row(rows)
+    t_row = time.perf_counter() - start
+
+    start = time.perf_counter()
+    normalized = normalize_specs(catalogue)
+    classes = classify_devices(normalized)
+    t_vec = time.perf_counter() - start
+
+    for name in ROW_PATTERNS:
+        assert per_row[name].astype('float64').equals(normalized[name].astype('float64')), name
+    assert (per_row['Class'] == classes).all()
+
+    start = time.perf_counter()
+    mask = (classes == 'tablet') & (normalized.Battery_mAh >= 8000)
+    top = normalized.loc[mask, ['Device Name', 'Price_EUR', 'Battery_mAh']].nsmallest(10, 'Price_EUR')
+    t_query = time.perf_counter() - start
+
+    print(f"{'regex per baris':<22}{t_row * 1000:>10.1f} ms")
+    print(f"{'str.extract per kolom':<22}{t_vec * 1000:>10.1f} ms   ({t_row / t_vec:.1f}x)")
+    print(f"{'filter + ranking':<22}{t_query * 1000:>10.1f} ms   ({len(top)} tablet termurah >= 8000 mAh)")
+    print("\n✅ Hasil kedua cara identik.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1 @@
+"""Modul-modul bersama (HTTP, rate limit, fetch paralel) untuk semua scraper di folder ini."""
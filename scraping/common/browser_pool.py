@@ -0,0 +1,378 @@
+"""
+Setup Chrome bersama dan pool browser Selenium untuk scraper yang membutuhkan JavaScript.
+
+`create_driver()` menggantikan blok `webdriver.ChromeOptions()` yang sebelumnya disalin di
+setiap skrip. Dengan `block_resources=True` gambar, font, media dan skrip pelacak tidak diunduh
+(Chrome prefs + CDP `Network.setBlockedURLs`); `site` memilih allowlist per situs. Driver memakai page-load strategy 'eager', dan
+`open_page()` kembali begitu selector penanda siap ada di DOM, menggantikan `time.sleep` tetap.
+`BrowserPool` menyimpan hingga K browser headless yang sudah "dipanaskan"
+(halaman awal dibuka dan cookie/consent diterima sekali), meminjamkannya ke worker, lalu
+mendaur ulang browser setelah N halaman, saat crash, atau saat total memori Chrome melewati
+batas. Dengan `pool.map(...)` halaman detail produk bisa diproses paralel:
+
+    with BrowserPool(warmup=consent_warmup(start_url, "#onetrust-accept-btn-handler")) as pool:
+        with pool.lease() as driver:
+            links = ambil_tautan(driver)
+        for url, data in pool.map(scrape_detail, links):
+            ...
+"""
+import queue
+import threading
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from common.fetcher import fetch_concurrently
+
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    from selenium_stealth import stealth as apply_stealth
+
+    STEALTH_AVAILABLE = True
+except ImportError:
+    STEALTH_AVAILABLE = False
+
+# ==============================================================================
+# KONFIGURASI BROWSER
+# ==============================================================================
+BROWSER_CONFIG = {
+    'headless': True,
+    'window_size': "1920,1080",
+    'user_agent': "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/126.0.0.0 Safari/537.36",
+    'page_load_timeout': 60,
+    # 'eager': driver.get() kembali saat DOMContentLoaded, tanpa menunggu gambar/iframe/skrip async.
+    # Kesiapan halaman ditentukan oleh selector di open_page(), bukan event 'load'.
+    'page_load_strategy': 'eager',
+    'ready_timeout': 15,  # Batas tunggu selector penanda siap (detik)
+    'growth_timeout': 3  # Batas tunggu elemen baru setelah scroll / klik "muat lebih banyak" (detik)
+}
+
+# Pola URL yang diblokir per kategori (sintaks wildcard CDP `Network.setBlockedURLs`)
+BLOCKED_RESOURCES = {
+    'images': ('*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico'),
+    'fonts': ('*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'),
+    'media': ('*.mp4', '*.webm', '*.m3u8', '*.mp3', '*.ogg'),
+    'trackers': ('*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+                 '*googlesyndication.com*', '*facebook.net*', '*hotjar.com*', '*clarity.ms*', '*criteo.*',
+                 '*taboola.com*', '*outbrain.com*', '*scorecardresearch.com*', '*quantserve.com*',
+                 '*analytics.tiktok.com*', '*nr-data.net*', '*bazaarvoice.com*'),
+}
+
+# Allowlist per situs: kategori atau pola dari BLOCKED_RESOURCES yang tetap dimuat
+SITE_RESOURCE_ALLOWLISTS = {
+    'hp.com': ('*bazaarvoice.com*',),  # Rating & jumlah ulasan (.bv_*) dirender widget Bazaarvoice
+    'shopee.co.id': ('*.svg',),  # Bintang rating dan ikon label di kartu produk berupa SVG
+}
+
+BROWSER_POOL_CONFIG = {
+    'size': 3,  # Jumlah browser (K) yang boleh hidup bersamaan
+    'max_pages_per_browser': 50,  # Browser didaur ulang setelah sekian halaman (mencegah memory leak Chrome)
+    'max_memory_mb': 3072  # Batas total RSS semua proses Chrome di pool (butuh psutil)
+}
+
+
+# ==============================================================================
+# SETUP DRIVER
+# ==============================================================================
+
+def resource_allowlist(site):
+    """Allowlist untuk domain `site` (subdomain ikut, misal 'www.hp.com' -> 'hp.com')."""
+    if not site:
+        return ()
+    return next((allowed for domain, allowed in SITE_RESOURCE_ALLOWLISTS.items()
+                 if site == domain or site.endswith('.' + domain)), ())
+
+
+def blocked_url_patterns(site=None):
+    """Semua pola URL yang diblokir, dikurangi kategori/pola yang diizinkan untuk `site`."""
+    allowed = set(resource_allowlist(site))
+    return [pattern for category, patterns in BLOCKED_RESOURCES.items() if category not in allowed
+            for pattern in patterns if pattern not in allowed]
+
+
+def chrome_options(headless=None, user_agent=None, stealth=False, extra_arguments=(), block_resources=False,
+                   site=None, page_load_strategy=None):
+    """Opsi Chrome standar untuk semua scraper (headless, ukuran jendela, user-agent, filter resource)."""
+    headless = BROWSER_CONFIG['headless'] if headless is None else headless
+    options = webdriver.ChromeOptions()
+    options.page_load_strategy = page_load_strategy or BROWSER_CONFIG['page_load_strategy']
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument(f"--window-size={BROWSER_CONFIG['window_size']}")
+    options.add_argument(f"user-agent={user_agent or BROWSER_CONFIG['user_agent']}")
+    options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
+    if stealth:
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_experimental_option('useAutomationExtension', False)
+    if block_resources:
+        # Content setting Chrome: gambar (termasuk yang tanpa ekstensi file) dan notifikasi dimatikan
+        prefs = {'profile.default_content_setting_values.notifications': 2}
+        # Content setting ini mematikan SEMUA gambar, jadi dilewati bila situs mengizinkan pola gambar apa pun
+        # (misal '*.svg' di Shopee); sisanya tetap diblokir lewat pola URL CDP
+        allowed = set(resource_allowlist(site))
+        if 'images' not in allowed and not allowed.intersection(BLOCKED_RESOURCES['images']):
+            prefs['profile.managed_default_content_settings.images'] = 2
+        options.add_experimental_option('prefs', prefs)
+        options.add_argument("--autoplay-policy=user-gesture-required")
+    for argument in extra_arguments:
+        options.add_argument(argument)
+    return options
+
+
+def create_driver(headless=None, user_agent=None, stealth=False, extra_arguments=(), block_resources=False,
+                  site=None, page_load_strategy=None):
+    """
+    Membuat satu Chrome WebDriver. Dengan `stealth=True`, selenium-stealth dipakai jika
+    terpasang; jika tidak, cukup menyembunyikan `navigator.webdriver` di setiap dokumen baru.
+    Dengan `block_resources=True` hanya HTML, CSS, skrip dan XHR situs yang diunduh;
+    `site` (misal 'hp.com') memilih allowlist dari SITE_RESOURCE_ALLOWLISTS.
+    """
+    driver = webdriver.Chrome(options=chrome_options(headless, user_agent, stealth, extra_arguments,
+                                                     block_resources, site, page_load_strategy))
+    driver.set_page_load_timeout(BROWSER_CONFIG['page_load_timeout'])
+    if block_resources:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {'urls': blocked_url_patterns(site)})
+    if stealth:
+        if STEALTH_AVAILABLE:
+            apply_stealth(driver, languages=["en-US", "en"], vendor="Google Inc.", platform="Win32",
+                          webgl_vendor="Intel Inc.", renderer="Intel Iris OpenGL Engine", fix_hairline=True)
+        else:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                'source': "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"})
+    return driver
+
+
+# ==============================================================================
+# NAVIGASI & TUNGGU ADAPTIF
+# ==============================================================================
+
+def open_page(driver, url, ready_selector=None, by=By.CSS_SELECTOR, timeout=None):
+    """
+    Membuka `url` dan kembali begitu `ready_selector` ada di DOM. Mengembalikan elemen penanda
+    tersebut; TimeoutException jika tidak muncul dalam `timeout` detik.
+    """
+    driver.get(url)
+    if ready_selector is None:
+        return None
+    return WebDriverWait(driver, timeout or BROWSER_CONFIG['ready_timeout']).until(
+        EC.presence_of_element_located((by, ready_selector)))
+
+
+def wait_for_count(driver, selector, minimum, by=By.CSS_SELECTOR, timeout=None):
+    """
+    Menunggu hingga jumlah elemen `selector` minimal `minimum` (misal produk baru setelah scroll
+    atau klik "muat lebih banyak"). Mengembalikan jumlah terakhir, juga saat waktu tunggu habis.
+    """
+    def enough(d):
+        count = len(d.find_elements(by, selector))
+        return count if count >= minimum else False
+
+    try:
+        return WebDriverWait(driver, timeout or BROWSER_CONFIG['growth_timeout'], poll_frequency=0.2).until(enough)
+    except TimeoutException:
+        return len(driver.find_elements(by, selector))
+
+
+def scroll_until_loaded(driver, selector, by=By.CSS_SELECTOR, timeout=None, max_rounds=50):
+    """
+    Infinite scroll: menggulir ke bawah selama jumlah elemen `selector` masih bertambah.
+    Setiap putaran hanya menunggu selama elemen baru belum muncul. Mengembalikan jumlah akhir.
+    """
+    count = len(driver.find_elements(by, selector))
+    for _ in range(max_rounds):
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        new_count = wait_for_count(driver, selector, count + 1, by, timeout)
+        if new_count <= count:
+            break
+        count = new_count
+    return count
+
+
+def wait_for_navigation(driver, old_element, timeout=None):
+    """Menunggu halaman lama dibuang setelah klik link/tombol (elemen lama menjadi stale)."""
+    WebDriverWait(driver, timeout or BROWSER_CONFIG['ready_timeout']).until(EC.staleness_of(old_element))
+
+
+def consent_warmup(url, button_selector, by=By.CSS_SELECTOR, timeout=5):
+    """
+    Membuat fungsi warmup untuk BrowserPool: membuka `url` lalu mengklik tombol
+    cookie/consent jika muncul. Cookie yang diterima tetap tersimpan di sesi browser.
+    """
+    def warmup(driver):
+        driver.get(url)
+        try:
+            WebDriverWait(driver, timeout).until(EC.element_to_be_clickable((by, button_selector))).click()
+            print("    🍪 Consent diterima untuk browser baru.")
+        except TimeoutException:
+            pass
+    return warmup
+
+
+class BrowserCrashed(WebDriverException):
+    """Browser mati di tengah pekerjaan; instance-nya sudah dibuang dari pool."""
+
+
+def is_alive(driver):
+    """Mengecek apakah sesi browser masih merespon (tidak crash)."""
+    try:
+        driver.execute_script("return 1")
+        return True
+    except WebDriverException:
+        return False
+
+
+def _driver_memory_mb(driver):
+    """Total RSS chromedriver beserta seluruh proses Chrome turunannya (MB)."""
+    try:
+        process = psutil.Process(driver.service.process.pid)
+        processes = [process] + process.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+    except (AttributeError, psutil.Error):
+        return 0.0
+
+
+# ==============================================================================
+# POOL BROWSER
+# ==============================================================================
+
+class BrowserPool:
+    """
+    Pool berisi maksimal `size` browser. Browser dibuat saat pertama kali dibutuhkan,
+    dipanaskan dengan `warmup(driver)`, lalu dipinjamkan lewat `lease()`.
+    """
+
+    def __init__(self, size=None, warmup=None, max_pages=None, max_memory_mb=None, **driver_options):
+        self.size = size or BROWSER_POOL_CONFIG['size']
+        self.warmup = warmup
+        self.max_pages = max_pages or BROWSER_POOL_CONFIG['max_pages_per_browser']
+        self.max_memory_mb = max_memory_mb or BROWSER_POOL_CONFIG['max_memory_mb']
+        self.driver_options = driver_options
+        self.idle = queue.LifoQueue()  # Browser yang paling baru dipakai didahulukan (cache masih hangat)
+        self.slots = threading.BoundedSemaphore(self.size)
+        self.lock = threading.Lock()
+        self.pages = {}  # driver -> jumlah halaman yang sudah dilayani
+        self.closed = False
+        self.stats = {'created': 0, 'recycled': 0, 'crashed': 0}
+        if not PSUTIL_AVAILABLE:
+            print("    ℹ️ psutil tidak terpasang; batas memori browser pool tidak diterapkan.")
+
+    def _start_browser(self):
+        driver = create_driver(**self.driver_options)
+        try:
+            if self.warmup:
+                self.warmup(driver)
+        except Exception:
+            driver.quit()
+            raise
+        with self.lock:
+            self.pages[driver] = 0
+            self.stats['created'] += 1
+        return driver
+
+    def _retire(self, driver, reason=None):
+        with self.lock:
+            self.pages.pop(driver, None)
+            if reason:
+                self.stats[reason] += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _over_memory_cap(self):
+        if not PSUTIL_AVAILABLE:
+            return False
+        with self.lock:
+            drivers = list(self.pages)
+        return sum(_driver_memory_mb(driver) for driver in drivers) > self.max_memory_mb
+
+    @contextmanager
+    def lease(self):
+        """
+        Meminjam satu browser (menunggu jika semua sedang dipakai). Setelah selesai browser
+        dikembalikan ke pool, atau didaur ulang jika crash, sudah melayani `max_pages`
+        halaman, atau total memori pool melewati batas.
+        """
+        self.slots.acquire()
+        try:
+            try:
+                driver = self.idle.get_nowait()
+            except queue.Empty:
+                driver = self._start_browser()
+            try:
+                yield driver
+            except Exception as e:
+                if not is_alive(driver):
+                    print("    💥 Browser crash, diganti dengan instance baru.")
+                    self._retire(driver, 'crashed')
+                    raise BrowserCrashed(str(e)) from e
+                self._release(driver)
+                raise
+            self._release(driver)
+        finally:
+            self.slots.release()
+
+    def _release(self, driver):
+        with self.lock:
+            self.pages[driver] += 1
+            served = self.pages[driver]
+        if self.closed:
+            self._retire(driver)
+        elif served >= self.max_pages:
+            self._retire(driver, 'recycled')
+        elif self._over_memory_cap():
+            print(f"    ♻️ Memori Chrome melewati {self.max_memory_mb} MB, browser didaur ulang.")
+            self._retire(driver, 'recycled')
+        else:
+            self.idle.put(driver)
+
+    def run(self, fn, url):
+        """Menjalankan `fn(driver, url)` dengan browser pinjaman; diulang sekali di browser baru jika crash."""
+        try:
+            with self.lease() as driver:
+                return fn(driver, url)
+        except BrowserCrashed:
+            with self.lease() as driver:
+                return fn(driver, url)
+
+    def map(self, fn, urls, rate_limiter=None, max_retries=1, retry_delay_seconds=5):
+        """
+        Menjalankan `fn(driver, url)` untuk banyak URL secara paralel (satu worker per browser).
+        Menghasilkan (yield) pasangan (url, hasil) sesuai urutan selesainya halaman.
+        """
+        return fetch_concurrently(urls, lambda url: self.run(fn, url), max_workers=self.size,
+                                  rate_limiter=rate_limiter, max_retries=max_retries,
+                                  retry_delay_seconds=retry_delay_seconds)
+
+    def close(self):
+        """Menutup semua browser yang sedang menganggur; browser yang masih dipinjam ditutup saat kembali."""
+        self.closed = True
+        while True:
+            try:
+                driver = self.idle.get_nowait()
+            except queue.Empty:
+                break
+            self._retire(driver)
+        print(f"    🧹 Browser pool ditutup ({self.stats['created']} dibuat, "
+              f"{self.stats['recycled']} didaur ulang, {self.stats['crashed']} crash).")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
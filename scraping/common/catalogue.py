@@ -0,0 +1,249 @@
+"""
+Katalog perangkat terpadu (SQLite) untuk hasil semua scraper.
+
+Setiap sumber punya tabelnya sendiri (`src_gsmarena`, `src_lenovo`, ...) dengan kolom inti
+yang sama: key (URL/SKU), brand, nama, harga IDR/EUR, tanggal rilis, plus seluruh
+spesifikasi mentah sebagai JSON. Baris di-upsert berdasarkan key, sehingga run ulang cukup
+memperbarui baris yang sudah ada. View `devices` menggabungkan semua tabel sumber, dan
+tabel `device_entities` (diisi `common.entity_resolution`) memetakan setiap baris ke ID
+perangkat kanonik sehingga harga dan spesifikasi dari sumber berbeda bisa di-join.
+
+    python -m common.catalogue import gsmarena "Universal ( Laptop & HP )/Gsm Arena/gsmarena_*.csv"
+    python -m common.catalogue query "SELECT source, name, price_idr FROM devices WHERE price_idr < 10000000"
+"""
+import argparse
+import glob
+import json
+import os
+import sqlite3
+import sys
+import time
+
+import pandas as pd
+
+from common.spec_normalize import normalize_specs, parse_release_dates
+
+# ==============================================================================
+# KONFIGURASI KATALOG
+# ==============================================================================
+CATALOGUE_CONFIG = {
+    # Satu database untuk semua skrip, di dalam folder 'scraping'
+    'db_path': os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.catalogue',
+                            'devices.sqlite'),
+    'enabled': True,  # Setiap scraper ikut menulis hasilnya ke katalog
+    'batch_rows': 1000  # Jumlah baris per executemany
+}
+
+# Kolom inti per sumber: nama kolom CSV kandidat (dipakai yang pertama ada)
+CATALOGUE_SOURCES = {
+    'gsmarena': {'url': ('Product URL',), 'name': ('Device Name', 'Phone Name'), 'brand': ('Brand',),
+                 'release': ('Launch_Announced',)},
+    'gsmarena_id': {'url': ('Product URL',), 'name': ('Phone Name',)},
+    'versus': {'url': ('Product URL', 'url'), 'name': ('Device Name', 'fullname'), 'brand': ('brand',),
+               'release': ('releaseDate',)},
+    'notebookcheck': {'url': ('URL',), 'name': ('Title',), 'brand': ('Brand',)},
+    'lenovo': {'url': ('Product_URL',), 'name': ('Product_Name',), 'default_brand': 'Lenovo'},
+    'hp': {'url': ('URL', 'Product URL'), 'name': ('Nama Produk', 'Product Name'), 'sku': ('SKU',),
+           'default_brand': 'HP'},
+    'shopee': {'url': ('Product URL',), 'name': ('Product Name',)},
+    'pricebook': {'url': ('Link Produk',), 'name': ('Nama Produk',)},
+    'brand_sites': {'url': ('URL Produk',), 'name': ('Nama Produk', 'Product Name'), 'brand': ('Brand',)},
+}
+
+CORE_COLUMNS = ('key', 'url', 'sku', 'brand', 'name', 'price_idr', 'price_eur', 'release_date', 'specs')
+INDEXED_COLUMNS = ('brand', 'price_idr', 'price_eur', 'release_date')
+
+
+# ==============================================================================
+# PENYIMPANAN KATALOG
+# ==============================================================================
+
+class CatalogueStore:
+    """Database SQLite katalog; satu tabel per sumber dengan upsert berdasarkan key."""
+
+    def __init__(self, db_path=None):
+        db_path = db_path or CATALOGUE_CONFIG['db_path']
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db = sqlite3.connect(db_path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        for source in CATALOGUE_SOURCES:
+            self._create_table(source)
+        self._create_entity_table()
+        self._create_view()
+        self.db.commit()
+
+    def _create_table(self, source):
+        table = f"src_{source}"
+        self.db.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                sku TEXT,
+                brand TEXT,
+                name TEXT,
+                price_idr INTEGER,
+                price_eur REAL,
+                release_date TEXT,
+                specs TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )""")
+        for column in INDEXED_COLUMNS:
+            self.db.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} ({column})")
+
+    def _create_entity_table(self):
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS device_entities (
+                source TEXT NOT NULL,
+                key TEXT NOT NULL,
+                canonical_id TEXT NOT NULL,
+                score REAL NOT NULL,
+                PRIMARY KEY (source, key)
+            )""")
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_device_entities_canonical ON device_entities (canonical_id)")
+
+    def _create_view(self):
+        self.db.execute("DROP VIEW IF EXISTS resolved_devices")
+        self.db.execute("DROP VIEW IF EXISTS devices")
+        self.db.execute("CREATE VIEW devices AS " + " UNION ALL ".join(
+            f"SELECT '{source}' AS source, {', '.join(CORE_COLUMNS)}, updated_at FROM src_{source}"
+            for source in CATALOGUE_SOURCES))
+        self.db.execute("""
+            CREATE VIEW resolved_devices AS
+            SELECT e.canonical_id, e.score, d.*
+            FROM device_entities e JOIN devices d ON d.source = e.source AND d.key = e.key""")
+
+    def upsert_rows(self, source, rows):
+        """Bulk upsert baris (dict) hasil scraping ke tabel sumber, per batch. Mengembalikan jumlah baris."""
+        batch, count = [], 0
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= CATALOGUE_CONFIG['batch_rows']:
+                count += self.upsert_dataframe(source, pd.DataFrame(batch))
+                batch = []
+        if batch:
+            count += self.upsert_dataframe(source, pd.DataFrame(batch))
+        return count
+
+    def upsert_dataframe(self, source, df):
+        """Bulk upsert satu DataFrame (misal CSV yang baru ditulis) dalam satu transaksi."""
+        records = catalogue_records(source, df)
+        now = time.time()
+        columns = ', '.join(CORE_COLUMNS)
+        placeholders = ', '.join('?' for _ in CORE_COLUMNS)
+        updates = ', '.join(f"{col} = excluded.{col}" for col in CORE_COLUMNS if col != 'key')
+        with self.db:
+            self.db.executemany(
+                f"INSERT INTO src_{source} ({columns}, first_seen, updated_at) VALUES ({placeholders}, ?, ?) "
+                f"ON CONFLICT(key) DO UPDATE SET {updates}, updated_at = excluded.updated_at",
+                [record + (now, now) for record in records])
+        return len(records)
+
+    def query(self, sql, params=()):
+        return pd.read_sql_query(sql, self.db, params=params)
+
+    def close(self):
+        self.db.close()
+
+
+def _first_column(df, candidates):
+    return next((column for column in candidates if column in df.columns), None)
+
+
+def _column_values(df, candidates, default=None):
+    column = _first_column(df, candidates)
+    if column is None:
+        return [default] * len(df)
+    return [value if isinstance(value, str) and value not in ('', 'N/A') else default
+            for value in df[column].astype('object')]
+
+
+def _sql_value(value, cast):
+    return None if pd.isna(value) else cast(value)
+
+
+def catalogue_records(source, df):
+    """Mengubah DataFrame hasil scraping menjadi tuple kolom inti katalog (urutan `CORE_COLUMNS`)."""
+    if source not in CATALOGUE_SOURCES:
+        raise ValueError(f"Sumber katalog tidak dikenal: '{source}'. Pilihan: {', '.join(CATALOGUE_SOURCES)}")
+    mapping = CATALOGUE_SOURCES[source]
+    df = df.drop(columns=['No'], errors='ignore').reset_index(drop=True)
+    normalized = normalize_specs(df)
+
+    url = _column_values(df, mapping['url'])
+    sku = _column_values(df, mapping.get('sku', ()))
+    name = _column_values(df, mapping['name'])
+    brand = _column_values(df, mapping.get('brand', ()), mapping.get('default_brand'))
+    release_column = _first_column(df, mapping.get('release', ()))
+    release = parse_release_dates(df[release_column]) if release_column else pd.Series(pd.NA, index=df.index)
+    price_idr = normalized['Price_IDR'] if 'Price_IDR' in normalized.columns else pd.Series(pd.NA, index=df.index)
+    price_eur = normalized['Price_EUR'] if 'Price_EUR' in normalized.columns else pd.Series(pd.NA, index=df.index)
+
+    specs = [json.dumps({k: v for k, v in row.items() if isinstance(v, str) and v not in ('', 'N/A')},
+                        ensure_ascii=False)
+             for row in df.astype('object').to_dict('records')]
+    records = []
+    for i in range(len(df)):
+        if name[i] is None and url[i] is None and sku[i] is None:
+            continue
+        # Key: URL, lalu SKU, lalu nama (sumber tanpa URL seperti halaman daftar Xiaomi)
+        key = url[i] or sku[i] or f"name:{name[i]}"
+        records.append((key, url[i], sku[i], brand[i], name[i], _sql_value(price_idr[i], int),
+                        _sql_value(price_eur[i], float), _sql_value(release[i], str), specs[i]))
+    return records
+
+
+def upsert_into_catalogue(source, rows=None, df=None):
+    """
+    Jalur bulk-insert yang dipanggil scraper setelah output-nya ditulis. Kegagalan katalog
+    hanya dicetak sebagai peringatan agar tidak menggagalkan hasil scraping.
+    """
+    if not CATALOGUE_CONFIG['enabled']:
+        return 0
+    try:
+        store = CatalogueStore()
+        try:
+            count = store.upsert_dataframe(source, df) if df is not None else store.upsert_rows(source, rows)
+        finally:
+            store.close()
+    except Exception as e:
+        # Apa pun penyebabnya (SQLite terkunci, disk penuh, baris tak terduga), CSV sudah tersimpan
+        print(f"    ⚠️ Gagal menulis ke katalog '{source}': {type(e).__name__}: {e}")
+        return 0
+    print(f"    🗃️  {count} baris di-upsert ke katalog (src_{source}).")
+    return count
+
+
+# ==============================================================================
+# CLI
+# ==============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Katalog perangkat terpadu (SQLite).")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    import_parser = subparsers.add_parser('import', help="Impor CSV hasil scraping yang sudah ada.")
+    import_parser.add_argument('source', choices=sorted(CATALOGUE_SOURCES))
+    import_parser.add_argument('patterns', nargs='+', help="Path atau pola glob file CSV.")
+    query_parser = subparsers.add_parser('query', help="Menjalankan query SQL ke katalog.")
+    query_parser.add_argument('sql')
+    args = parser.parse_args(argv)
+
+    store = CatalogueStore()
+    if args.command == 'import':
+        paths = sorted({path for pattern in args.patterns for path in glob.glob(pattern)})
+        if not paths:
+            print("❌ Tidak ada file CSV yang cocok.")
+            sys.exit(1)
+        for path in paths:
+            df = pd.read_csv(path, sep=None, engine='python', encoding='utf-8-sig', dtype=str, keep_default_na=False)
+            print(f"✅ {os.path.basename(path)}: {store.upsert_dataframe(args.source, df)} baris")
+    else:
+        start = time.perf_counter()
+        result = store.query(args.sql)
+        print(result.to_string(index=False))
+        print(f"\n{len(result)} baris ({(time.perf_counter() - start) * 1000:.1f} ms)")
+    store.close()
+
+
+if __name__ == '__main__':
+    main()
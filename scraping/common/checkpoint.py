@@ -0,0 +1,90 @@
+import json
+import os
+import sqlite3
+import time
+
+# ==============================================================================
+# KONFIGURASI CHECKPOINT
+# ==============================================================================
+CHECKPOINT_CONFIG = {
+    # Satu folder checkpoint untuk semua skrip, di dalam folder 'scraping'
+    'checkpoint_dir': os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.checkpoints')
+}
+
+
+# ==============================================================================
+# CHECKPOINT CRAWL YANG BISA DILANJUTKAN
+# ==============================================================================
+
+class CrawlCheckpoint:
+    """
+    Jurnal SQLite untuk crawl panjang. Setiap URL yang berhasil di-parsing disimpan
+    bersama baris datanya begitu selesai, dan setiap scope (misal brand) ditandai selesai
+    setelah file output-nya ditulis. Run yang terhenti (crash / Ctrl-C) cukup dijalankan
+    ulang: scope yang selesai dilewati dan URL yang sudah ada tidak diambil lagi.
+    """
+
+    def __init__(self, name, checkpoint_dir=None):
+        checkpoint_dir = checkpoint_dir or CHECKPOINT_CONFIG['checkpoint_dir']
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        self.path = os.path.join(checkpoint_dir, f"{name}.sqlite")
+        self.db = sqlite3.connect(self.path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS urls (
+                scope TEXT NOT NULL,
+                url TEXT NOT NULL,
+                row_json TEXT NOT NULL,
+                done_at REAL NOT NULL,
+                PRIMARY KEY (scope, url)
+            )""")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS scopes (
+                scope TEXT PRIMARY KEY,
+                output_file TEXT,
+                done_at REAL NOT NULL
+            )""")
+        self.db.commit()
+
+    def is_scope_done(self, scope):
+        return self.db.execute("SELECT 1 FROM scopes WHERE scope = ?", (scope,)).fetchone() is not None
+
+    def scope_output(self, scope):
+        row = self.db.execute("SELECT output_file FROM scopes WHERE scope = ?", (scope,)).fetchone()
+        return row[0] if row else None
+
+    def mark_scope_done(self, scope, output_file=None):
+        """Menandai scope selesai; baris per-URL-nya tidak dibutuhkan lagi sehingga dihapus."""
+        self.db.execute("INSERT OR REPLACE INTO scopes VALUES (?, ?, ?)", (scope, output_file, time.time()))
+        self.db.execute("DELETE FROM urls WHERE scope = ?", (scope,))
+        self.db.commit()
+
+    def load_rows(self, scope):
+        """Mengembalikan {url: baris_data} yang sudah selesai untuk scope ini."""
+        return {url: json.loads(row_json) for url, row_json in
+                self.db.execute("SELECT url, row_json FROM urls WHERE scope = ?", (scope,))}
+
+    def record(self, scope, url, row):
+        self.db.execute("INSERT OR REPLACE INTO urls VALUES (?, ?, ?, ?)",
+                        (scope, url, json.dumps(row, ensure_ascii=False), time.time()))
+        self.db.commit()
+
+    def recording(self, scope, results):
+        """
+        Membungkus generator (url, baris) dari `fetch_concurrently`: setiap baris yang
+        berhasil dicatat ke jurnal sebelum diteruskan ke pemanggil. URL yang gagal tidak
+        dicatat sehingga akan dicoba lagi pada run berikutnya.
+        """
+        for url, row in results:
+            if row:
+                self.record(scope, url, row)
+            yield url, row
+
+    def clear(self):
+        """Menghapus seluruh isi checkpoint (dipanggil setelah seluruh run selesai)."""
+        self.db.execute("DELETE FROM urls")
+        self.db.execute("DELETE FROM scopes")
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,188 @@
+import glob
+import os
+import sqlite3
+import time
+import zlib
+from datetime import datetime
+
+import pandas as pd
+
+# ==============================================================================
+# KONFIGURASI MODE DELTA
+# ==============================================================================
+DELTA_CONFIG = {
+    # Satu folder state untuk semua skrip, di dalam folder 'scraping'
+    'state_dir': os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.delta'),
+    'refresh_after_days': 7  # URL lama diambil ulang paling lambat setelah sekian hari
+}
+
+EMPTY_VALUES = ('', 'N/A')
+
+
+# ==============================================================================
+# FUNGSI-FUNGSI SNAPSHOT
+# ==============================================================================
+
+def find_latest_snapshot(output_prefix):
+    """Mencari file CSV terbaru `{output_prefix}_{timestamp}.csv` (timestamp diawali angka)."""
+    paths = glob.glob(f"{glob.escape(output_prefix)}_[0-9]*.csv")
+    return max(paths) if paths else None
+
+
+def load_snapshot(path, url_column):
+    """Membaca snapshot CSV menjadi {url: baris}; nilai 'N/A' dibuang agar sama dengan hasil parsing."""
+    df = pd.read_csv(path, sep=';', encoding='utf-8-sig', dtype=str, keep_default_na=False)
+    return {row[url_column]: _clean(row) for row in df.drop(columns=['No'], errors='ignore').to_dict('records')}
+
+
+def _clean(row):
+    # CSV yang ditulis di Windows menyimpan baris baru sebagai CRLF; hasil parsing memakai LF
+    return {k: v.replace('\r\n', '\n') if isinstance(v, str) else v
+            for k, v in row.items() if v not in EMPTY_VALUES}
+
+
+def _refresh_jitter(url):
+    """Faktor 0.5-1.0 yang tetap per URL, agar refresh tidak menumpuk di malam yang sama."""
+    return 0.5 + (zlib.crc32(url.encode('utf-8')) % 1000) / 2000
+
+
+# ==============================================================================
+# RENCANA DELTA PER SCOPE
+# ==============================================================================
+
+class DeltaPlan:
+    """Hasil perbandingan tautan listing terbaru dengan snapshot sebelumnya untuk satu scope."""
+
+    def __init__(self, scope, output_prefix, previous_rows, to_fetch, carried_rows, removed_urls):
+        self.scope = scope
+        self.output_prefix = output_prefix
+        self.previous_rows = previous_rows
+        self.to_fetch = to_fetch
+        self.carried_rows = carried_rows
+        self.removed_urls = removed_urls
+        self.fetched = {}  # {url: waktu fetch} yang belum disimpan; ditulis oleh `mark_scope_done`
+
+
+class DeltaTracker:
+    """
+    Mode delta/inkremental: tautan listing yang baru ditemukan dibandingkan dengan snapshot
+    CSV terakhir. Hanya URL baru atau yang sudah waktunya di-refresh yang diambil ulang;
+    baris lain dibawa dari snapshot sehingga file output tetap berisi dataset lengkap.
+    Waktu fetch terakhir per URL disimpan di SQLite kecil (termasuk URL yang ditolak
+    validasi, agar tidak diambil ulang setiap malam). Waktu itu baru disimpan lewat
+    `mark_scope_done` setelah file output scope ditulis: jika run terhenti di tengah,
+    URL yang sudah diambil tetap dianggap perlu diambil pada run berikutnya, sehingga
+    barisnya tidak hilang dari output maupun changelog.
+    """
+
+    def __init__(self, name, url_column, name_column, enabled=True, refresh_after_days=None, state_dir=None):
+        self.url_column = url_column
+        self.name_column = name_column
+        self.enabled = enabled
+        days = DELTA_CONFIG['refresh_after_days'] if refresh_after_days is None else refresh_after_days
+        self.refresh_after_seconds = days * 24 * 3600
+        state_dir = state_dir or DELTA_CONFIG['state_dir']
+        os.makedirs(state_dir, exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(state_dir, f"{name}.sqlite"))
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS fetched (
+                scope TEXT NOT NULL,
+                url TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (scope, url)
+            )""")
+        self.db.commit()
+
+    def plan(self, scope, output_prefix, current_urls):
+        """Menentukan URL yang perlu diambil dan baris yang cukup dibawa dari snapshot sebelumnya."""
+        previous_path = find_latest_snapshot(output_prefix) if self.enabled else None
+        if not previous_path:
+            if self.enabled:
+                print("    ℹ️ [DELTA] Belum ada snapshot sebelumnya, semua tautan akan diambil.")
+            return DeltaPlan(scope, output_prefix, {}, list(current_urls), {}, [])
+
+        previous_rows = load_snapshot(previous_path, self.url_column)
+        snapshot_time = os.path.getmtime(previous_path)
+        last_fetched = dict(self.db.execute("SELECT url, fetched_at FROM fetched WHERE scope = ?", (scope,)))
+        now = time.time()
+
+        to_fetch, carried_rows = [], {}
+        new_count = 0
+        for url in current_urls:
+            fetched_at = last_fetched.get(url, snapshot_time if url in previous_rows else None)
+            if fetched_at is None:
+                new_count += 1
+                to_fetch.append(url)
+            elif now - fetched_at > self.refresh_after_seconds * _refresh_jitter(url):
+                to_fetch.append(url)
+            elif url in previous_rows:
+                carried_rows[url] = dict(previous_rows[url])
+        current = set(current_urls)
+        removed_urls = [url for url in previous_rows if url not in current]
+
+        print(f"    🔍 [DELTA] Dibandingkan dengan snapshot: {os.path.basename(previous_path)}")
+        print(f"        - Baru: {new_count} | Refresh: {len(to_fetch) - new_count} | "
+              f"Tidak berubah: {len(carried_rows)} | Hilang dari listing: {len(removed_urls)}")
+        return DeltaPlan(scope, output_prefix, previous_rows, to_fetch, carried_rows, removed_urls)
+
+    def track(self, plan, url, row):
+        """
+        Mencatat hasil fetch satu URL. Jika fetch gagal untuk URL yang ada di snapshot
+        sebelumnya, baris lama dikembalikan agar perangkat itu tidak dianggap hilang.
+        """
+        if row:
+            plan.fetched[url] = time.time()
+            return row
+        if url in plan.previous_rows:
+            print("        ♻️  [DELTA] Fetch gagal, memakai data dari snapshot sebelumnya.")
+            return dict(plan.previous_rows[url])
+        return row
+
+    def mark_scope_done(self, plan):
+        """Menyimpan waktu fetch yang dicatat `track`; dipanggil setelah file output scope selesai ditulis."""
+        self.db.executemany("INSERT OR REPLACE INTO fetched VALUES (?, ?, ?)",
+                            [(plan.scope, url, fetched_at) for url, fetched_at in plan.fetched.items()])
+        self.db.commit()
+        plan.fetched.clear()
+
+    def recording(self, plan, results):
+        """Membungkus generator (url, baris) dari `fetch_concurrently` dengan `track`."""
+        for url, row in results:
+            yield url, self.track(plan, url, row)
+
+    def write_changelog(self, plan, current_rows):
+        """
+        Membandingkan baris akhir dengan snapshot sebelumnya dan menyimpan daftar perangkat
+        yang ditambah, dihapus dan berubah ke `{output_prefix}_changelog_{timestamp}.csv`.
+        """
+        if not plan.previous_rows:
+            return None
+        # `current_rows` boleh berupa generator (misal dari writer streaming); cukup URL yang diingat
+        current = set()
+        changes = []
+        for row in current_rows:
+            row = _clean(row)
+            url = row[self.url_column]
+            current.add(url)
+            old = plan.previous_rows.get(url)
+            if old is None:
+                changes.append(('ADDED', url, row.get(self.name_column, 'N/A'), ''))
+            elif old != row:
+                diff = [f"{key}: {old.get(key, 'N/A')} -> {row.get(key, 'N/A')}"
+                        for key in sorted(set(old) | set(row)) if old.get(key) != row.get(key)]
+                changes.append(('MODIFIED', url, row.get(self.name_column, 'N/A'), ' | '.join(diff)))
+        for url, old in plan.previous_rows.items():
+            if url not in current:
+                changes.append(('REMOVED', url, old.get(self.name_column, 'N/A'), ''))
+
+        counts = {kind: sum(1 for c in changes if c[0] == kind) for kind in ('ADDED', 'REMOVED', 'MODIFIED')}
+        print(f"    📝 [DELTA] Ditambah: {counts['ADDED']} | Dihapus: {counts['REMOVED']} | Berubah: {counts['MODIFIED']}")
+        if not changes:
+            return None
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        changelog_file = f"{plan.output_prefix}_changelog_{timestamp}.csv"
+        df = pd.DataFrame(changes, columns=['Change', self.url_column, self.name_column, 'Changed_Columns'])
+        df.to_csv(changelog_file, index=False, encoding="utf-8-sig", sep=";")
+        print(f"    ✅ Changelog disimpan ke: '{changelog_file}'")
+        return changelog_file
@@ -0,0 +1,74 @@
+"""
+Ekstraksi DOM sekaligus: satu `execute_script` per halaman, bukan satu WebDriver round-trip
+per field dan per baris spesifikasi.
+
+Spesifikasi dibangun dari konfigurasi selector scraper:
+
+    fields = {
+        'name': "h1.page-title",                                        # innerText elemen pertama
+        'price': {'css': "span.price-wrapper", 'attr': 'data-price-amount'},  # atribut
+        'paragraphs': {'css': ".description p", 'all': True},           # list semua elemen
+    }
+    tables = {
+        'specs': {'rows': "#specifications .spec-row", 'key': ".spec-title", 'value': ".spec-value"},
+    }
+    fields, tables = extract_record(driver, fields, tables)
+
+`attr` boleh 'text' (default, innerText seperti `.text` Selenium), 'textContent', 'innerHTML'
+atau nama atribut HTML. Tabel menghasilkan list [grup, judul, nilai]; grup diambil dari
+`group_title` di dalam setiap elemen `groups` (misal `<th>` di tabel GSMArena), atau dari baris
+yang cocok dengan `heading` (judul kategori yang sejajar dengan baris spesifikasi, misal Versus).
+Field yang tidak ditemukan bernilai None.
+"""
+
+EXTRACT_SCRIPT = """
+const spec = arguments[0];
+const read = (el, attr) => {
+    if (!el) return null;
+    if (!attr || attr === 'text') return el.innerText.trim();
+    if (attr === 'textContent') return el.textContent.trim();
+    if (attr === 'innerHTML') return el.innerHTML;
+    return el.getAttribute(attr);
+};
+const result = {fields: {}, tables: {}};
+for (const [name, field] of Object.entries(spec.fields)) {
+    result.fields[name] = field.all
+        ? Array.from(document.querySelectorAll(field.css), el => read(el, field.attr))
+        : read(document.querySelector(field.css), field.attr);
+}
+for (const [name, table] of Object.entries(spec.tables)) {
+    const rows = [];
+    const groups = table.groups ? Array.from(document.querySelectorAll(table.groups)) : [document];
+    for (const group of groups) {
+        let title = table.group_title ? read(group.querySelector(table.group_title)) : null;
+        for (const row of group.querySelectorAll(table.rows)) {
+            if (table.heading && row.matches(table.heading)) {
+                title = read(row);
+                continue;
+            }
+            const key = read(row.querySelector(table.key));
+            const value = read(row.querySelector(table.value), table.value_attr);
+            if (key !== null && value !== null) rows.push([title, key, value]);
+        }
+    }
+    result.tables[name] = rows;
+}
+return result;
+"""
+
+
+def extraction_spec(fields=None, tables=None):
+    """Menormalkan konfigurasi: selector string menjadi {'css': selector}."""
+    return {
+        'fields': {name: {'css': field} if isinstance(field, str) else field for name, field in (fields or {}).items()},
+        'tables': dict(tables or {}),
+    }
+
+
+def extract_record(driver, fields=None, tables=None):
+    """
+    Mengambil semua `fields` dan `tables` dari halaman yang sedang terbuka dalam satu
+    round-trip. Mengembalikan (dict field, dict tabel -> list [grup, judul, nilai]).
+    """
+    result = driver.execute_script(EXTRACT_SCRIPT, extraction_spec(fields, tables))
+    return result['fields'], result['tables']
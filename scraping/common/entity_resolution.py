@@ -0,0 +1,251 @@
+"""
+Resolusi entitas perangkat lintas sumber di katalog (`common.catalogue`).
+
+Perangkat yang sama muncul dengan nama berbeda di tiap sumber ("Samsung Galaxy A56" di
+GSMArena, "Samsung Galaxy A56 5G 8/256GB Garansi Resmi" di Shopee, ...). Nama dipecah menjadi
+token model, lalu kandidat pasangan hanya dicari di dalam blok (brand, token) yang sama
+sehingga tidak perlu membandingkan semua pasangan (O(n²)). Pasangan diberi skor Jaccard
+berbobot IDF: token yang jarang (misal 'a56') bernilai tinggi, token umum ('galaxy') rendah,
+dan token yang tidak pernah muncul di nama sumber spesifikasi ('garansi', 'resmi') diabaikan.
+
+Sumber spesifikasi (`reference_sources`) menjadi perangkat kanonik; baris dari sumber lain
+ditautkan ke kandidat kanonik dengan skor tertinggi. ID kanonik diturunkan dari nama yang
+sudah dinormalisasi (misal 'samsung-galaxy-a56') sehingga tetap stabil antar run, lalu
+disimpan di tabel `device_entities` untuk di-join lewat view `resolved_devices`.
+
+    python -m common.entity_resolution
+"""
+import argparse
+import math
+import re
+import time
+from collections import Counter, defaultdict
+
+from common.catalogue import CatalogueStore
+
+# ==============================================================================
+# KONFIGURASI RESOLUSI ENTITAS
+# ==============================================================================
+ENTITY_CONFIG = {
+    'threshold': 0.8,  # Skor minimum agar dua nama dianggap perangkat yang sama
+    'max_block_size': 200,  # Token yang terlalu umum (blok lebih besar) tidak dipakai sebagai blok
+    # Urutan prioritas sumber spesifikasi; yang lebih awal menjadi perangkat kanonik
+    'reference_sources': ('gsmarena', 'gsmarena_id', 'versus', 'notebookcheck')
+}
+
+# Nama seri/sub-brand yang sering dipakai toko tanpa menyebut brand induknya
+BRAND_ALIASES = {
+    'redmi': 'xiaomi', 'poco': 'xiaomi', 'mi': 'xiaomi',
+    'iphone': 'apple', 'ipad': 'apple', 'macbook': 'apple',
+    'galaxy': 'samsung', 'rog': 'asus', 'zenbook': 'asus', 'vivobook': 'asus',
+    'thinkpad': 'lenovo', 'ideapad': 'lenovo', 'legion': 'lenovo',
+    'victus': 'hp', 'omen': 'hp', 'pavilion': 'hp',
+}
+NETWORK_TOKENS = frozenset({'4g', '5g', 'lte'})
+# Penanda varian: selalu diberi bobot setinggi token model paling langka di brand tersebut,
+# agar "A56" tidak tertaut ke "A56 Pro Max" hanya karena 'pro'/'max' umum di katalog.
+# Nomor model yang belum pernah terlihat ("S99") diperlakukan sama, bukan sebagai noise.
+VARIANT_TOKENS = frozenset({'pro', 'max', 'plus', 'ultra', 'lite', 'mini', 'fe', 'neo', 'turbo', 'prime',
+                            'note', 'tab', 'pad', 'fold', 'flip', 'edge', 'air', 'go', 'power', 'play'})
+# Kapasitas RAM/penyimpanan ("8/256GB", "12GB+512GB", "256 GB") bukan bagian dari nama model
+CAPACITY_PATTERN = re.compile(r'\b\d+\s*(?:gb|tb)?\s*[/+]\s*\d+\s*(?:gb|tb)\b|\b\d+\s*/\s*\d+\b|\b\d+\s*(?:gb|tb)\b')
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+# ==============================================================================
+# NORMALISASI NAMA
+# ==============================================================================
+
+def model_tokens(name, brand=None, known_brands=()):
+    """
+    Memecah nama produk menjadi (brand, token model, token jaringan).
+    Brand diambil dari kolom brand, atau ditebak dari kata pertama nama (termasuk alias seri).
+    """
+    text = CAPACITY_PATTERN.sub(' ', name.lower()).replace('+', ' plus ')
+    tokens = TOKEN_PATTERN.findall(text)
+    brand_key = brand.lower().strip() if brand else None
+    if not brand_key and tokens:
+        first = tokens[0]
+        brand_key = first if first in known_brands else BRAND_ALIASES.get(first)
+    network = frozenset(t for t in tokens if t in NETWORK_TOKENS)
+    model = tuple(t for t in tokens if t != brand_key and t not in NETWORK_TOKENS)
+    return brand_key, model, network
+
+
+def canonical_id(brand, model, network):
+    return '-'.join((brand,) + model + tuple(sorted(network)))
+
+
+# ==============================================================================
+# KERNEL SKOR & PENCOCOKAN
+# ==============================================================================
+
+def weighted_jaccard(a, b, weights):
+    """
+    Jaccard berbobot: bobot token yang sama dibagi bobot gabungan. Total bobot tiap record
+    sudah dihitung sekali (`weight`), jadi per pasangan cukup menjumlahkan irisannya.
+    """
+    shared = sum(weights[t] for t in a['tokens'] & b['tokens'])
+    union = a['weight'] + b['weight'] - shared
+    return shared / union if union else 0.0
+
+
+def pair_score(a, b, weights):
+    """Skor dua record terparse; varian jaringan berbeda (4G vs 5G) tidak pernah dicocokkan."""
+    if a['network'] and b['network'] and a['network'] != b['network']:
+        return 0.0
+    # Pemecah seri kecil: utamakan kandidat yang penanda jaringannya sama persis
+    return weighted_jaccard(a, b, weights) + (0.001 if a['network'] == b['network'] else 0.0)
+
+
+def _brand_weights(parsed, reference):
+    """
+    Bobot IDF per brand dari nama sumber spesifikasi. Token di luar kosakata berbobot 0
+    (noise toko seperti 'garansi'), kecuali penanda varian dan token yang mengandung angka.
+    """
+    df, totals = defaultdict(Counter), Counter()
+    for record in parsed:
+        if record['source'] in reference:
+            df[record['brand']].update(set(record['model']))
+            totals[record['brand']] += 1
+    weights, rarest = {}, {}
+    for brand, counts in df.items():
+        idf = {t: math.log(1 + totals[brand] / n) for t, n in counts.items()}
+        rarest[brand] = max(idf.values())
+        weights[brand] = defaultdict(float, idf)
+        weights[brand].update({t: rarest[brand] for t in VARIANT_TOKENS})
+    for record in parsed:
+        brand = record['brand']
+        if brand in weights:
+            for token in record['model']:
+                if token not in weights[brand] and any(c.isdigit() for c in token):
+                    weights[brand][token] = rarest[brand]
+    return weights, df
+
+
+def parse_records(records, reference_sources, threshold):
+    """
+    Memparse (source, key, brand, name) menjadi record token berbobot. `prefix` berisi token
+    terberat secukupnya sehingga pasangan yang tidak berbagi satu pun token prefix pasti
+    berskor di bawah `threshold` (prefix filtering) dan tidak perlu dibandingkan.
+    """
+    known_brands = {r[2].lower().strip() for r in records if r[2] and r[0] in reference_sources}
+    parsed = []
+    for source, key, brand, name in records:
+        if not name:
+            continue
+        brand_key, model, network = model_tokens(name, brand, known_brands)
+        if brand_key and model:  # Baris tanpa nama model (misal hanya "Samsung") tidak bisa ditautkan
+            parsed.append({'source': source, 'key': key, 'brand': brand_key, 'model': model, 'network': network})
+    weights, df = _brand_weights(parsed, reference_sources)
+    for record in parsed:
+        brand_weights = weights.get(record['brand'], {})
+        ranked = sorted({t for t in record['model'] if brand_weights.get(t)}, key=lambda t: -brand_weights[t])
+        record['tokens'] = frozenset(ranked)
+        record['weight'] = sum(brand_weights[t] for t in ranked)
+        prefix, rest = [], record['weight']
+        for token in ranked:
+            if rest < threshold * record['weight']:
+                break
+            prefix.append(token)
+            rest -= brand_weights[token]
+        record['prefix'] = prefix
+    return parsed, weights, df
+
+
+def resolve_entities(records, threshold=None, max_block_size=None, reference_sources=None):
+    """
+    records: iterable (source, key, brand, name). Mengembalikan list (source, key, canonical_id, score)
+    untuk setiap baris yang berhasil ditautkan ke perangkat kanonik.
+    """
+    threshold = ENTITY_CONFIG['threshold'] if threshold is None else threshold
+    max_block_size = max_block_size or ENTITY_CONFIG['max_block_size']
+    reference_sources = reference_sources or ENTITY_CONFIG['reference_sources']
+    priority = {source: i for i, source in enumerate(reference_sources)}
+    parsed, weights, df = parse_records(list(records), priority, threshold)
+
+    # Sumber spesifikasi diproses lebih dulu (sesuai prioritas), lalu sumber harga
+    parsed.sort(key=lambda r: priority.get(r['source'], len(priority)))
+    blocks = defaultdict(list)
+    results = []
+    for index, record in enumerate(parsed):
+        brand, brand_weights = record['brand'], weights.get(record['brand'])
+        best, best_score = None, 0.0
+        if brand_weights is not None:
+            seen = set()
+            for token in record['prefix']:
+                for i in blocks.get((brand, token), ()):
+                    candidate = parsed[i]
+                    if i in seen or candidate['source'] == record['source']:
+                        continue
+                    seen.add(i)
+                    score = pair_score(record, candidate, brand_weights)
+                    if score > best_score:
+                        best, best_score = candidate, score
+        if best is not None and best_score >= threshold:
+            results.append((record['source'], record['key'], best['canonical_id'], round(min(best_score, 1.0), 4)))
+        elif record['source'] in priority:
+            # Perangkat baru dari sumber spesifikasi menjadi kanonik dan masuk ke indeks blok
+            record['canonical_id'] = canonical_id(brand, record['model'], record['network'])
+            results.append((record['source'], record['key'], record['canonical_id'], 1.0))
+            for token in record['tokens']:
+                if df[brand][token] <= max_block_size:
+                    blocks[(brand, token)].append(index)
+    return results
+
+
+# ==============================================================================
+# PENYIMPANAN ID KANONIK
+# ==============================================================================
+
+def resolve_catalogue(store=None, threshold=None):
+    """Menautkan seluruh baris katalog dan menyimpan ulang tabel `device_entities`."""
+    own_store = store is None
+    store = store or CatalogueStore()
+    try:
+        records = store.db.execute("SELECT source, key, brand, name FROM devices").fetchall()
+        links = resolve_entities(records, threshold)
+        with store.db:
+            store.db.execute("DELETE FROM device_entities")
+            store.db.executemany(
+                "INSERT INTO device_entities (source, key, canonical_id, score) VALUES (?, ?, ?, ?)", links)
+    finally:
+        if own_store:
+            store.close()
+    return len(records), links
+
+
+# ==============================================================================
+# CLI
+# ==============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resolusi entitas perangkat lintas sumber di katalog.")
+    parser.add_argument('--threshold', type=float, default=ENTITY_CONFIG['threshold'],
+                        help=f"Skor minimum pencocokan (default: {ENTITY_CONFIG['threshold']}).")
+    args = parser.parse_args(argv)
+
+    store = CatalogueStore()
+    start = time.perf_counter()
+    total, links = resolve_catalogue(store, args.threshold)
+    elapsed = time.perf_counter() - start
+    reference = set(ENTITY_CONFIG['reference_sources'])
+    matched = Counter(source for source, _, _, score in links if source not in reference or score < 1.0)
+    print(f"✅ {total} baris diproses dalam {elapsed:.2f} detik; "
+          f"{len({link[2] for link in links})} perangkat kanonik.")
+    for source, count in sorted(matched.items()):
+        print(f"    - {source}: {count} baris ditautkan")
+
+    # Contoh join harga (sumber toko) ke spesifikasi (GSMArena/NotebookCheck)
+    print(store.query("""
+        SELECT p.canonical_id, p.source, p.name, p.price_idr, s.source AS spec_source
+        FROM resolved_devices p
+        JOIN resolved_devices s ON s.canonical_id = p.canonical_id
+            AND s.source IN ('gsmarena', 'notebookcheck')
+        WHERE p.price_idr IS NOT NULL AND p.source NOT IN ('gsmarena', 'notebookcheck')
+        LIMIT 10""").to_string(index=False))
+    store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+# ==============================================================================
+# FETCH DETAIL SECARA PARALEL
+# ==============================================================================
+
+def fetch_with_retries(url, fetch_fn, rate_limiter=None, max_retries=3, retry_delay_seconds=30):
+    """
+    Menjalankan `fetch_fn(url)` dengan mekanisme retry; mengembalikan None jika semua percobaan gagal.
+    Exception dari `fetch_fn` (error jaringan sesaat, WebDriver tersendat) diperlakukan sama seperti
+    hasil kosong: dicetak lalu dicoba lagi.
+    """
+    for attempt in range(max_retries):
+        if rate_limiter:
+            rate_limiter.wait(url)
+        try:
+            result = fetch_fn(url)
+        except Exception as e:
+            print(f"        -> Terjadi error saat scraping detail: {e}")
+            result = None
+        if result:
+            return result
+        print(f"        [GAGAL] Percobaan {attempt + 1}/{max_retries} gagal. URL: {url}")
+        if attempt < max_retries - 1:
+            print(f"        ⏳ Mencoba lagi dalam {retry_delay_seconds} detik...")
+            time.sleep(retry_delay_seconds)
+    return None
+
+
+def fetch_concurrently(urls, fetch_fn, max_workers=4, rate_limiter=None, max_retries=3, retry_delay_seconds=30):
+    """
+    Menjalankan `fetch_fn` untuk banyak URL sekaligus menggunakan thread pool.
+    Menghasilkan (yield) pasangan (url, hasil) sesuai urutan selesainya request;
+    hasil bernilai None jika URL tersebut gagal setelah semua percobaan.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {
+            executor.submit(fetch_with_retries, url, fetch_fn, rate_limiter, max_retries, retry_delay_seconds): url
+            for url in urls
+        }
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                yield url, future.result()
+            except Exception as e:
+                print(f"        -> Terjadi error saat scraping detail: {e}")
+                yield url, None
+    finally:
+        # Batalkan request yang belum berjalan jika proses dihentikan (misal Ctrl-C)
+        executor.shutdown(wait=True, cancel_futures=True)
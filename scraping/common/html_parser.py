@@ -0,0 +1,126 @@
+from bs4 import BeautifulSoup
+
+# --- OPSIONAL: backend parser yang lebih cepat dari html.parser ---
+# selectolax >= 1.0 hanya menyediakan backend lexbor (selectolax.parser/Modest memunculkan ImportError);
+# versi lama tanpa lexbor tetap memakai selectolax.parser. API node keduanya sama (css/css_first/attributes).
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    import cssselect  # noqa: F401  (dibutuhkan lxml untuk selector CSS)
+    CSSSELECT_AVAILABLE = True
+except ImportError:
+    CSSSELECT_AVAILABLE = False
+
+# Urutan prioritas backend; yang pertama tersedia dipakai sebagai default
+BACKEND_PRIORITY = ['selectolax', 'lxml', 'bs4']
+
+
+# ==============================================================================
+# ADAPTER NODE: API SERAGAM UNTUK SEMUA BACKEND
+# ==============================================================================
+
+class SelectolaxNode:
+    def __init__(self, node):
+        self.node = node
+
+    def select(self, css):
+        return [SelectolaxNode(n) for n in self.node.css(css)]
+
+    def select_one(self, css):
+        node = self.node.css_first(css, default=None)
+        return SelectolaxNode(node) if node is not None else None
+
+    def text(self):
+        return self.node.text(deep=True)
+
+    def attr(self, name, default=None):
+        # Atribut tanpa nilai (mis. `<input disabled>`) bernilai None di kedua backend selectolax
+        value = self.node.attributes.get(name)
+        return default if value is None else value
+
+    def html(self):
+        return self.node.html or ''
+
+
+class LxmlNode:
+    def __init__(self, node):
+        self.node = node
+
+    def select(self, css):
+        return [LxmlNode(n) for n in self.node.cssselect(css)]
+
+    def select_one(self, css):
+        nodes = self.node.cssselect(css)
+        return LxmlNode(nodes[0]) if nodes else None
+
+    def text(self):
+        return self.node.text_content()
+
+    def attr(self, name, default=None):
+        return self.node.get(name, default)
+
+    def html(self):
+        return lxml.html.tostring(self.node, encoding='unicode', with_tail=False)
+
+
+class SoupNode:
+    def __init__(self, node):
+        self.node = node
+
+    def select(self, css):
+        return [SoupNode(n) for n in self.node.select(css)]
+
+    def select_one(self, css):
+        node = self.node.select_one(css)
+        return SoupNode(node) if node is not None else None
+
+    def text(self):
+        return self.node.text
+
+    def attr(self, name, default=None):
+        return self.node.get(name, default)
+
+    def html(self):
+        return str(self.node)
+
+
+# ==============================================================================
+# FUNGSI-FUNGSI
+# ==============================================================================
+
+def available_backends():
+    """Daftar backend yang bisa dipakai di lingkungan ini, urut sesuai prioritas."""
+    available = {'selectolax': SELECTOLAX_AVAILABLE, 'lxml': LXML_AVAILABLE and CSSSELECT_AVAILABLE, 'bs4': True}
+    return [name for name in BACKEND_PRIORITY if available[name]]
+
+
+def parse_html(html, backend=None):
+    """
+    Mem-parsing HTML dengan backend tercepat yang tersedia (selectolax > lxml > BeautifulSoup).
+    Mengembalikan node root dengan API `select`, `select_one`, `text`, `attr` dan `html`.
+    """
+    backend = backend or available_backends()[0]
+    if backend == 'selectolax':
+        return SelectolaxNode(SelectolaxParser(html).root)
+    if backend == 'lxml':
+        return LxmlNode(lxml.html.fromstring(html))
+    if backend == 'bs4':
+        # Parser 'lxml' untuk BeautifulSoup tetap lebih cepat dari 'html.parser' jika terpasang
+        return SoupNode(BeautifulSoup(html, 'lxml' if LXML_AVAILABLE else 'html.parser'))
+    if backend == 'bs4-html.parser':
+        return SoupNode(BeautifulSoup(html, 'html.parser'))
+    raise ValueError(f"Backend parser tidak dikenal: {backend}")
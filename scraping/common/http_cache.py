@@ -0,0 +1,169 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+import requests
+
+from common import http_session
+
+# ==============================================================================
+# KONFIGURASI CACHE
+# ==============================================================================
+HTTP_CACHE_CONFIG = {
+    # Satu folder cache untuk semua skrip, di dalam folder 'scraping'
+    'cache_dir': os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.http_cache'),
+    'ttl_seconds': 7 * 24 * 3600,  # Selama masih "segar", halaman diambil dari disk tanpa request
+    'max_size_mb': 1024  # Jika terlampaui, entri yang paling lama tidak dipakai dihapus (LRU)
+}
+
+
+# ==============================================================================
+# CACHE RESPON HTTP DI DISK
+# ==============================================================================
+
+def prepared_url(url, params=None):
+    """URL final yang dikirim requests, termasuk query `params` yang sudah di-encode."""
+    return requests.Request('GET', url, params=params).prepare().url
+
+
+def cache_key(method, url):
+    """Kunci entri cache: method + URL final, agar request dengan params berbeda tidak bertabrakan."""
+    return f"{method.upper()} {url}"
+
+
+class HttpCache:
+    """
+    Cache respon GET di disk. Body disimpan berdasarkan hash isinya (content-addressed),
+    sedangkan indeks SQLite menyimpan kunci (method + URL beserta query), ETag/Last-Modified,
+    waktu fetch dan waktu akses.
+    Entri yang kedaluwarsa divalidasi ulang dengan If-None-Match/If-Modified-Since
+    sehingga halaman yang tidak berubah cukup dibayar dengan respon 304.
+    """
+
+    def __init__(self, cache_dir, ttl_seconds, max_size_mb):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.lock = threading.Lock()
+        os.makedirs(os.path.join(cache_dir, 'bodies'), exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(cache_dir, 'index.sqlite'), check_same_thread=False)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                body_hash TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                content_type TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )""")
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access)")
+        self.db.commit()
+
+    def _body_path(self, body_hash):
+        return os.path.join(self.cache_dir, 'bodies', body_hash[:2], body_hash)
+
+    def _lookup(self, key):
+        with self.lock:
+            row = self.db.execute(
+                "SELECT body_hash, content_type, etag, last_modified, fetched_at FROM entries WHERE url = ?",
+                (key,)).fetchone()
+        if not row:
+            return None
+        entry = dict(zip(('body_hash', 'content_type', 'etag', 'last_modified', 'fetched_at'), row))
+        try:
+            with open(self._body_path(entry['body_hash']), 'rb') as f:
+                entry['body'] = f.read()
+        except FileNotFoundError:
+            return None
+        return entry
+
+    def _store(self, key, response):
+        body = response.content
+        body_hash = hashlib.sha256(body).hexdigest()
+        path = self._body_path(body_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, body_hash, len(body), response.headers.get('Content-Type'), response.headers.get('ETag'),
+                 response.headers.get('Last-Modified'), now, now))
+            self.db.commit()
+        self._evict_if_needed()
+
+    def _touch(self, key, refreshed=False):
+        now = time.time()
+        with self.lock:
+            if refreshed:
+                self.db.execute("UPDATE entries SET fetched_at = ?, last_access = ? WHERE url = ?", (now, now, key))
+            else:
+                self.db.execute("UPDATE entries SET last_access = ? WHERE url = ?", (now, key))
+            self.db.commit()
+
+    def _evict_if_needed(self):
+        """Menghapus entri yang paling lama tidak diakses sampai ukuran cache di bawah batas."""
+        with self.lock:
+            total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_size_bytes:
+                return
+            for url, body_hash, size in self.db.execute(
+                    "SELECT url, body_hash, size FROM entries ORDER BY last_access ASC").fetchall():
+                if total <= self.max_size_bytes:
+                    break
+                self.db.execute("DELETE FROM entries WHERE url = ?", (url,))
+                total -= size
+                still_used = self.db.execute("SELECT 1 FROM entries WHERE body_hash = ? LIMIT 1", (body_hash,)).fetchone()
+                if not still_used:
+                    try:
+                        os.remove(self._body_path(body_hash))
+                    except FileNotFoundError:
+                        pass
+            self.db.commit()
+
+    def _cached_response(self, url, entry, status):
+        headers = {'Content-Type': entry['content_type'] or 'text/html', 'X-Cache': status}
+        return http_session.build_response(url, 200, headers, entry['body'])
+
+    def get(self, url, headers=None, timeout=None, params=None, **kwargs):
+        """Pengganti `http_get` yang memakai cache; header `X-Cache` berisi HIT, REVALIDATED atau MISS."""
+        url = prepared_url(url, params)
+        key = cache_key('GET', url)
+        entry = self._lookup(key)
+        if entry and time.time() - entry['fetched_at'] < self.ttl_seconds:
+            self._touch(key)
+            return self._cached_response(url, entry, 'HIT')
+
+        request_headers = dict(headers or {})
+        if entry:
+            if entry['etag']:
+                request_headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        response = http_session.http_request('GET', url, headers=request_headers, timeout=timeout, **kwargs)
+        if response.status_code == 304 and entry:
+            self._touch(key, refreshed=True)
+            return self._cached_response(url, entry, 'REVALIDATED')
+        if response.status_code == 200:
+            self._store(key, response)
+        response.headers['X-Cache'] = 'MISS'
+        return response
+
+
+def enable_cache(cache_dir=None, ttl_seconds=None, max_size_mb=None):
+    """Mengaktifkan cache disk untuk semua pemanggilan `http_get` di proses ini."""
+    cache = HttpCache(cache_dir or HTTP_CACHE_CONFIG['cache_dir'],
+                      HTTP_CACHE_CONFIG['ttl_seconds'] if ttl_seconds is None else ttl_seconds,
+                      HTTP_CACHE_CONFIG['max_size_mb'] if max_size_mb is None else max_size_mb)
+    http_session.SESSION_CONFIG['cache'] = cache
+    print(f"💾 Cache HTTP aktif di: {cache.cache_dir}")
+    return cache
@@ -0,0 +1,148 @@
+import threading
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# --- OPSIONAL: brotli untuk kompresi 'br', httpx[http2] untuk HTTP/2 ---
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+try:
+    import httpx
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# ==============================================================================
+# KONFIGURASI SESSION BERSAMA
+# ==============================================================================
+SESSION_CONFIG = {
+    'use_http2': HTTP2_AVAILABLE,  # Otomatis aktif jika httpx + h2 terpasang
+    'default_pool_size': 10,  # Jumlah koneksi keep-alive per host
+    'host_pool_sizes': {},  # Contoh: {'www.gsmarena.com': 8}
+    'timeout_seconds': 30,
+    'cache': None,  # Diisi oleh common.http_cache.enable_cache()
+    'headers': {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36',
+        # 'br' hanya diminta jika library brotli tersedia untuk mendekompresinya
+        'Accept-Encoding': 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate',
+        'Connection': 'keep-alive'
+    }
+}
+
+_lock = threading.Lock()
+_session = None
+_http2_client = None
+_http2_pool_size = 0  # Ukuran pool yang dipakai saat `_http2_client` dibuat
+
+
+# ==============================================================================
+# FUNGSI-FUNGSI
+# ==============================================================================
+
+def set_host_pool_size(host, pool_size):
+    """
+    Mengatur ukuran pool koneksi untuk host (atau URL) tertentu, misal sesuai jumlah worker.
+    Client HTTP/2 hanya punya satu batas untuk semua host; jika ukuran baru lebih besar dari
+    batas client yang sudah ada, client dibuat ulang pada request berikutnya.
+    """
+    global _http2_client
+    host = urlparse(host).netloc or host
+    with _lock:
+        SESSION_CONFIG['host_pool_sizes'][host] = pool_size
+        if _session is not None:
+            _mount_host_adapter(_session, host, pool_size)
+        if _http2_client is not None and pool_size > _http2_pool_size:
+            # Client lama tidak ditutup di sini karena mungkin masih dipakai request yang berjalan;
+            # koneksinya dilepas saat objeknya dibersihkan garbage collector
+            _http2_client = None
+
+
+def _mount_host_adapter(session, host, pool_size):
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount(f"https://{host}", adapter)
+    session.mount(f"http://{host}", adapter)
+
+
+def get_session():
+    """Mengembalikan satu requests.Session bersama (keep-alive + connection pooling)."""
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update(SESSION_CONFIG['headers'])
+            default_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=SESSION_CONFIG['default_pool_size'])
+            session.mount("https://", default_adapter)
+            session.mount("http://", default_adapter)
+            for host, pool_size in SESSION_CONFIG['host_pool_sizes'].items():
+                _mount_host_adapter(session, host, pool_size)
+            _session = session
+        return _session
+
+
+def _get_http2_client():
+    global _http2_client, _http2_pool_size
+    with _lock:
+        if _http2_client is None:
+            pool_size = max([SESSION_CONFIG['default_pool_size'], *SESSION_CONFIG['host_pool_sizes'].values()])
+            _http2_client = httpx.Client(
+                http2=True, follow_redirects=True, headers=SESSION_CONFIG['headers'],
+                limits=httpx.Limits(max_connections=pool_size * 4, max_keepalive_connections=pool_size))
+            _http2_pool_size = pool_size
+        return _http2_client
+
+
+def build_response(url, status_code, headers, content, encoding=None):
+    """Membuat objek requests.Response dari data mentah (dipakai backend HTTP/2)."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.encoding = encoding or requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+def _http2_request(method, url, headers=None, timeout=None, **kwargs):
+    try:
+        resp = _get_http2_client().request(method, url, headers=headers, timeout=timeout, **kwargs)
+    except httpx.TimeoutException as e:
+        raise requests.exceptions.Timeout(str(e))
+    except httpx.HTTPError as e:
+        raise requests.exceptions.ConnectionError(str(e))
+    return build_response(str(resp.url), resp.status_code, resp.headers, resp.content, resp.encoding)
+
+
+def http_request(method, url, headers=None, timeout=None, **kwargs):
+    """
+    Mengirim request lewat session bersama dan selalu mengembalikan requests.Response,
+    baik lewat HTTP/1.1 (requests) maupun HTTP/2 (httpx), sehingga pemanggil tetap bisa
+    memakai `raise_for_status()`, `.text` dan `requests.exceptions` seperti biasa.
+    """
+    timeout = timeout or SESSION_CONFIG['timeout_seconds']
+    if SESSION_CONFIG['use_http2'] and HTTP2_AVAILABLE and urlparse(url).scheme == 'https':
+        return _http2_request(method, url, headers=headers, timeout=timeout, **kwargs)
+    return get_session().request(method, url, headers=headers, timeout=timeout, **kwargs)
+
+
+def http_get(url, headers=None, timeout=None, use_cache=True, **kwargs):
+    """Pengganti `requests.get` yang memakai session bersama (dan cache disk jika diaktifkan)."""
+    cache = SESSION_CONFIG['cache']
+    if cache is not None and use_cache:
+        return cache.get(url, headers=headers, timeout=timeout, **kwargs)
+    return http_request('GET', url, headers=headers, timeout=timeout, **kwargs)
+
+
+def http_post(url, headers=None, timeout=None, **kwargs):
+    """Pengganti `requests.post` yang memakai session bersama."""
+    return http_request('POST', url, headers=headers, timeout=timeout, **kwargs)
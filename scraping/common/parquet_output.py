@@ -0,0 +1,165 @@
+"""
+Output Parquet bertipe untuk hasil scraping. CSV tetap menjadi format utama (dan snapshot
+mode delta); file Parquet ditulis di sampingnya untuk analisis di notebook:
+
+    - nilai kosong / "N/A" menjadi null sungguhan,
+    - kolom ternormalisasi dari `common.spec_normalize` (harga, berat, baterai, ukuran
+      layar) ditambahkan sebagai angka di samping kolom teks aslinya,
+    - kolom berulang seperti brand dan OS disimpan sebagai dictionary (categorical di pandas),
+    - semua kolom teks memakai dictionary encoding + kompresi zstd.
+
+Konversi CSV lama (per file, atau digabung menjadi satu file untuk notebook):
+    python -m common.parquet_output "Universal ( Laptop & HP )/Gsm Arena/gsmarena_Apple_smartphone_*.csv"
+    python -m common.parquet_output "Universal ( Laptop & HP )/Gsm Arena/gsmarena_*.csv" --output gsmarena.parquet
+"""
+import argparse
+import glob
+import os
+import sys
+
+import pandas as pd
+
+from common.spec_normalize import NORMALIZED_COLUMNS, normalize_specs, normalized_columns
+
+# --- OPSIONAL: pyarrow hanya dibutuhkan jika output Parquet diaktifkan ---
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# ==============================================================================
+# KONFIGURASI PARQUET
+# ==============================================================================
+PARQUET_CONFIG = {
+    'batch_rows': 5000,  # Jumlah baris per row group
+    'compression': 'zstd'
+}
+
+NULL_VALUES = ('', 'N/A')
+
+# Kolom dengan sedikit nilai unik yang berulang -> dictionary<int32, string>
+CATEGORY_COLUMNS = ('Brand', 'Category', 'Platform_OS', 'Network_Technology', 'Launch_Status')
+
+
+# ==============================================================================
+# KONVERSI BATCH
+# ==============================================================================
+
+def _arrow_type(dtype):
+    if dtype == 'category':
+        return pa.dictionary(pa.int32(), pa.string())
+    return pa.int64() if dtype == 'Int64' else pa.float64()
+
+
+def build_schema(columns, number_rows=True):
+    """Skema Arrow: 'No' int32, kolom kategori sebagai dictionary, sisanya string, lalu kolom ternormalisasi."""
+    fields = [pa.field('No', pa.int32())] if number_rows else []
+    for column in columns:
+        if column in CATEGORY_COLUMNS:
+            fields.append(pa.field(column, pa.dictionary(pa.int32(), pa.string())))
+        else:
+            fields.append(pa.field(column, pa.string()))
+    for name in normalized_columns(columns):
+        fields.append(pa.field(name, _arrow_type(NORMALIZED_COLUMNS[name]['dtype'])))
+    return pa.schema(fields)
+
+
+def _typed_table(records, columns, schema, first_number):
+    """Mengubah satu batch baris (dict) menjadi tabel Arrow sesuai `schema` (normalisasi per kolom)."""
+    frame = pd.DataFrame.from_records(records, columns=columns)
+    for column in columns:
+        values = frame[column]
+        frame[column] = values.where(values.notna() & ~values.isin(NULL_VALUES)).astype('string')
+    frame = normalize_specs(frame)
+    if 'No' in schema.names:
+        frame.insert(0, 'No', range(first_number, first_number + len(frame)))
+    return pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+
+
+# ==============================================================================
+# PENULISAN PARQUET
+# ==============================================================================
+
+def write_parquet(records, columns, output_file, number_rows=True):
+    """
+    Menulis iterable baris (dict) ke Parquet bertipe per row group, sehingga memori hanya
+    menampung satu batch. `columns` adalah urutan kolom final. Mengembalikan jumlah baris.
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("Output Parquet membutuhkan pyarrow: pip install pyarrow")
+
+    schema = build_schema(columns, number_rows)
+    batch_rows = PARQUET_CONFIG['batch_rows']
+    count = 0
+    with pq.ParquetWriter(output_file, schema, compression=PARQUET_CONFIG['compression'],
+                          use_dictionary=True) as writer:
+        batch = []
+        for row in records:
+            batch.append(row)
+            if len(batch) >= batch_rows:
+                writer.write_table(_typed_table(batch, columns, schema, count + 1))
+                count += len(batch)
+                batch = []
+        if batch:
+            writer.write_table(_typed_table(batch, columns, schema, count + 1))
+            count += len(batch)
+    return count
+
+
+def _read_scraped_csv(csv_path):
+    return pd.read_csv(csv_path, sep=';', encoding='utf-8-sig', dtype=str, keep_default_na=False)
+
+
+def convert_csv(csv_path, output_file=None):
+    """Mengonversi CSV hasil scraping (sep ';', UTF-8-BOM) menjadi Parquet bertipe di sebelahnya."""
+    output_file = output_file or os.path.splitext(csv_path)[0] + '.parquet'
+    df = _read_scraped_csv(csv_path)
+    number_rows = 'No' in df.columns
+    df = df.drop(columns=['No'], errors='ignore')
+    write_parquet(df.to_dict('records'), list(df.columns), output_file, number_rows)
+    return output_file
+
+
+def combine_csvs(csv_paths, output_file):
+    """
+    Menggabungkan banyak CSV (misal semua brand) menjadi satu file Parquet. Banyak file kecil
+    lebih lambat dibaca daripada satu file; kolom yang tidak dimiliki sebuah file menjadi null.
+    """
+    columns = {}
+    for path in csv_paths:
+        columns.update(dict.fromkeys(pd.read_csv(path, sep=';', encoding='utf-8-sig', nrows=0).columns))
+    columns.pop('No', None)
+
+    def records():
+        for path in csv_paths:
+            yield from _read_scraped_csv(path).drop(columns=['No'], errors='ignore').to_dict('records')
+
+    return write_parquet(records(), list(columns), output_file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Konversi CSV hasil scraping menjadi Parquet bertipe.")
+    parser.add_argument('patterns', nargs='+', help="Path atau pola glob file CSV.")
+    parser.add_argument('--output', help="Gabungkan semua CSV ke satu file Parquet ini.")
+    args = parser.parse_args(argv)
+
+    paths = sorted({path for pattern in args.patterns for path in glob.glob(pattern)})
+    if not paths:
+        print("❌ Tidak ada file CSV yang cocok.")
+        sys.exit(1)
+    if args.output:
+        count = combine_csvs(paths, args.output)
+        size_kb = sum(os.path.getsize(path) for path in paths) / 1024
+        print(f"✅ {len(paths)} file CSV ({count} baris) -> {args.output} "
+              f"({size_kb:.0f} KB -> {os.path.getsize(args.output) / 1024:.0f} KB)")
+        return
+    for path in paths:
+        output_file = convert_csv(path)
+        print(f"✅ {path} -> {output_file} "
+              f"({os.path.getsize(path) / 1024:.0f} KB -> {os.path.getsize(output_file) / 1024:.0f} KB)")
+
+
+if __name__ == '__main__':
+    main()
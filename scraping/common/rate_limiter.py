@@ -0,0 +1,61 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+
+# ==============================================================================
+# TOKEN BUCKET PER HOST
+# ==============================================================================
+
+class TokenBucket:
+    """Token bucket sederhana: terisi `rate` token per detik, maksimal `burst` token."""
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError("rate harus lebih besar dari 0")
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Menunggu (blocking) sampai satu token tersedia, lalu memakainya."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_seconds = (1 - self.tokens) / self.rate
+            time.sleep(wait_seconds)
+
+
+class HostRateLimiter:
+    """
+    Menyimpan satu TokenBucket untuk setiap host, sehingga semua thread yang
+    mengakses host yang sama berbagi anggaran request yang sama.
+    `per_host` bisa dipakai untuk mengatur host tertentu, contoh: {'www.gsmarena.com': (0.5, 2)}.
+    """
+
+    def __init__(self, rate, burst=1, per_host=None):
+        self.rate = rate
+        self.burst = burst
+        self.per_host = per_host or {}
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def bucket_for(self, url):
+        """Mengambil (atau membuat) bucket untuk host dari URL."""
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            if host not in self.buckets:
+                rate, burst = self.per_host.get(host, (self.rate, self.burst))
+                self.buckets[host] = TokenBucket(rate, burst)
+            return self.buckets[host]
+
+    def wait(self, url):
+        """Menunggu giliran sebelum mengirim request ke host dari URL."""
+        self.bucket_for(url).acquire()
@@ -0,0 +1,131 @@
+import csv
+import json
+import os
+
+from common import parquet_output
+from common.catalogue import upsert_into_catalogue
+
+# ==============================================================================
+# KONFIGURASI SINK
+# ==============================================================================
+ROW_SINK_CONFIG = {
+    'na_value': 'N/A',  # Pengisi kolom yang tidak dimiliki sebuah baris
+    'write_parquet': False,  # Tulis juga salinan Parquet bertipe di samping setiap CSV
+}
+
+
+# ==============================================================================
+# PENULIS BARIS STREAMING
+# ==============================================================================
+
+class StreamingRowWriter:
+    """
+    Pengganti pola `list of dict -> pd.DataFrame -> reindex -> to_csv` di akhir run.
+    Setiap baris langsung ditulis ke file spool JSONL (`{output_file}.part.jsonl`) begitu
+    diterima, sehingga memori hanya menyimpan himpunan nama kolom, bukan seluruh baris.
+    Kolom spesifikasi baru boleh muncul kapan saja; saat `close()` header final disusun
+    (kolom `first_columns` lalu sisanya urut abjad) dan spool dialirkan ke CSV dalam satu
+    lintasan kedua. Jika `write_parquet` aktif, spool yang sama juga ditulis ke Parquet bertipe
+    (`common.parquet_output`) dengan nama file yang sama berakhiran `.parquet`; nama file
+    output yang berakhiran `.parquet` hanya menghasilkan file Parquet. Jika `catalogue_source`
+    diisi, baris yang sama juga di-upsert ke katalog SQLite (`common.catalogue`).
+
+    Jika run berhenti karena error, spool tidak difinalisasi agar tidak ada CSV parsial yang
+    terbaca sebagai snapshot lengkap oleh mode delta.
+    """
+
+    def __init__(self, output_file, first_columns=(), sort_columns=True, number_rows=True,
+                 sep=';', encoding='utf-8-sig', na_value=None, write_parquet=None, catalogue_source=None):
+        self.output_file = output_file
+        self.first_columns = list(first_columns)
+        self.sort_columns = sort_columns
+        self.number_rows = number_rows
+        self.sep = sep
+        self.encoding = encoding
+        self.na_value = ROW_SINK_CONFIG['na_value'] if na_value is None else na_value
+        self.write_parquet = ROW_SINK_CONFIG['write_parquet'] if write_parquet is None else write_parquet
+        self.parquet_file = None
+        self.catalogue_source = catalogue_source
+        self.spool_path = f"{output_file}.part.jsonl"
+        self.columns = {}  # dict sebagai ordered set: urutan kemunculan kolom
+        self.count = 0
+        self.finalized = False
+        self.spool = open(self.spool_path, 'w', encoding='utf-8')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.spool.close()
+
+    def __len__(self):
+        return self.count
+
+    def write(self, row):
+        """Menulis satu baris (dict) ke spool; kolom baru dicatat untuk header final."""
+        for column in row:
+            if column not in self.columns:
+                self.columns[column] = None
+        self.spool.write(json.dumps(row, ensure_ascii=False, default=str))
+        self.spool.write('\n')
+        self.count += 1
+
+    def write_many(self, rows):
+        for row in rows:
+            self.write(row)
+
+    def iter_rows(self):
+        """Membaca ulang baris dari spool (misal untuk changelog) tanpa memuat semuanya ke memori."""
+        if not self.spool.closed:
+            self.spool.flush()
+        with open(self.spool_path, encoding='utf-8') as spool:
+            for line in spool:
+                yield json.loads(line)
+
+    def final_columns(self):
+        existing_first_cols = [col for col in self.first_columns if col in self.columns]
+        other_cols = [col for col in self.columns if col not in existing_first_cols]
+        if self.sort_columns:
+            other_cols = sorted(other_cols)
+        return existing_first_cols + other_cols
+
+    def close(self):
+        """
+        Memfinalisasi output dan menghapus spool. Tidak ada file yang dibuat jika tidak ada
+        baris sama sekali. Mengembalikan jumlah baris yang ditulis.
+        """
+        if self.finalized:
+            return self.count
+        self.spool.close()
+        if self.count:
+            columns = self.final_columns()
+            if self.output_file.endswith('.parquet'):
+                self.parquet_file = self.output_file
+            else:
+                self._write_csv(columns)
+                if self.write_parquet:
+                    self.parquet_file = os.path.splitext(self.output_file)[0] + '.parquet'
+            if self.parquet_file:
+                parquet_output.write_parquet(self.iter_rows(), columns, self.parquet_file, self.number_rows)
+            if self.catalogue_source:
+                upsert_into_catalogue(self.catalogue_source, rows=self.iter_rows())
+        os.remove(self.spool_path)
+        self.finalized = True
+        return self.count
+
+    def _records(self, columns):
+        with open(self.spool_path, encoding='utf-8') as spool:
+            for line in spool:
+                row = json.loads(line)
+                yield [self.na_value if row.get(col) is None else row[col] for col in columns]
+
+    def _write_csv(self, columns):
+        # Format sama dengan df.to_csv(index=False, sep=';') yang dipakai sebelumnya
+        with open(self.output_file, 'w', encoding=self.encoding, newline='') as f:
+            writer = csv.writer(f, delimiter=self.sep, lineterminator=os.linesep)
+            writer.writerow((['No'] if self.number_rows else []) + columns)
+            for i, values in enumerate(self._records(columns), start=1):
+                writer.writerow(([i] if self.number_rows else []) + values)
@@ -0,0 +1,133 @@
+"""
+Normalisasi nilai spesifikasi mentah menjadi kolom bertipe (angka + satuan, enum).
+
+Semua ekstraksi berjalan per kolom dengan `Series.str.extract` (vektor), bukan regex per
+baris, sehingga filter/ranking di katalog ribuan perangkat cukup memakai kolom numerik:
+
+    df = load_catalogue(glob.glob("Universal ( Laptop & HP )/Gsm Arena/gsmarena_*.csv"))
+    df[(df.Display_Size_inches >= 11) & (df.Battery_mAh >= 8000)].nsmallest(10, 'Price_EUR')
+
+Kolom teks asli tidak diubah; kolom hasil normalisasi ditambahkan di sampingnya.
+"""
+import pandas as pd
+
+NULL_VALUES = ('', 'N/A')
+
+NUMBER = r'(\d[\d,.]*)'
+
+# ==============================================================================
+# DEFINISI KOLOM TERNORMALISASI
+# ==============================================================================
+# nama kolom -> kolom sumber (berurutan), pola regex (satu grup tangkap, berurutan),
+# tipe hasil dan pemisah ribuan yang dibuang sebelum konversi angka.
+# Untuk setiap baris dipakai hasil dari kombinasi sumber/pola pertama yang cocok.
+NORMALIZED_COLUMNS = {
+    # "480 g or 492 g (1.06 lb)" -> 480.0
+    'Weight_g': {'sources': ('Body_Weight',), 'patterns': (NUMBER + r'\s*g\b',),
+                 'dtype': 'float64', 'thousands': ','},
+    # "Li-Po 7040 mAh" -> 7040
+    'Battery_mAh': {'sources': ('Battery_Type',), 'patterns': (NUMBER + r'\s*mAh',),
+                    'dtype': 'Int64', 'thousands': ','},
+    # "Si/C Li-Ion 6500 mAh" -> "Si/C Li-Ion"
+    'Battery_Chemistry': {'sources': ('Battery_Type',), 'patterns': (r'(Si/C Li-Ion|Li-Po|Li-Ion)',),
+                          'dtype': 'category'},
+    # "6.7 inches, 110.2 cm2 (~88.0% screen-to-body ratio)" -> 6.7
+    'Display_Size_inches': {'sources': ('Display_Size',), 'patterns': (NUMBER + r'\s*inches',),
+                            'dtype': 'float64', 'thousands': ','},
+    'Screen_To_Body_pct': {'sources': ('Display_Size',), 'patterns': (r'~' + NUMBER + r'%',),
+                           'dtype': 'float64', 'thousands': ','},
+    # "About 250 EUR" / "$ 246.50 / € 203.99 / £ 232.78" -> 250.0 / 203.99
+    'Price_EUR': {'sources': ('Estimated_Price', 'Misc_Price'),
+                  'patterns': (NUMBER + r'\s*EUR', r'€\s*' + NUMBER),
+                  'dtype': 'float64', 'thousands': ','},
+    # "Rp 12.999.000" / "8449000" (situs resmi / toko Indonesia) -> 12999000 / 8449000
+    'Price_IDR': {'sources': ('Price (IDR)', 'Price', 'Harga', 'Harga Produk', 'Price (string)'),
+                  'patterns': (r'Rp\s*' + NUMBER, r'^\s*(\d[\d.]*)\s*$'),
+                  'dtype': 'Int64', 'thousands': '.'},
+}
+
+MONTHS = {month: f"{i:02d}" for i, month in enumerate(
+    ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+     'August', 'September', 'October', 'November', 'December'), start=1)}
+RELEASE_DATE_PATTERN = r'(?P<year>\d{4})(?:,\s*(?P<month>[A-Z][a-z]+)(?:\s+(?P<day>\d{1,2}))?)?'
+
+
+# ==============================================================================
+# NORMALISASI VEKTOR
+# ==============================================================================
+
+def normalized_columns(columns):
+    """Kolom ternormalisasi yang bisa dihitung dari `columns` (dan belum ada di dalamnya)."""
+    return [name for name, spec in NORMALIZED_COLUMNS.items()
+            if name not in columns and any(source in columns for source in spec['sources'])]
+
+
+def _factorize(df, source, cache):
+    """Kode per baris + nilai unik kolom `source` (di-cache, satu kolom sumber bisa dipakai beberapa kali)."""
+    if source not in cache:
+        # "N/A" dan string kosong tidak cocok dengan pola mana pun, jadi tidak perlu disaring dulu
+        codes, uniques = pd.factorize(df[source])
+        cache[source] = (codes, pd.Series(uniques, dtype='string'))
+    return cache[source]
+
+
+def _convert(extracted, spec):
+    if spec['dtype'] == 'category':
+        return extracted
+    numbers = pd.to_numeric(extracted.str.replace(spec['thousands'], '', regex=False), errors='coerce')
+    if spec['dtype'] == 'Int64':
+        numbers = numbers.round()
+    return numbers.astype(spec['dtype'])
+
+
+def _normalize_column(df, spec, cache):
+    """
+    Ekstraksi dan konversi hanya dijalankan pada nilai unik tiap kolom sumber (spesifikasi
+    sangat berulang antar perangkat), lalu disebar kembali ke semua baris lewat kode factorize.
+    """
+    result = None
+    for source in spec['sources']:
+        if source not in df.columns:
+            continue
+        codes, uniques = _factorize(df, source, cache)
+        extracted = None
+        for pattern in spec['patterns']:
+            part = uniques.str.extract(pattern, expand=False)
+            extracted = part if extracted is None else extracted.fillna(part)
+        converted = _convert(extracted, spec)
+        # Kode -1 (nilai kosong) menunjuk ke elemen NA yang ditambahkan di akhir
+        padded = pd.concat([converted, pd.Series([None], dtype=converted.dtype)], ignore_index=True)
+        column = pd.Series(padded.to_numpy()[codes], index=df.index, dtype=converted.dtype)
+        result = column if result is None else result.fillna(column)
+    return result.astype('category') if spec['dtype'] == 'category' else result
+
+
+def normalize_specs(df):
+    """Menambahkan kolom-kolom `NORMALIZED_COLUMNS` yang sumbernya tersedia ke salinan `df`."""
+    df = df.copy()
+    cache = {}
+    for name in normalized_columns(df.columns):
+        df[name] = _normalize_column(df, NORMALIZED_COLUMNS[name], cache)
+    return df
+
+
+def parse_release_dates(series):
+    """
+    "2024, January 29" -> "2024-01-29", "2019, March. Released ..." -> "2019-03", "2022" -> "2022".
+    Format ISO parsial sehingga tetap bisa diurutkan/dibandingkan sebagai teks.
+    """
+    codes, uniques = pd.factorize(series)
+    parts = pd.Series(uniques, dtype='string').str.extract(RELEASE_DATE_PATTERN)
+    month = parts['month'].map(MONTHS)
+    dates = parts['year'].where(month.isna(), parts['year'] + '-' + month)
+    dates = dates.where(parts['day'].isna() | month.isna(), dates + '-' + parts['day'].str.zfill(2))
+    padded = pd.concat([dates, pd.Series([None], dtype='string')], ignore_index=True)
+    return pd.Series(padded.to_numpy()[codes], index=series.index, dtype='string')
+
+
+def load_catalogue(csv_paths):
+    """Membaca banyak CSV hasil scraping (sep ';') menjadi satu DataFrame ternormalisasi."""
+    frames = [pd.read_csv(path, sep=';', encoding='utf-8-sig', dtype=str, na_values=list(NULL_VALUES),
+                          keep_default_na=False).drop(columns=['No'], errors='ignore')
+              for path in csv_paths]
+    return normalize_specs(pd.concat(frames, ignore_index=True)) if frames else pd.DataFrame()
@@ -1,133 +1,133 @@
 import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException
 from urllib.parse import urlparse, parse_qs
-import time
 import pandas as pd
+import os
+import sys
 
-print("🚀 Memulai proses scraping tingkat lanjut...")
-
-# === SETUP CHROME DALAM MODE HEADLESS ===
-options = webdriver.ChromeOptions()
-options.add_argument("--headless")
-options.add_argument("--disable-gpu")
-options.add_argument("--window-size=1920,1080")
-options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36") # Menambahkan User-Agent
+# Tambahkan folder 'scraping' ke sys.path agar modul bersama (common/) bisa di-import
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from common.browser_pool import BrowserPool, consent_warmup, open_page
+from common.catalogue import upsert_into_catalogue
+from common.dom_extract import extract_record
+from sources.hp_store import crawl_category, flat_row
 
-# Inisialisasi browser dengan opsi headless
-driver = webdriver.Chrome(options=options)
-wait = WebDriverWait(driver, 10) # Menambahkan explicit wait untuk stabilitas
+print("🚀 Memulai proses scraping tingkat lanjut...")
 
 # Buka halaman awal
 start_url = "https://www.hp.com/id-id/shop/laptops-tablets.html"
-driver.get(start_url)
-time.sleep(3)
-
-# Deteksi jumlah halaman terakhir
-try:
-    last_page_elem = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "li.Last_list-page a")))
-    last_page_url = last_page_elem.get_attribute("href")
-    parsed_url = urlparse(last_page_url)
-    last_page = int(parse_qs(parsed_url.query)['p'][0])
-    print(f"🔢 Halaman terakhir terdeteksi: {last_page}")
-except TimeoutException:
-    last_page = 1
-    print("⚠️ Tidak bisa mendeteksi halaman terakhir, default ke 1")
-
-produk_list = []
-item_counter = 1
-
-# Loop melalui semua halaman daftar produk
-for page_num in range(1, last_page + 1):
-    list_page_url = f"https://www.hp.com/id-id/shop/laptops-tablets.html?p={page_num}"
-    print(f"\n🔄 Mengakses Halaman Daftar Produk #{page_num}: {list_page_url}")
-    driver.get(list_page_url)
-
-    # TAHAP 1: Kumpulkan semua tautan produk di halaman saat ini
+# Ambil data lewat HTTP dari JSON tertanam (sources/hp_store.py); browser hanya dipakai jika gagal
+USE_HTTP_EXTRACTOR = True
+
+# === BROWSER POOL: BEBERAPA CHROME HEADLESS YANG SUDAH DIPANASKAN ===
+# Setiap browser membuka halaman awal dan menerima cookie sekali, lalu dipakai ulang untuk banyak produk
+# Gambar, font, media & pelacak tidak diunduh; widget Bazaarvoice (rating) tetap dimuat lewat allowlist hp.com
+pool = BrowserPool(warmup=consent_warmup(start_url, "#onetrust-accept-btn-handler"),
+                   block_resources=True, site="hp.com",
+                   user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+
+# Selector halaman detail; semua field & baris spesifikasi diambil dengan satu execute_script
+PRODUCT_FIELDS = {
+    'name': "h1.page-title",
+    'price': {'css': "span.price-wrapper[data-price-amount]", 'attr': "data-price-amount"},
+    'sku': ".product-info-sku .value",
+    'rating': {'css': ".bv_averageRating_component_container .bv_text", 'attr': "textContent"},
+    'reviews': {'css': ".bv_numReviews_component_container .bv_text", 'attr': "textContent"},
+    'description': {'css': ".product.attribute.description .value p", 'all': True},
+}
+PRODUCT_TABLES = {
+    'specs': {'rows': "#specifications .spectable-container .spec-row", 'key': ".spec-title", 'value': ".spec-value"},
+}
+
+
+def scrape_product(driver, url):
+    """Mengambil data detail satu produk; dijalankan paralel oleh browser pool."""
+    print(f"    🔎 Scraping data dari: {url}")
     try:
-        # Tunggu hingga item produk muncul
-        wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "li.item.product a.product-item-link")))
-        product_links_elements = driver.find_elements(By.CSS_SELECTOR, "li.item.product a.product-item-link")
-        product_links = [elem.get_attribute("href") for elem in product_links_elements]
-        print(f"    🔗 Ditemukan {len(product_links)} tautan produk di halaman ini.")
+        # Kembali begitu judul produk ada di DOM (page-load strategy 'eager')
+        open_page(driver, url, "h1.page-title", timeout=10)
     except TimeoutException:
-        print(f"    ⚠️ Tidak ditemukan produk di halaman {page_num}. Melanjutkan...")
-        continue
+        print("    ❌ Gagal memuat halaman detail produk. Melanjutkan ke produk berikutnya.")
+        return None
 
-    # TAHAP 2: Kunjungi setiap tautan untuk mengambil data detail
-    for url in product_links:
-        print(f"    🔎 Scraping data dari: {url}")
+    # Rating & jumlah ulasan disuntikkan Bazaarvoice secara asinkron setelah DOMContentLoaded;
+    # tunggu sebentar saja karena produk tanpa ulasan tidak pernah menampilkan widget ini
+    try:
+        WebDriverWait(driver, 5).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, ".bv_averageRating_component_container .bv_text")))
+    except TimeoutException:
+        pass
+
+    # --- Mulai mengambil data detail (satu round-trip untuk seluruh halaman) ---
+    fields, tables = extract_record(driver, PRODUCT_FIELDS, PRODUCT_TABLES)
+    total_reviews = fields['reviews'].replace("(", "").replace(")", "") if fields['reviews'] else "N/A"
+
+    return {
+        "Product Name": fields['name'] or "N/A",
+        "SKU": fields['sku'] or "N/A",
+        "Price (IDR)": fields['price'] or "N/A",
+        "Rating": fields['rating'] or "N/A",
+        "Total Reviews": total_reviews,
+        "Description": "\n".join(p for p in fields['description'] if p).strip(),
+        # Gabungkan semua baris spesifikasi dengan pemisah '|'
+        "Specifications": " | ".join(f"{title}: {value}" for _, title, value in tables['specs']),
+        "Product URL": url
+    }
+
+
+def scrape_with_browser():
+    """Jalur Selenium (browser pool): daftar produk per halaman lalu detail secara paralel."""
+    with pool.lease() as driver:
+        # Deteksi jumlah halaman terakhir
         try:
-            driver.get(url)
-            # Beri waktu halaman detail untuk memuat sepenuhnya
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "h1.page-title")))
+            last_page_elem = open_page(driver, start_url, "li.Last_list-page a", timeout=10)
+            last_page_url = last_page_elem.get_attribute("href")
+            parsed_url = urlparse(last_page_url)
+            last_page = int(parse_qs(parsed_url.query)['p'][0])
+            print(f"🔢 Halaman terakhir terdeteksi: {last_page}")
         except TimeoutException:
-            print("    ❌ Gagal memuat halaman detail produk. Melanjutkan ke produk berikutnya.")
-            continue
-
-        # --- Mulai mengambil data detail ---
-        try:
-            product_name = driver.find_element(By.CSS_SELECTOR, "h1.page-title").text.strip()
-        except NoSuchElementException:
-            product_name = "N/A"
-
-        try:
-            price_element = driver.find_element(By.CSS_SELECTOR, "span.price-wrapper[data-price-amount]")
-            price = price_element.get_attribute("data-price-amount")
-        except NoSuchElementException:
-            price = "N/A"
-
-        try:
-            sku = driver.find_element(By.CSS_SELECTOR, ".product-info-sku .value").text.strip()
-        except NoSuchElementException:
-            sku = "N/A"
-
-        try:
-            rating = driver.find_element(By.CSS_SELECTOR, ".bv_averageRating_component_container .bv_text").get_attribute("textContent").strip()
-        except NoSuchElementException:
-            rating = "N/A"
-
-        try:
-            total_reviews = driver.find_element(By.CSS_SELECTOR, ".bv_numReviews_component_container .bv_text").get_attribute("textContent").strip().replace("(", "").replace(")", "")
-        except NoSuchElementException:
-            total_reviews = "N/A"
-
-        try:
-            description_elements = driver.find_elements(By.CSS_SELECTOR, ".product.attribute.description .value p")
-            description = "\n".join([p.text for p in description_elements if p.text]).strip()
-        except NoSuchElementException:
-            description = "N/A"
-            
-        try:
-            # Mengambil semua baris spesifikasi
-            spec_rows = driver.find_elements(By.CSS_SELECTOR, "#specifications .spectable-container .spec-row")
-            specs_list = []
-            for row in spec_rows:
-                try:
-                    title = row.find_element(By.CSS_SELECTOR, ".spec-title").text.strip()
-                    value = row.find_element(By.CSS_SELECTOR, ".spec-value").text.strip()
-                    specs_list.append(f"{title}: {value}")
-                except NoSuchElementException:
-                    continue # Lewati jika baris tidak lengkap
-            specifications = " | ".join(specs_list) # Gabungkan dengan pemisah '|'
-        except NoSuchElementException:
-            specifications = "N/A"
-
-        produk_list.append({
-            "No": item_counter,
-            "Product Name": product_name,
-            "SKU": sku,
-            "Price (IDR)": price,
-            "Rating": rating,
-            "Total Reviews": total_reviews,
-            "Description": description,
-            "Specifications": specifications,
-            "Product URL": url
-        })
-        item_counter += 1
+            last_page = 1
+            print("⚠️ Tidak bisa mendeteksi halaman terakhir, default ke 1")
+
+    produk_list = []
+
+    # Loop melalui semua halaman daftar produk
+    for page_num in range(1, last_page + 1):
+        list_page_url = f"https://www.hp.com/id-id/shop/laptops-tablets.html?p={page_num}"
+        print(f"\n🔄 Mengakses Halaman Daftar Produk #{page_num}: {list_page_url}")
+
+        # TAHAP 1: Kumpulkan semua tautan produk di halaman saat ini
+        with pool.lease() as driver:
+            try:
+                # Tunggu hingga item produk muncul
+                open_page(driver, list_page_url, "li.item.product a.product-item-link", timeout=10)
+                product_links_elements = driver.find_elements(By.CSS_SELECTOR, "li.item.product a.product-item-link")
+                product_links = [elem.get_attribute("href") for elem in product_links_elements]
+                print(f"    🔗 Ditemukan {len(product_links)} tautan produk di halaman ini.")
+            except TimeoutException:
+                print(f"    ⚠️ Tidak ditemukan produk di halaman {page_num}. Melanjutkan...")
+                continue
+
+        # TAHAP 2: Kunjungi setiap tautan secara paralel (satu worker per browser di pool)
+        for url, produk in pool.map(scrape_product, product_links):
+            if produk:
+                produk_list.append(produk)
+    return produk_list
+
+
+# === JALUR UTAMA: EKSTRAKTOR HTTP, SELENIUM SEBAGAI CADANGAN ===
+products = crawl_category('laptops') if USE_HTTP_EXTRACTOR else None
+if products is not None:
+    rows = [flat_row(product) for product in products]
+else:
+    print("🔁 Menggunakan Selenium (browser pool) untuk mengambil data...")
+    # Semua Chrome di pool ditutup meskipun crawl berhenti karena error atau Ctrl-C
+    with pool:
+        rows = scrape_with_browser()
+produk_list = [{"No": i, **row} for i, row in enumerate(rows, 1)]
 
 print("\n" + "="*60)
 
@@ -135,7 +135,6 @@ print("\n" + "="*60)
 df = pd.DataFrame(produk_list)
 df.to_csv("daftar_laptop_hp_lengkap.csv", index=False, encoding="utf-8-sig", sep=";")
 print("\n✅ Data lengkap berhasil disimpan ke 'daftar_laptop_hp_lengkap.csv'")
+upsert_into_catalogue('hp', df=df)
 
-# Tutup browser
-driver.quit()
 print("🎉 Proses selesai. Browser telah ditutup.")
\ No newline at end of file
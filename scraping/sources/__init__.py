@@ -0,0 +1 @@
+"""Modul per-situs (GSMArena, dll.) yang dipakai bersama oleh skrip-skrip scraper."""
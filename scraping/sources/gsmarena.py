@@ -0,0 +1,618 @@
+"""
+Engine scraping GSMArena.com: daftar perangkat via HTTP (Selenium hanya sebagai fallback),
+fetch detail paralel, validasi kelas perangkat, checkpoint, mode delta dan CLI.
+
+Contoh (dari folder 'scraping'):
+    python -m sources.gsmarena --target smartphone --brands Samsung Apple --workers 6
+"""
+import argparse
+import os
+import re
+import sqlite3
+import time
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+
+import pandas as pd
+import requests
+
+from common.checkpoint import CrawlCheckpoint
+from common.delta import DeltaTracker
+from common.fetcher import fetch_concurrently
+from common.html_parser import parse_html
+from common.http_cache import enable_cache
+from common.http_session import http_get, set_host_pool_size
+from common.rate_limiter import HostRateLimiter
+from common.row_sink import StreamingRowWriter
+from common.spec_normalize import normalize_specs
+
+# ==============================================================================
+# KONFIGURASI TERPUSAT UNTUK GSMARENA.COM
+# ==============================================================================
+GSMARENA_CONFIG = {
+    'base_url': "https://www.gsmarena.com/",
+    'search_url_template': "https://www.gsmarena.com/results.php3?sQuickSearch=yes&sName={keyword}&iPage={page_num}",
+    'headers': {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36'
+    },
+    'selectors': {
+        'product_list': "div.makers > ul > li > a",
+        'cookie_button': "#onetrust-accept-btn-handler",
+        'phone_name': "h1.specs-phone-name-title",
+        'price_button': 'button[data-spec="price"]',
+        'popularity_fans': ".specs-fans > a",
+        'spec_tables': "#specs-list table",
+        'table_category': "th",
+        'table_row': "tr",
+        'spec_title_cell': "td.ttl",
+        'spec_value_cell': "td.nfo",
+        'pagination_links': 'div.nav-pages > a'
+    },
+    'max_retries': 3,
+    'retry_delay_seconds': 30,
+    'max_workers': 4,  # Jumlah request detail yang berjalan bersamaan
+    'requests_per_second': 1.0,  # Anggaran token bucket per host
+    'burst': 4,  # Jumlah request yang boleh dikirim beruntun sebelum dibatasi
+    'use_http_cache': True,  # Simpan halaman detail di disk; refresh berikutnya cukup 304
+    'write_parquet': False,  # Tulis juga salinan Parquet bertipe (butuh pyarrow) di samping CSV
+    'delta_mode': True,  # Hanya ambil perangkat baru / yang sudah waktunya refresh, lalu tulis changelog
+    'delta_refresh_days': 7,  # Perangkat lama diambil ulang paling lambat setelah sekian hari
+    'screen_size_threshold_inches': 7.0,  # Batas layar antara smartphone (<) dan tablet (>=)
+    # Kelas perangkat per URL yang sudah pernah dilihat, agar perangkat yang tidak cocok tidak diambil lagi.
+    # Nama file dinaikkan versinya setiap aturan `classify_device` berubah agar kelas lama tidak terpakai.
+    'class_cache_file': os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                     '.class_cache', 'gsmarena_v2.sqlite')
+}
+
+FIRST_COLUMNS = ['Brand', 'Device Name', 'Product URL', 'Estimated_Price', 'Popularity_Fans']
+
+# Regex dikompilasi sekali di level modul, bukan di setiap sel tabel
+NON_COLUMN_CHARS = re.compile(r'[^A-Za-z0-9_]+')
+PRICE_PATTERN = re.compile(r'About\s*([\d,.]+\s*\w+)', re.IGNORECASE)
+PAGE_NUMBER_PATTERN = re.compile(r'iPage=(\d+)')
+SCREEN_SIZE_PATTERN = re.compile(r'([\d.]+)\s*inches')
+HINT_SCREEN_SIZE_PATTERN = re.compile(r'([\d.]+)\s*(?:″|"|inch)')
+WEARABLE_OS = ('wear os', 'watchos', 'tizen')
+# OS yang menandai smartphone; perangkat kecil tanpa OS ini (Series 30+, KaiOS, dll.) adalah feature phone
+SMARTPHONE_OS = ('android', 'ios', 'harmonyos')
+# Kolom yang dibaca lebih dulu oleh ekstraktor bertahap untuk menentukan kelas perangkat
+CLASS_SPEC_COLUMNS = ('Display_Size', 'Display_Type', 'Platform_OS')
+CLASS_SPEC_CATEGORIES = ('Display', 'Platform')
+
+
+# ==============================================================================
+# DAFTAR PERANGKAT GSMARENA.COM VIA HTTP (TANPA SELENIUM)
+# ==============================================================================
+
+def fetch_listing_html(config, page_url):
+    """Mengambil HTML statis satu halaman `results.php3`."""
+    # Halaman daftar selalu diambil segar (tanpa cache) agar perangkat baru tetap terdeteksi
+    response = http_get(page_url, headers=config['headers'], use_cache=False)
+    response.raise_for_status()
+    return response.text
+
+
+def parse_listing_page(config, html, hints=None):
+    """
+    Mengambil tautan perangkat dan nomor halaman terakhir dari HTML halaman daftar.
+    Jika `hints` (dict) diberikan, atribut `title` gambar di setiap kartu (misal
+    "... Android tablet. ... Features 11.0″ display ...") disimpan per URL.
+    """
+    root = parse_html(html)
+    links = []
+    for a in root.select(config['selectors']['product_list']):
+        if not a.attr('href'):
+            continue
+        link = requests.compat.urljoin(config['base_url'], a.attr('href'))
+        links.append(link)
+        img = a.select_one('img')
+        if hints is not None and img is not None and img.attr('title'):
+            hints[link] = img.attr('title')
+
+    total_pages = 1
+    for a in root.select(config['selectors']['pagination_links']):
+        match = PAGE_NUMBER_PATTERN.search(a.attr('href', ''))
+        if match:
+            total_pages = max(total_pages, int(match.group(1)))
+    return links, total_pages
+
+
+def get_device_links_http(config, keyword, max_workers=4, rate_limiter=None, hints=None):
+    """
+    Mengumpulkan tautan perangkat dari SEMUA halaman hasil pencarian hanya dengan HTTP.
+    Halaman 2..N diambil secara paralel. Mengembalikan None jika HTML statis halaman
+    pertama tidak memuat daftar produk, sebagai tanda untuk beralih ke Selenium.
+    Petunjuk kelas perangkat dari halaman daftar ditulis ke `hints` jika diberikan.
+    """
+    print(f"📊 Mengambil daftar perangkat '{keyword}' via HTTP...")
+    first_url = config['search_url_template'].format(keyword=keyword, page_num=1)
+    try:
+        if rate_limiter:
+            rate_limiter.wait(first_url)
+        links, total_pages = parse_listing_page(config, fetch_listing_html(config, first_url), hints)
+    except requests.exceptions.RequestException as e:
+        print(f"    ❌ Gagal mengakses halaman pertama: {e}")
+        return None
+
+    if not links:
+        print("    ⚠️ Daftar produk tidak ditemukan di HTML statis.")
+        return None
+    print(f"    ✅ Ditemukan total {total_pages} halaman.")
+
+    page_numbers = {config['search_url_template'].format(keyword=keyword, page_num=n): n
+                    for n in range(2, total_pages + 1)}
+
+    def fetch_page_links(page_url):
+        try:
+            page_links, _ = parse_listing_page(config, fetch_listing_html(config, page_url), hints)
+            return page_links
+        except requests.exceptions.RequestException as e:
+            print(f"        -> Gagal mengambil {page_url}: {e}")
+            return None
+
+    all_links = list(links)
+    results = fetch_concurrently(page_numbers, fetch_page_links, max_workers=max_workers,
+                                 rate_limiter=rate_limiter, max_retries=config.get('max_retries', 3),
+                                 retry_delay_seconds=5)
+    for page_url, page_links in results:
+        if page_links:
+            print(f"    🔗 [HALAMAN {page_numbers[page_url]}/{total_pages}] {len(page_links)} tautan.")
+            all_links.extend(page_links)
+        else:
+            print(f"    ❌ Gagal mengambil halaman {page_numbers[page_url]}. Melewati halaman ini.")
+    return list(dict.fromkeys(all_links))
+
+
+# ==============================================================================
+# PARSING HALAMAN SPESIFIKASI
+# ==============================================================================
+
+@lru_cache(maxsize=4096)
+def normalize_column(category, title):
+    """Membuat nama kolom `{Kategori}_{Judul}`; hasilnya di-memoize karena pasangan yang sama terus berulang."""
+    return f"{NON_COLUMN_CHARS.sub('', category)}_{NON_COLUMN_CHARS.sub('', title)}"
+
+
+def read_class_specs(selectors, tables):
+    """Membaca hanya kolom `CLASS_SPEC_COLUMNS` (ukuran/jenis layar dan OS) dari tabel spesifikasi."""
+    specs = {}
+    for table in tables:
+        category_tag = table.select_one(selectors['table_category'])
+        category = category_tag.text().strip() if category_tag else ''
+        if category not in CLASS_SPEC_CATEGORIES:
+            continue
+        for row in table.select(selectors['table_row']):
+            title_tag = row.select_one(selectors['spec_title_cell'])
+            value_tag = row.select_one(selectors['spec_value_cell'])
+            if title_tag and value_tag:
+                column = normalize_column(category, title_tag.text().strip())
+                if column in CLASS_SPEC_COLUMNS:
+                    specs[column] = value_tag.text().strip()
+    return specs
+
+
+def parse_device_page(config, html, url, name_column="Device Name", backend=None, accept=None):
+    """
+    Mengubah HTML halaman spesifikasi GSMArena menjadi satu dict baris data.
+    Jika `accept(specs)` diberikan, kolom `CLASS_SPEC_COLUMNS` dibaca lebih dulu; perangkat
+    yang ditolak langsung dikembalikan hanya dengan kolom-kolom itu, tanpa parsing tabel lain.
+    """
+    selectors = config['selectors']
+    root = parse_html(html, backend)
+
+    device_data = {"Product URL": url}
+    device_data[name_column] = root.select_one(selectors['phone_name']).text().strip()
+
+    tables = root.select(selectors['spec_tables'])
+    if accept is not None:
+        class_specs = read_class_specs(selectors, tables)
+        if not accept(class_specs):
+            device_data.update(class_specs)
+            return device_data
+
+    price_button = root.select_one(selectors['price_button'])
+    match = PRICE_PATTERN.search(price_button.html()) if price_button else None
+    device_data["Estimated_Price"] = match.group(1).strip() if match else "N/A"
+
+    fans_element = root.select_one(selectors['popularity_fans'])
+    device_data["Popularity_Fans"] = fans_element.text().strip().split('\n')[0] if fans_element else "N/A"
+
+    for table in tables:
+        category_tag = table.select_one(selectors['table_category'])
+        category = category_tag.text().strip() if category_tag else ''
+        for row in table.select(selectors['table_row']):
+            title_tag = row.select_one(selectors['spec_title_cell'])
+            value_tag = row.select_one(selectors['spec_value_cell'])
+            if title_tag and value_tag:
+                device_data[normalize_column(category, title_tag.text().strip())] = value_tag.text().strip()
+    return device_data
+
+
+def scrape_device(config, url, accept=None):
+    """Mengambil halaman detail lalu mem-parsingnya dengan backend parser tercepat yang tersedia."""
+    try:
+        response = http_get(url, headers=config['headers'])
+        response.raise_for_status()
+        return parse_device_page(config, response.text, url, accept=accept)
+    except Exception as e:
+        print(f"        -> Terjadi error saat scraping detail: {e}")
+        return None
+
+
+# ==============================================================================
+# VALIDASI KELAS PERANGKAT
+# ==============================================================================
+
+def get_screen_size(specs):
+    """Ukuran layar dalam inci dari kolom Display_Size, atau None jika tidak bisa dibaca."""
+    match = SCREEN_SIZE_PATTERN.search(specs.get('Display_Size', ''))
+    if not match:
+        return None
+    try:
+        return float(match.group(1))
+    except ValueError:
+        return None
+
+
+def is_wearable(specs):
+    os_spec = specs.get('Platform_OS', '').lower()
+    return any(name in os_spec for name in WEARABLE_OS)
+
+
+def has_smartphone_os(specs):
+    os_spec = specs.get('Platform_OS', '').lower()
+    return any(name in os_spec for name in SMARTPHONE_OS)
+
+
+def is_foldable(specs):
+    return 'foldable' in specs.get('Display_Type', '').lower()
+
+
+def classify_device(specs, threshold_inches=7.0):
+    """
+    Kelas perangkat dari spesifikasinya: 'wearable', 'smartphone', 'feature_phone', 'tablet'
+    atau 'unknown'. Smartphone wajib ber-OS Android/iOS/HarmonyOS; ponsel lipat tetap
+    smartphone meskipun layar dalamnya >= `threshold_inches`.
+    """
+    if not specs:
+        return 'unknown'
+    if is_wearable(specs):
+        return 'wearable'
+    if is_foldable(specs) and has_smartphone_os(specs):
+        return 'smartphone'
+    screen_size = get_screen_size(specs)
+    if screen_size is None:
+        return 'unknown'
+    if screen_size >= threshold_inches:
+        return 'tablet'
+    return 'smartphone' if has_smartphone_os(specs) else 'feature_phone'
+
+
+def classify_listing_hint(hint, threshold_inches=7.0):
+    """Menebak kelas perangkat dari teks `title` kartu di halaman daftar (tanpa membuka detailnya)."""
+    if not hint:
+        return 'unknown'
+    hint = hint.lower()
+    if 'smartwatch' in hint or ' watch' in hint:
+        return 'wearable'
+    # Jenis yang disebut eksplisit didahulukan: ponsel lipat ("Android smartphone ... 7.6″") tetap smartphone
+    if 'feature phone' in hint:
+        return 'feature_phone'
+    if 'tablet' in hint:
+        return 'tablet'
+    if 'smartphone' in hint:
+        return 'smartphone'
+    match = HINT_SCREEN_SIZE_PATTERN.search(hint)
+    if match:
+        try:
+            return 'smartphone' if float(match.group(1)) < threshold_inches else 'tablet'
+        except ValueError:
+            pass
+    return 'unknown'
+
+
+def is_smartphone(specs, max_screen_size_inches=7.0):
+    """Memvalidasi apakah perangkat adalah SMARTPHONE (Android/iOS/HarmonyOS, < 7.0 inci atau lipat)."""
+    return classify_device(specs, max_screen_size_inches) == 'smartphone'
+
+
+def is_tablet(specs, min_screen_size_inches=7.0):
+    """Memvalidasi apakah perangkat adalah TABLET (>= 7.0 inci, bukan smartwatch)."""
+    return classify_device(specs, min_screen_size_inches) == 'tablet'
+
+
+DEVICE_VALIDATORS = {'smartphone': is_smartphone, 'tablet': is_tablet}
+
+
+def classify_devices(df, threshold_inches=7.0):
+    """
+    Versi vektor dari `classify_device` untuk DataFrame katalog (misal hasil
+    `common.spec_normalize.load_catalogue`): satu Series kelas per baris tanpa regex per baris.
+    """
+    if 'Display_Size_inches' not in df.columns:
+        df = normalize_specs(df)
+    size = df['Display_Size_inches'] if 'Display_Size_inches' in df.columns else pd.Series(float('nan'), df.index)
+    os_spec = df['Platform_OS'] if 'Platform_OS' in df.columns else pd.Series('', df.index)
+    os_spec = os_spec.fillna('').str.lower()
+    display_type = df['Display_Type'] if 'Display_Type' in df.columns else pd.Series('', df.index)
+    wearable = os_spec.str.contains('|'.join(WEARABLE_OS), regex=True)
+    smartphone_os = os_spec.str.contains('|'.join(SMARTPHONE_OS), regex=True)
+    foldable = display_type.fillna('').str.lower().str.contains('foldable', regex=False)
+    classes = pd.Series('unknown', index=df.index)
+    classes[size < threshold_inches] = 'feature_phone'
+    classes[(size < threshold_inches) & smartphone_os] = 'smartphone'
+    classes[size >= threshold_inches] = 'tablet'
+    classes[foldable & smartphone_os] = 'smartphone'
+    classes[wearable] = 'wearable'
+    return classes
+
+
+class DeviceClassCache:
+    """Cache SQLite berisi kelas perangkat per URL, diisi setiap kali halaman detail selesai diproses."""
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS device_class (
+                url TEXT PRIMARY KEY,
+                device_class TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )""")
+        self.db.commit()
+
+    def get_many(self, urls):
+        urls = list(urls)
+        found = {}
+        for i in range(0, len(urls), 500):
+            chunk = urls[i:i + 500]
+            query = f"SELECT url, device_class FROM device_class WHERE url IN ({','.join('?' * len(chunk))})"
+            found.update(self.db.execute(query, chunk))
+        return found
+
+    def update(self, classes):
+        now = time.time()
+        self.db.executemany("INSERT OR REPLACE INTO device_class VALUES (?, ?, ?)",
+                            [(url, device_class, now) for url, device_class in classes.items()])
+        self.db.commit()
+
+
+def prefilter_links(device_links, targets, class_cache, hints, threshold_inches):
+    """
+    Membuang URL yang sudah pasti bukan salah satu `targets` sebelum halaman detailnya diambil: pertama
+    dari cache kelas (hasil run sebelumnya), lalu dari petunjuk di halaman daftar.
+    URL yang kelasnya belum diketahui tetap diambil.
+    """
+    known = class_cache.get_many(device_links)
+    kept, skipped = [], {}
+    for url in device_links:
+        device_class = known.get(url) or classify_listing_hint(hints.get(url), threshold_inches)
+        if device_class == 'unknown' or device_class in targets:
+            kept.append(url)
+        else:
+            skipped[device_class] = skipped.get(device_class, 0) + 1
+    if skipped:
+        detail = ', '.join(f"{name}: {count}" for name, count in sorted(skipped.items()))
+        print(f"    🧹 [PRE-FILTER] {sum(skipped.values())} tautan dilewati tanpa dibuka ({detail}).")
+    return kept
+
+
+# ==============================================================================
+# ENGINE: SCRAPING SEMUA BRAND
+# ==============================================================================
+
+def get_device_links(config, brand, rate_limiter, browser, hints=None):
+    """
+    Tautan perangkat satu brand: lewat HTTP, atau lewat Selenium jika HTML statis tidak
+    memuat daftar produk. `browser` adalah dict berisi driver yang dibuat saat pertama dibutuhkan.
+    """
+    device_links = get_device_links_http(config, brand, config['max_workers'], rate_limiter, hints)
+    if device_links is not None:
+        return device_links
+
+    print("    🔁 Beralih ke Selenium untuk mengumpulkan tautan...")
+    from sources import gsmarena_browser
+    if browser.get('driver') is None:
+        browser['driver'] = gsmarena_browser.setup_driver(config)
+    total_pages = gsmarena_browser.get_total_pages(browser['driver'], config, brand)
+    if total_pages == 0:
+        return []
+    return gsmarena_browser.get_all_device_links(browser['driver'], config, brand, total_pages)
+
+
+def open_brand_writer(output_file, write_parquet=False):
+    """Membuka writer streaming untuk CSV satu brand dengan urutan kolom standar."""
+    return StreamingRowWriter(output_file, first_columns=FIRST_COLUMNS, write_parquet=write_parquet,
+                              catalogue_source='gsmarena')
+
+
+def run_gsmarena(brands, targets, config=None, run_name=None):
+    """
+    Menjalankan scraping GSMArena untuk semua `brands` dalam satu kali crawl. Setiap perangkat
+    diambil sekali, divalidasi dengan `is_smartphone`/`is_tablet`, lalu diarahkan ke CSV target
+    yang cocok (`gsmarena_{brand}_{target}_{timestamp}.csv`). `targets` boleh berupa satu nama
+    target atau list, misal ['smartphone', 'tablet']. Mengembalikan rekap berupa dict.
+    """
+    config = config or GSMARENA_CONFIG
+    targets = [targets] if isinstance(targets, str) else list(targets)
+    label = ' + '.join(target.upper() for target in targets)
+    threshold = config['screen_size_threshold_inches']
+    class_cache = DeviceClassCache(config['class_cache_file'])
+    run_name = run_name or "gsmarena"
+
+    def accept(class_specs):
+        # Tahap pertama ekstraksi: hanya perangkat yang (mungkin) cocok yang diparsing lengkap
+        device_class = classify_device(class_specs, threshold)
+        return device_class == 'unknown' or device_class in targets
+
+    # Satu limiter untuk seluruh brand agar anggaran request per host tetap terjaga
+    rate_limiter = HostRateLimiter(config['requests_per_second'], config['burst'])
+    set_host_pool_size(config['base_url'], config['max_workers'])
+    if config['use_http_cache']:
+        enable_cache()
+    # Jurnal checkpoint: run yang terhenti dilanjutkan tanpa mengulang brand/URL yang sudah selesai
+    checkpoint = CrawlCheckpoint(f"{run_name}_{'_'.join(targets)}")
+    # Mode delta per target: tautan listing dibandingkan dengan CSV terakhir per brand
+    deltas = {target: DeltaTracker(f"gsmarena_{target}", 'Product URL', 'Device Name',
+                                   config['delta_mode'], config['delta_refresh_days'])
+              for target in targets}
+    browser = {'driver': None}  # Selenium hanya dinyalakan jika mode HTTP gagal
+    total_scraped_count = 0
+    total_valid_devices = {target: 0 for target in targets}
+
+    try:
+        for brand in brands:
+            if checkpoint.is_scope_done(brand):
+                print(f"\n⏭️  Brand '{brand}' sudah selesai pada run sebelumnya "
+                      f"({checkpoint.scope_output(brand) or 'tanpa file'}). Dilewati.")
+                continue
+            print("\n" + "=" * 80)
+            print(f"🚀 MEMULAI PROSES SCRAPING {label} UNTUK BRAND: {brand.upper()}")
+            print("=" * 80)
+
+            hints = {}
+            device_links = get_device_links(config, brand, rate_limiter, browser, hints)
+            if not device_links:
+                print(f"❌ Tidak ada tautan yang berhasil dikumpulkan untuk '{brand}'. Lanjut ke brand berikutnya.")
+                continue
+
+            print(f"\n✅ [PENGUMPULAN TAUTAN SELESAI] Ditemukan {len(device_links)} link unik untuk '{brand}'.")
+            device_links = prefilter_links(device_links, targets, class_cache, hints, threshold)
+            print("🕵️  Memulai pengambilan detail untuk setiap tautan...")
+
+            # Rencana delta per target; URL yang dibutuhkan salah satu target cukup diambil sekali
+            output_prefixes = {target: f"gsmarena_{brand.replace(' ', '_')}_{target}" for target in targets}
+            plans = {target: deltas[target].plan(brand, output_prefixes[target], device_links) for target in targets}
+            to_fetch = list(dict.fromkeys(url for plan in plans.values() for url in plan.to_fetch))
+            fetch_set = set(to_fetch)
+            # Satu writer streaming per target: baris langsung ditulis ke disk begitu selesai
+            # diparsing. Baris yang tidak di-refresh dibawa dari snapshot terlebih dahulu.
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            sinks = {target: open_brand_writer(f"{output_prefixes[target]}_{timestamp}.csv", config['write_parquet']) for target in targets}
+            for target in targets:
+                sinks[target].write_many(row for url, row in plans[target].carried_rows.items() if url not in fetch_set)
+
+            # URL yang sudah tercatat di checkpoint tidak diambil ulang
+            done_rows = checkpoint.load_rows(brand)
+            pending_links = [url for url in to_fetch if url not in done_rows]
+            if done_rows:
+                print(f"    ♻️  Melanjutkan dari checkpoint: {len(done_rows)} tautan sudah selesai, {len(pending_links)} tersisa.")
+
+            results = fetch_concurrently(
+                pending_links, lambda url: scrape_device(config, url, accept), max_workers=config['max_workers'],
+                rate_limiter=rate_limiter, max_retries=config['max_retries'],
+                retry_delay_seconds=config['retry_delay_seconds'])
+            results = chain(((url, row) for url, row in done_rows.items() if url in fetch_set),
+                            checkpoint.recording(brand, results))
+
+            seen_classes = {}
+            for i, (url, device_data) in enumerate(results):
+                total_scraped_count += 1
+                print(f"\n    [PROSES {i + 1}/{len(to_fetch)}] URL: {url}")
+
+                if not device_data:
+                    print(f"        ❌ [FINAL] Gagal total mengambil data untuk URL setelah {config['max_retries']} percobaan.")
+                    # Perangkat yang ada di snapshot sebelumnya tetap dipertahankan dengan data lamanya
+                    for target in targets:
+                        previous_row = deltas[target].track(plans[target], url, None)
+                        if previous_row:
+                            sinks[target].write(previous_row)
+                    continue
+                for target in targets:
+                    deltas[target].track(plans[target], url, device_data)
+                # Kelas dihitung sekali lalu dipakai untuk semua target (sama dengan `DEVICE_VALIDATORS`)
+                seen_classes[url] = classify_device(device_data, threshold)
+                matched = [target for target in targets if seen_classes[url] == target]
+                if matched:
+                    device_data['Brand'] = brand
+                    for target in matched:
+                        sinks[target].write(device_data)
+                    print(f"        👍 [VALID] '{device_data.get('Device Name', 'N/A')}' adalah {' / '.join(matched)}. Data ditambahkan.")
+                else:
+                    print(f"        🚫 [SKIP] '{device_data.get('Device Name', 'N/A')}' bukan {' / '.join(targets)} atau data tidak lengkap.")
+
+            class_cache.update(seen_classes)
+
+            print("\n" + "-" * 60)
+            print(f"📦 Proses untuk brand '{brand}' selesai. Menyimpan data ke file CSV...")
+            saved_files = []
+            for target in targets:
+                deltas[target].write_changelog(plans[target], sinks[target].iter_rows())
+                saved_count = sinks[target].close()
+                if not saved_count:
+                    print(f"    ⚠️ Tidak ada {target} valid yang ditemukan untuk brand '{brand}'. Tidak ada file CSV yang dibuat.")
+                    continue
+                nama_file_output = sinks[target].output_file
+                saved_files.append(nama_file_output)
+                total_valid_devices[target] += saved_count
+                print(f"    ✅ Data {target} untuk '{brand}' berhasil disimpan ke: '{nama_file_output}'")
+                if sinks[target].parquet_file:
+                    print(f"    ✅ Salinan Parquet bertipe: '{sinks[target].parquet_file}'")
+                print(f"    - Total {target.capitalize()} Disimpan: {saved_count}")
+            # Waktu fetch disimpan bersamaan dengan checkpoint brand, setelah CSV-nya ditulis
+            for target in targets:
+                deltas[target].mark_scope_done(plans[target])
+            checkpoint.mark_scope_done(brand, ', '.join(saved_files) or None)
+            print("-" * 60)
+
+        # Seluruh brand selesai: checkpoint dikosongkan agar run berikutnya dimulai dari awal
+        checkpoint.clear()
+    finally:
+        if browser['driver']:
+            browser['driver'].quit()
+
+    return {'brands': len(brands), 'links_checked': total_scraped_count, 'valid_devices': total_valid_devices}
+
+
+# ==============================================================================
+# CLI NON-INTERAKTIF
+# ==============================================================================
+
+def parse_args(argv=None, default_brands=None, default_target=None):
+    parser = argparse.ArgumentParser(description="Scraper GSMArena.com (smartphone / tablet) per brand.")
+    parser.add_argument('--target', nargs='+', choices=sorted(DEVICE_VALIDATORS),
+                        default=[default_target] if default_target else None, required=default_target is None,
+                        help="Kelas perangkat yang disimpan; beberapa target sekaligus diambil dalam satu crawl, "
+                             "misal: --target smartphone tablet")
+    parser.add_argument('--brands', nargs='+', default=default_brands, required=not default_brands,
+                        help="Daftar brand, misal: --brands Samsung Apple Xiaomi")
+    parser.add_argument('--workers', type=int, default=GSMARENA_CONFIG['max_workers'],
+                        help="Jumlah request detail yang berjalan bersamaan.")
+    parser.add_argument('--rps', type=float, default=GSMARENA_CONFIG['requests_per_second'],
+                        help="Anggaran request per detik per host.")
+    parser.add_argument('--burst', type=int, default=GSMARENA_CONFIG['burst'],
+                        help="Jumlah request beruntun sebelum dibatasi.")
+    parser.add_argument('--full', action='store_true', help="Matikan mode delta (ambil ulang semua perangkat).")
+    parser.add_argument('--no-cache', action='store_true', help="Jangan memakai cache HTTP di disk.")
+    parser.add_argument('--parquet', action='store_true', help="Tulis juga salinan Parquet bertipe (butuh pyarrow).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None, default_brands=None, default_target=None, run_name=None):
+    """Titik masuk CLI; skrip lama di folder 'Gsm Arena' memanggil ini dengan daftar brand masing-masing."""
+    args = parse_args(argv, default_brands, default_target)
+    targets = list(dict.fromkeys(args.target))
+    label = ' + '.join(target.upper() for target in targets)
+    config = dict(GSMARENA_CONFIG, max_workers=args.workers, requests_per_second=args.rps, burst=args.burst,
+                  delta_mode=GSMARENA_CONFIG['delta_mode'] and not args.full,
+                  use_http_cache=GSMARENA_CONFIG['use_http_cache'] and not args.no_cache,
+                  write_parquet=GSMARENA_CONFIG['write_parquet'] or args.parquet)
+
+    print(f"\n✅ Target scraping diatur ke: {label} | Brand: {len(args.brands)} | Worker: {args.workers}\n")
+    summary = run_gsmarena(args.brands, targets, config, run_name)
+
+    print("\n\n" + "=" * 80)
+    print(f"🎉 SELURUH PROSES SCRAPING {label} TELAH SELESAI 🎉")
+    print("=" * 80)
+    print("\nREKAPITULASI TOTAL:")
+    print(f"    - Total Brand Diproses: {summary['brands']}")
+    print(f"    - Total Tautan Diperiksa: {summary['links_checked']}")
+    for target, count in summary['valid_devices'].items():
+        print(f"    - Total {target.capitalize()} Valid Ditemukan & Disimpan: {count}")
+    print("\nSilakan periksa file-file CSV yang telah dibuat di folder Anda.")
+    return summary
+
+
+if __name__ == '__main__':
+    main()
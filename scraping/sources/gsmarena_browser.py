@@ -0,0 +1,84 @@
+"""
+Fallback Selenium untuk mengumpulkan tautan perangkat GSMArena jika HTML statis
+tidak memuat daftar produk. Modul ini hanya di-import saat fallback benar-benar
+dibutuhkan, sehingga mode HTTP tidak memerlukan Selenium terpasang.
+"""
+import random
+import re
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from common.browser_pool import create_driver
+
+
+def setup_driver(config):
+    """Menginisialisasi Selenium WebDriver untuk tugas awal."""
+    print("🔧 Inisialisasi Selenium WebDriver (Headless Mode)...")
+    return create_driver(headless=True, user_agent=config['headers']['User-Agent'], block_resources=True,
+                         site="gsmarena.com")
+
+
+def get_total_pages(driver, config, keyword):
+    """Mengecek halaman pertama untuk menentukan berapa total halaman yang ada."""
+    print(f"📊 Menghitung total halaman untuk brand '{keyword}'...")
+    page_url = config['search_url_template'].format(keyword=keyword, page_num=1)
+    driver.get(page_url)
+    try:
+        try:
+            cookie_button = WebDriverWait(driver, 5).until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, config['selectors']['cookie_button'])))
+            cookie_button.click()
+            time.sleep(1)
+        except TimeoutException:
+            pass
+
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, config['selectors']['product_list'])))
+
+        pagination_elements = driver.find_elements(By.CSS_SELECTOR, config['selectors']['pagination_links'])
+        if not pagination_elements:
+            print("    ➡️ Hanya ditemukan 1 halaman.")
+            return 1
+
+        # Link halaman terakhir biasanya adalah elemen kedua dari belakang
+        last_page_href = pagination_elements[-2].get_attribute('href')
+        match = re.search(r'iPage=(\d+)', last_page_href)
+        if match:
+            total_pages = int(match.group(1))
+            print(f"    ✅ Ditemukan total {total_pages} halaman.")
+            return total_pages
+        print("    ⚠️ Tidak dapat menentukan jumlah halaman, diasumsikan 1.")
+        return 1
+    except TimeoutException:
+        print(f"    ❌ Tidak ada produk atau halaman tidak dapat dimuat untuk '{keyword}'. Total halaman: 0.")
+        return 0
+
+
+def get_all_device_links(driver, config, keyword, total_pages):
+    """Menggunakan Selenium untuk mengumpulkan link dari SEMUA halaman yang teridentifikasi."""
+    all_links = []
+    for page_num in range(1, total_pages + 1):
+        page_url = config['search_url_template'].format(keyword=keyword, page_num=page_num)
+        print(f"\n    [HALAMAN {page_num}/{total_pages}] Mengakses: {page_url}")
+        driver.get(page_url)
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, config['selectors']['product_list'])))
+            product_elements = driver.find_elements(By.CSS_SELECTOR, config['selectors']['product_list'])
+
+            if not product_elements:
+                print(f"        ⚠️ Tidak ada perangkat ditemukan di halaman {page_num}. Melanjutkan...")
+                continue
+
+            page_links = [elem.get_attribute("href") for elem in product_elements]
+            all_links.extend(page_links)
+            print(f"        🔗 Berhasil mengumpulkan {len(page_links)} tautan dari halaman ini.")
+        except TimeoutException:
+            print(f"        ❌ Gagal memuat elemen produk di halaman {page_num}. Melewati halaman ini.")
+            continue
+        time.sleep(random.uniform(1, 3))
+    return list(dict.fromkeys(all_links))
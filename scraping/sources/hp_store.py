@@ -0,0 +1,444 @@
+"""
+Ekstraktor HTTP (tanpa browser) untuk toko resmi HP Indonesia (hp.com/id-id/shop, Magento 2).
+
+Halaman produk Magento sudah memuat datanya sebagai JSON di HTML statis: `application/ld+json`
+(nama, SKU, harga, rating, deskripsi), `text/x-magento-init` dan atribut `data-mage-init`
+(priceConfig, ID produk), serta tabel spesifikasi yang dirender server. Semua itu diparsing
+sekaligus dari satu response, tanpa WebDriver round-trip per elemen. Daftar produk diambil
+dari endpoint katalog Magento `products-render-info` (XHR yang sama dengan widget daftar
+produk) jika tersedia, atau dari HTML halaman kategori; halaman daftar dan detail diambil paralel.
+
+Contoh (dari folder 'scraping'):
+    python -m sources.hp_store --category victus --workers 8
+"""
+import argparse
+import json
+import math
+import re
+from datetime import datetime
+from urllib.parse import parse_qs, urljoin, urlparse
+
+import requests
+
+from common.fetcher import fetch_concurrently
+from common.html_parser import parse_html
+from common.http_cache import enable_cache
+from common.http_session import http_get, set_host_pool_size
+from common.rate_limiter import HostRateLimiter
+from common.row_sink import StreamingRowWriter
+
+# ==============================================================================
+# KONFIGURASI TERPUSAT UNTUK HP.COM (MAGENTO)
+# ==============================================================================
+HP_STORE_CONFIG = {
+    'base_url': "https://www.hp.com/id-id/shop/",
+    'categories': {
+        'laptops': "laptops-tablets.html",  # Daftar utama main.py
+        'victus': "laptops-tablets/personal-laptops/victus-laptops.html",  # Kategori Victus.py
+    },
+    'headers': {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36',
+        'Accept-Language': 'id-ID,id;q=0.9,en;q=0.8'
+    },
+    # Endpoint katalog Magento (anonim); dipakai hanya jika ID kategori & toko ada di JSON halaman
+    'render_api_url': "{base_url}rest/V1/products-render-info",
+    'use_render_api': True,
+    'api_page_size': 100,
+    'product_list_limit': 36,  # Produk per halaman kategori HTML (parameter standar Magento)
+    'selectors': {
+        'product_card': "li.item.product",
+        'product_link': "a.product-item-link",
+        'pagination_links': "li.Last_list-page a, .pages-items a.page",
+        'product_name': "h1.page-title",
+        'price': "span.price-wrapper[data-price-amount]",
+        'sku': ".product-info-sku .value",
+        'description': ".product.attribute.description .value p",
+        'spec_rows': "#specifications .spectable-container .spec-row",
+        'spec_title': ".spec-title",
+        'spec_value': ".spec-value",
+        'attribute_rows': "table.additional-attributes tbody tr",
+        'attribute_label': "th.col.label",
+        'attribute_value': "td.col.data",
+        'json_scripts': 'script[type="application/ld+json"], script[type="text/x-magento-init"]',
+        'mage_init': "[data-mage-init]",
+    },
+    'max_retries': 3,
+    'retry_delay_seconds': 10,
+    'max_workers': 8,  # Jumlah request detail yang berjalan bersamaan
+    'requests_per_second': 4.0,  # Anggaran token bucket per host
+    'burst': 8,
+    'use_http_cache': True  # Halaman detail disimpan di disk; refresh berikutnya cukup 304
+}
+
+NON_DIGITS = re.compile(r'[^\d]')
+
+
+# ==============================================================================
+# PAYLOAD JSON TERTANAM
+# ==============================================================================
+
+def json_payloads(root, selectors):
+    """Semua blob JSON di halaman: ld+json, x-magento-init dan atribut data-mage-init."""
+    raw = [script.text() for script in root.select(selectors['json_scripts'])]
+    raw += [node.attr('data-mage-init') for node in root.select(selectors['mage_init'])]
+    payloads = []
+    for text in raw:
+        try:
+            payloads.append(json.loads(text))
+        except (TypeError, ValueError):
+            continue
+    return payloads
+
+
+def find_values(obj, keys):
+    """Menelusuri JSON bersarang dan menghasilkan (yield) setiap nilai dengan key di `keys`."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key in keys:
+                yield value
+            yield from find_values(value, keys)
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from find_values(item, keys)
+
+
+def first_value(payloads, *keys):
+    return next((value for value in find_values(payloads, set(keys)) if value not in (None, '', [], {})), None)
+
+
+def find_ld_product(payloads):
+    """Objek schema.org `Product` pertama (juga di dalam list atau `@graph`)."""
+    stack = list(payloads)
+    while stack:
+        obj = stack.pop(0)
+        if isinstance(obj, list):
+            stack.extend(obj)
+        elif isinstance(obj, dict):
+            types = obj.get('@type')
+            if types == 'Product' or (isinstance(types, list) and 'Product' in types):
+                return obj
+            stack.extend(obj.get('@graph', []))
+    return {}
+
+
+def format_price(value):
+    """Harga dari JSON/atribut ('21999000.00', 21999000) menjadi string angka bulat."""
+    if value in (None, ''):
+        return None
+    try:
+        return str(int(round(float(value))))
+    except (TypeError, ValueError):
+        digits = NON_DIGITS.sub('', str(value).split(',')[0])
+        return digits or None
+
+
+# ==============================================================================
+# PARSING HALAMAN PRODUK
+# ==============================================================================
+
+def read_spec_rows(root, rows_css, title_css, value_css):
+    specs = {}
+    for row in root.select(rows_css):
+        title_tag, value_tag = row.select_one(title_css), row.select_one(value_css)
+        if title_tag and value_tag:
+            title, value = title_tag.text().strip(), value_tag.text().strip()
+            if title and value:
+                specs[title] = value
+    return specs
+
+
+def parse_product_page(config, html, url):
+    """
+    Mengubah HTML halaman produk HP menjadi dict produk: name, sku, price, rating, reviews,
+    description dan specs. JSON tertanam diutamakan; elemen HTML hanya dipakai sebagai cadangan.
+    """
+    selectors = config['selectors']
+    root = parse_html(html)
+    payloads = json_payloads(root, selectors)
+    ld = find_ld_product(payloads)
+
+    offers = ld.get('offers') or {}
+    if isinstance(offers, list):
+        offers = offers[0] if offers else {}
+    rating = ld.get('aggregateRating') or {}
+    name_tag = root.select_one(selectors['product_name'])
+    sku_tag = root.select_one(selectors['sku'])
+    price_tag = root.select_one(selectors['price'])
+
+    price = format_price(offers.get('price') or offers.get('lowPrice'))
+    if price is None and price_tag is not None:
+        price = format_price(price_tag.attr('data-price-amount'))
+    if price is None:
+        # priceConfig Magento: {"prices": {"finalPrice": {"amount": ...}}}
+        final_price = first_value(payloads, 'finalPrice', 'final_price')
+        price = format_price(final_price.get('amount') if isinstance(final_price, dict) else final_price)
+
+    description = ld.get('description')
+    if not description:
+        paragraphs = [p.text().strip() for p in root.select(selectors['description'])]
+        description = "\n".join(p for p in paragraphs if p)
+
+    # Spesifikasi: properti schema.org, tabel ringkas (#specifications) dan tabel lengkap (additional-attributes)
+    specs = {prop['name']: str(prop['value']) for prop in ld.get('additionalProperty', [])
+             if isinstance(prop, dict) and prop.get('name') and prop.get('value') not in (None, '')}
+    specs.update(read_spec_rows(root, selectors['spec_rows'], selectors['spec_title'], selectors['spec_value']))
+    specs.update(read_spec_rows(root, selectors['attribute_rows'], selectors['attribute_label'],
+                                selectors['attribute_value']))
+
+    return {
+        'name': ld.get('name') or (name_tag.text().strip() if name_tag else None),
+        'sku': ld.get('sku') or (sku_tag.text().strip() if sku_tag else None) or first_value(payloads, 'sku'),
+        'price': price,
+        'rating': rating.get('ratingValue'),
+        'reviews': rating.get('reviewCount') or rating.get('ratingCount'),
+        'description': description or None,
+        'specs': specs,
+        'url': url,
+    }
+
+
+def scrape_product(config, url):
+    try:
+        response = http_get(url, headers=config['headers'])
+        response.raise_for_status()
+        return parse_product_page(config, response.text, url)
+    except Exception as e:
+        print(f"        -> Terjadi error saat scraping detail: {e}")
+        return None
+
+
+# ==============================================================================
+# DAFTAR PRODUK: XHR KATALOG MAGENTO ATAU HTML KATEGORI
+# ==============================================================================
+
+def category_url(config, category):
+    """Nama kategori di CONFIG ('laptops', 'victus') atau URL kategori lengkap."""
+    if category in config['categories']:
+        return urljoin(config['base_url'], config['categories'][category])
+    return category
+
+
+def listing_page_url(config, url, page_num):
+    return f"{url}?p={page_num}&product_list_limit={config['product_list_limit']}"
+
+
+def parse_listing_page(config, html, base_url):
+    """
+    Kartu produk (URL -> {'name', 'price'}) dan nomor halaman terakhir dari HTML kategori,
+    plus payload JSON halaman untuk menemukan parameter XHR katalog.
+    """
+    selectors = config['selectors']
+    root = parse_html(html)
+    cards = {}
+    for card in root.select(selectors['product_card']):
+        link = card.select_one(selectors['product_link'])
+        if link is None or not link.attr('href'):
+            continue
+        price_tag = card.select_one(selectors['price'])
+        cards[urljoin(base_url, link.attr('href'))] = {
+            'name': link.text().strip(),
+            'price': format_price(price_tag.attr('data-price-amount')) if price_tag else None,
+        }
+    total_pages = 1
+    for a in root.select(selectors['pagination_links']):
+        page = parse_qs(urlparse(a.attr('href', '')).query).get('p')
+        if page and page[0].isdigit():
+            total_pages = max(total_pages, int(page[0]))
+    return cards, total_pages, json_payloads(root, selectors)
+
+
+def fetch_text(config, url, use_cache=False):
+    response = http_get(url, headers=config['headers'], use_cache=use_cache)
+    response.raise_for_status()
+    return response.text
+
+
+def render_api_params(payloads):
+    """ID kategori & toko (dan mata uang) dari JSON halaman kategori; None jika tidak lengkap."""
+    category_id = first_value(payloads, 'category_id', 'categoryId', 'currentCategoryId')
+    store_id = first_value(payloads, 'store_id', 'storeId')
+    if category_id is None or store_id is None:
+        return None
+    return {'category_id': category_id, 'store_id': store_id,
+            'currency': first_value(payloads, 'currencyCode', 'currency_code', 'baseCurrencyCode') or 'IDR'}
+
+
+def render_api_url(config, params, page_num):
+    prefix = "searchCriteria[filter_groups][0][filters][0]"
+    query = (f"{prefix}[field]=category_id&{prefix}[value]={params['category_id']}&{prefix}[condition_type]=eq"
+             f"&searchCriteria[pageSize]={config['api_page_size']}&searchCriteria[currentPage]={page_num}"
+             f"&storeId={params['store_id']}&currencyCode={params['currency']}")
+    return f"{config['render_api_url'].format(base_url=config['base_url'])}?{query}"
+
+
+def parse_render_items(data, base_url):
+    return {urljoin(base_url, item['url']): {'name': item.get('name'),
+                                             'price': format_price((item.get('price_info') or {}).get('final_price'))}
+            for item in data.get('items', []) if item.get('url')}
+
+
+def get_listing_from_api(config, params, rate_limiter):
+    """Semua produk kategori dari XHR `products-render-info`; None jika endpoint tidak tersedia."""
+    first_url = render_api_url(config, params, 1)
+    try:
+        if rate_limiter:
+            rate_limiter.wait(first_url)
+        data = json.loads(fetch_text(config, first_url))
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"    ℹ️ XHR katalog tidak tersedia ({e}); memakai HTML halaman kategori.")
+        return None
+    products = parse_render_items(data, config['base_url'])
+    total_pages = math.ceil(data.get('total_count', len(products)) / config['api_page_size'])
+    print(f"    ✅ XHR katalog: {data.get('total_count', len(products))} produk, {total_pages} halaman API.")
+
+    def fetch_api_page(url):
+        try:
+            return parse_render_items(json.loads(fetch_text(config, url)), config['base_url'])
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"        -> Gagal mengambil {url}: {e}")
+            return None
+
+    page_urls = [render_api_url(config, params, n) for n in range(2, total_pages + 1)]
+    for _, page_products in fetch_concurrently(page_urls, fetch_api_page, max_workers=config['max_workers'],
+                                               rate_limiter=rate_limiter, max_retries=config['max_retries'],
+                                               retry_delay_seconds=5):
+        if page_products is None:
+            return None  # Daftar tidak lengkap: lebih aman memakai HTML kategori
+        products.update(page_products)
+    return products
+
+
+def get_listing(config, url, rate_limiter):
+    """
+    Semua kartu produk satu kategori. Mengembalikan None jika HTML statis halaman pertama tidak
+    memuat produk (misal diblokir), sebagai tanda untuk beralih ke Selenium.
+    """
+    print(f"📊 Mengambil daftar produk HP via HTTP: {url}")
+    first_url = listing_page_url(config, url, 1)
+    try:
+        if rate_limiter:
+            rate_limiter.wait(first_url)
+        cards, total_pages, payloads = parse_listing_page(config, fetch_text(config, first_url), config['base_url'])
+    except requests.exceptions.RequestException as e:
+        print(f"    ❌ Gagal mengakses halaman kategori: {e}")
+        return None
+    if not cards:
+        print("    ⚠️ Kartu produk tidak ditemukan di HTML statis.")
+        return None
+
+    params = render_api_params(payloads) if config['use_render_api'] else None
+    if params:
+        products = get_listing_from_api(config, params, rate_limiter)
+        if products:
+            return products
+
+    print(f"    ✅ Ditemukan total {total_pages} halaman kategori.")
+    page_urls = [listing_page_url(config, url, n) for n in range(2, total_pages + 1)]
+
+    def fetch_page_cards(page_url):
+        try:
+            return parse_listing_page(config, fetch_text(config, page_url), config['base_url'])[0]
+        except requests.exceptions.RequestException as e:
+            print(f"        -> Gagal mengambil {page_url}: {e}")
+            return None
+
+    for page_url, page_cards in fetch_concurrently(page_urls, fetch_page_cards, max_workers=config['max_workers'],
+                                                   rate_limiter=rate_limiter, max_retries=config['max_retries'],
+                                                   retry_delay_seconds=5):
+        if page_cards:
+            cards.update(page_cards)
+        else:
+            print(f"    ❌ Gagal mengambil {page_url}. Melewati halaman ini.")
+    return cards
+
+
+# ==============================================================================
+# ENGINE
+# ==============================================================================
+
+def crawl_category(category, config=None):
+    """
+    Mengambil semua produk satu kategori HP tanpa browser. Menghasilkan list dict produk
+    (lihat `parse_product_page`) sesuai urutan daftar, atau None jika perlu fallback Selenium
+    (daftar tidak terbaca, atau semua halaman detail gagal diambil).
+    """
+    config = config or HP_STORE_CONFIG
+    rate_limiter = HostRateLimiter(config['requests_per_second'], config['burst'])
+    set_host_pool_size(config['base_url'], config['max_workers'])
+    if config['use_http_cache']:
+        enable_cache()
+
+    listing = get_listing(config, category_url(config, category), rate_limiter)
+    if listing is None:
+        return None
+    print(f"🕵️  Mengambil {len(listing)} halaman produk secara paralel ({config['max_workers']} worker)...")
+    products = {}
+    results = fetch_concurrently(list(listing), lambda url: scrape_product(config, url),
+                                 max_workers=config['max_workers'], rate_limiter=rate_limiter,
+                                 max_retries=config['max_retries'], retry_delay_seconds=config['retry_delay_seconds'])
+    for i, (url, product) in enumerate(results, 1):
+        if not product:
+            print(f"    ❌ [{i}/{len(listing)}] Gagal mengambil {url}")
+            continue
+        # Nama/harga dari kartu daftar mengisi data yang kosong di halaman detail
+        product['name'] = product['name'] or listing[url]['name']
+        product['price'] = product['price'] or listing[url]['price']
+        products[url] = product
+        print(f"    👍 [{i}/{len(listing)}] {product['name']}")
+    if listing and not products:
+        # Daftar terbaca tetapi tidak satu pun halaman detail bisa diparsing: serahkan ke Selenium
+        print("    ⚠️ Tidak ada halaman produk yang berhasil diambil via HTTP.")
+        return None
+    return [products[url] for url in listing if url in products]
+
+
+def flat_row(product):
+    """Baris format `main.py`: spesifikasi digabung menjadi satu kolom 'Judul: Nilai | ...'."""
+    return {
+        "Product Name": product['name'] or "N/A",
+        "SKU": product['sku'] or "N/A",
+        "Price (IDR)": product['price'] or "N/A",
+        "Rating": product['rating'] or "N/A",
+        "Total Reviews": product['reviews'] or "N/A",
+        "Description": product['description'] or "N/A",
+        "Specifications": " | ".join(f"{title}: {value}" for title, value in product['specs'].items()) or "N/A",
+        "Product URL": product['url']
+    }
+
+
+def wide_row(product):
+    """Baris format `Victus.py`: satu kolom per judul spesifikasi."""
+    return {"URL": product['url'], "Nama Produk": product['name'] or "N/A", "Harga": product['price'] or "N/A",
+            "SKU": product['sku'] or "N/A", **product['specs']}
+
+
+# ==============================================================================
+# CLI NON-INTERAKTIF
+# ==============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ekstraktor HTTP toko resmi HP Indonesia (tanpa browser).")
+    parser.add_argument('--category', default='laptops',
+                        help=f"Kategori ({', '.join(HP_STORE_CONFIG['categories'])}) atau URL kategori lengkap.")
+    parser.add_argument('--workers', type=int, default=HP_STORE_CONFIG['max_workers'])
+    parser.add_argument('--rps', type=float, default=HP_STORE_CONFIG['requests_per_second'])
+    parser.add_argument('--no-cache', action='store_true', help="Jangan memakai cache HTTP di disk.")
+    args = parser.parse_args(argv)
+    config = dict(HP_STORE_CONFIG, max_workers=args.workers, requests_per_second=args.rps,
+                  use_http_cache=HP_STORE_CONFIG['use_http_cache'] and not args.no_cache)
+
+    products = crawl_category(args.category, config)
+    if products is None:
+        print("❌ Kategori tidak bisa diambil via HTTP. Gunakan main.py / Victus.py (Selenium).")
+        return None
+    name = args.category if args.category in config['categories'] else 'kategori'
+    writer = StreamingRowWriter(f"hp_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                                first_columns=['Nama Produk', 'Harga', 'URL'], catalogue_source='hp')
+    writer.write_many(wide_row(product) for product in products)
+    if writer.close():
+        print(f"✅ {len(writer)} produk disimpan ke '{writer.output_file}'")
+    return products
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,250 @@
+"""
+Crawler HTTP (tanpa browser) untuk katalog Pricebook.co.id.
+
+Semua href kartu produk dari setiap halaman daftar (`?page=N`) dikumpulkan lebih dulu, lalu
+halaman detail diambil langsung lewat URL-nya secara paralel. Tidak ada klik kartu lalu
+`driver.back()` (dua kali muat halaman per produk), dan seluruh katalog tercakup, bukan hanya
+halaman pertama. URL yang detailnya tidak bisa diparsing dari HTML statis dikembalikan
+terpisah agar bisa diambil dengan browser pool (`pricebook.py`).
+
+Contoh (dari folder 'scraping'):
+    python -m sources.pricebook --category smartphone --workers 8
+"""
+import argparse
+from datetime import datetime
+from urllib.parse import parse_qs, urljoin, urlparse
+
+import requests
+
+from common.fetcher import fetch_concurrently
+from common.html_parser import parse_html
+from common.http_cache import enable_cache
+from common.http_session import http_get, set_host_pool_size
+from common.rate_limiter import HostRateLimiter
+from common.row_sink import StreamingRowWriter
+
+# ==============================================================================
+# KONFIGURASI TERPUSAT UNTUK PRICEBOOK.CO.ID
+# ==============================================================================
+PRICEBOOK_CONFIG = {
+    'base_url': "https://www.pricebook.co.id/",
+    'category': "smartphone",
+    'headers': {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36',
+        'Accept-Language': 'id-ID,id;q=0.9,en;q=0.8'
+    },
+    'selectors': {
+        'product_card': "div.pr-card-default > a",
+        'pagination_links': "a[href*='page=']",
+        'product_name': "h1.page-title__title",
+        'price': "div.pr-price-item__price",
+        'spec_rows': "#spec tr",
+        'spec_cells': "th, td",
+        'description': "div.read-more__content",
+    },
+    'max_pages': 200,  # Batas aman jika jumlah halaman tidak terbaca dari pagination
+    'max_retries': 3,
+    'retry_delay_seconds': 10,
+    'max_workers': 8,  # Jumlah request detail yang berjalan bersamaan
+    'requests_per_second': 4.0,  # Anggaran token bucket per host
+    'burst': 8,
+    'use_http_cache': True  # Halaman detail disimpan di disk; refresh berikutnya cukup 304
+}
+
+
+# Penanda halaman detail yang dirender JavaScript (bernilai truthy agar tidak diulang oleh fetcher)
+NEEDS_BROWSER = 'needs_browser'
+
+
+def clean_text(text):
+    return " ".join(text.split()) if text else ""
+
+
+# ==============================================================================
+# HALAMAN DAFTAR
+# ==============================================================================
+
+def listing_page_url(config, page_num, category=None):
+    url = urljoin(config['base_url'], category or config['category'])
+    return url if page_num == 1 else f"{url}?page={page_num}"
+
+
+def parse_listing_page(config, html):
+    """Href kartu produk (urutan tampil) dan nomor halaman terbesar di pagination."""
+    selectors = config['selectors']
+    root = parse_html(html)
+    links = [urljoin(config['base_url'], a.attr('href')) for a in root.select(selectors['product_card'])
+             if a.attr('href')]
+    last_page = 1
+    for a in root.select(selectors['pagination_links']):
+        page = parse_qs(urlparse(a.attr('href', '')).query).get('page')
+        if page and page[0].isdigit():
+            last_page = max(last_page, int(page[0]))
+    return list(dict.fromkeys(links)), last_page
+
+
+def fetch_listing_page(config, url):
+    try:
+        response = http_get(url, headers=config['headers'], use_cache=False)
+        response.raise_for_status()
+        return parse_listing_page(config, response.text)
+    except requests.exceptions.RequestException as e:
+        print(f"        -> Gagal mengambil {url}: {e}")
+        return None
+
+
+def harvest_links(config, rate_limiter, category=None):
+    """
+    Semua href produk di semua halaman daftar. Halaman 2..N yang disebut pagination diambil
+    paralel; karena pagination bisa hanya menampilkan jendela halaman ("1 2 3 4 5 ›"),
+    halaman setelahnya dibaca berurutan sampai tidak ada kartu baru. Mengembalikan None jika
+    halaman pertama tidak memuat kartu (fallback Selenium).
+    """
+    first_url = listing_page_url(config, 1, category)
+    print(f"📊 Mengumpulkan tautan produk Pricebook via HTTP: {first_url}")
+    rate_limiter.wait(first_url)
+    first = fetch_listing_page(config, first_url)
+    if not first or not first[0]:
+        print("    ⚠️ Kartu produk tidak ditemukan di HTML statis.")
+        return None
+    links, last_page = first
+    pages = {1: links}
+
+    last_page = min(last_page, config['max_pages'])
+    if last_page > 1:
+        print(f"    ✅ Pagination menampilkan {last_page} halaman daftar.")
+        page_urls = {listing_page_url(config, n, category): n for n in range(2, last_page + 1)}
+        for url, result in fetch_concurrently(list(page_urls), lambda url: fetch_listing_page(config, url),
+                                              max_workers=config['max_workers'], rate_limiter=rate_limiter,
+                                              max_retries=config['max_retries'], retry_delay_seconds=5):
+            if result:
+                pages[page_urls[url]] = result[0]
+            else:
+                print(f"    ❌ Gagal mengambil {url}. Melewati halaman ini.")
+
+    seen = {link for page_links in pages.values() for link in page_links}
+    for page_num in range(last_page + 1, config['max_pages'] + 1):
+        url = listing_page_url(config, page_num, category)
+        rate_limiter.wait(url)
+        result = fetch_listing_page(config, url)
+        new_links = [link for link in (result[0] if result else []) if link not in seen]
+        if not new_links:
+            break
+        pages[page_num] = new_links
+        seen.update(new_links)
+    print(f"    ✅ Ditemukan total {max(pages)} halaman daftar.")
+    return list(dict.fromkeys(link for n in sorted(pages) for link in pages[n]))
+
+
+# ==============================================================================
+# HALAMAN DETAIL
+# ==============================================================================
+
+def parse_detail_page(config, html, url):
+    """
+    Baris produk (kolom sama dengan `pricebook.py`) dari HTML halaman detail, atau None jika
+    nama produk tidak ada di HTML statis. Deskripsi yang terlipat ("Baca selengkapnya") sudah
+    ada utuh di HTML, jadi tidak perlu mengklik tombolnya.
+    """
+    selectors = config['selectors']
+    root = parse_html(html)
+    name_tag = root.select_one(selectors['product_name'])
+    if name_tag is None or not clean_text(name_tag.text()):
+        return None
+    price_tag = root.select_one(selectors['price'])
+    description_tag = root.select_one(selectors['description'])
+    spec_lines = []
+    for row in root.select(selectors['spec_rows']):
+        cells = [clean_text(cell.text()) for cell in row.select(selectors['spec_cells'])]
+        cells = [cell for cell in cells if cell]
+        if cells:
+            spec_lines.append(": ".join(cells))
+    return {
+        "Nama Produk": clean_text(name_tag.text()),
+        "Harga": clean_text(price_tag.text()) if price_tag else "N/A",
+        "Link Produk": url,
+        "Spesifikasi": "\n".join(spec_lines) or "N/A",
+        "Deskripsi": description_tag.text().strip() if description_tag else "N/A"
+    }
+
+
+def scrape_detail(config, url):
+    try:
+        response = http_get(url, headers=config['headers'])
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"        -> Terjadi error saat scraping detail: {e}")
+        return None
+    # Retry tidak membantu halaman yang dirender JavaScript; cukup ditandai untuk browser pool
+    return parse_detail_page(config, response.text, url) or NEEDS_BROWSER
+
+
+# ==============================================================================
+# ENGINE
+# ==============================================================================
+
+def crawl_catalogue(config=None, category=None):
+    """
+    Mengambil seluruh katalog satu kategori. Mengembalikan (links, rows, needs_browser): semua
+    href sesuai urutan daftar, baris produk yang berhasil via HTTP, dan URL yang perlu diambil
+    dengan browser. Mengembalikan None jika daftar produk tidak bisa diambil via HTTP.
+    """
+    config = config or PRICEBOOK_CONFIG
+    rate_limiter = HostRateLimiter(config['requests_per_second'], config['burst'])
+    set_host_pool_size(config['base_url'], config['max_workers'])
+    if config['use_http_cache']:
+        enable_cache()
+
+    links = harvest_links(config, rate_limiter, category)
+    if links is None:
+        return None
+    print(f"🕵️  Mengambil {len(links)} halaman produk secara paralel ({config['max_workers']} worker)...")
+    rows, needs_browser = {}, []
+    results = fetch_concurrently(links, lambda url: scrape_detail(config, url), max_workers=config['max_workers'],
+                                 rate_limiter=rate_limiter, max_retries=config['max_retries'],
+                                 retry_delay_seconds=config['retry_delay_seconds'])
+    for i, (url, row) in enumerate(results, 1):
+        if isinstance(row, dict):
+            rows[url] = row
+            print(f"    👍 [{i}/{len(links)}] {row['Nama Produk']}")
+        else:
+            needs_browser.append(url)
+            print(f"    ❌ [{i}/{len(links)}] Gagal mengambil {url} via HTTP")
+    return links, [rows[url] for url in links if url in rows], needs_browser
+
+
+# ==============================================================================
+# CLI NON-INTERAKTIF
+# ==============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Crawler HTTP katalog Pricebook.co.id (tanpa browser).")
+    parser.add_argument('--category', default=PRICEBOOK_CONFIG['category'],
+                        help="Path kategori, misal 'smartphone' atau 'laptop'.")
+    parser.add_argument('--workers', type=int, default=PRICEBOOK_CONFIG['max_workers'])
+    parser.add_argument('--rps', type=float, default=PRICEBOOK_CONFIG['requests_per_second'])
+    parser.add_argument('--base-url', default=PRICEBOOK_CONFIG['base_url'])
+    parser.add_argument('--no-cache', action='store_true', help="Jangan memakai cache HTTP di disk.")
+    args = parser.parse_args(argv)
+    config = dict(PRICEBOOK_CONFIG, max_workers=args.workers, requests_per_second=args.rps,
+                  base_url=args.base_url.rstrip('/') + '/',
+                  use_http_cache=PRICEBOOK_CONFIG['use_http_cache'] and not args.no_cache)
+
+    result = crawl_catalogue(config, args.category)
+    if result is None:
+        print("❌ Daftar produk tidak bisa diambil via HTTP. Gunakan pricebook.py (Selenium).")
+        return None
+    links, rows, needs_browser = result
+    if needs_browser:
+        print(f"    ⚠️ {len(needs_browser)} produk perlu diambil dengan browser (pricebook.py).")
+    slug = args.category.strip('/').replace('/', '_')
+    writer = StreamingRowWriter(f"pricebook_{slug}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                                first_columns=['Nama Produk', 'Harga', 'Link Produk'], catalogue_source='pricebook')
+    writer.write_many(rows)
+    if writer.close():
+        print(f"✅ {len(writer)} dari {len(links)} produk disimpan ke '{writer.output_file}'")
+    return rows
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,293 @@
+"""
+Sumber Shopee lewat API JSON situsnya (tanpa browser): `search_items` untuk daftar hasil
+pencarian dan `item/get` untuk detail produk, keduanya diambil paralel dengan token bucket.
+
+Harga, jumlah terjual, rating dan atribut spesifikasi dikembalikan sebagai field terstruktur
+(angka, bukan teks dari class CSS yang diacak seperti `div._3_N7-6`). Harga di API Shopee
+dikalikan 100.000 dan dibagi kembali di sini. Shopee memakai pengecekan anti-bot; jika API
+menolak request (error/403), isi cookie sesi browser di `SHOPEE_COOKIE` atau gunakan jalur
+Selenium di `shopee.py`. Untuk uji lokal ada server fixture `sources.shopee_fixture`.
+
+Contoh (dari folder 'scraping'):
+    python -m sources.shopee_api --keyword "laptop hp" --pages 5
+    python -m sources.shopee_api --fixtures --synthetic 600 --pages 10
+"""
+import argparse
+import math
+import os
+import re
+import time
+from datetime import datetime
+from urllib.parse import quote, urlencode
+
+import requests
+
+from common.fetcher import fetch_concurrently
+from common.http_session import http_get, set_host_pool_size
+from common.rate_limiter import HostRateLimiter
+from common.row_sink import StreamingRowWriter
+
+# ==============================================================================
+# KONFIGURASI TERPUSAT UNTUK API SHOPEE
+# ==============================================================================
+SHOPEE_API_CONFIG = {
+    'base_url': "https://shopee.co.id",
+    'search_path': "/api/v4/search/search_items",
+    'item_path': "/api/v4/item/get",
+    'search_params': {'by': 'relevancy', 'order': 'desc', 'page_type': 'search',
+                      'scenario': 'PAGE_GLOBAL_SEARCH', 'version': 2},
+    'page_size': 60,  # Jumlah item per halaman search_items (sama dengan situs)
+    'max_pages': 5,
+    'price_divisor': 100000,  # Harga API = harga rupiah x 100.000
+    'headers': {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36',
+        'Accept': 'application/json',
+        'X-API-Source': 'pc',
+        'X-Shopee-Language': 'id',
+        'X-Requested-With': 'XMLHttpRequest',
+    },
+    'cookie_env': 'SHOPEE_COOKIE',  # Cookie sesi browser (opsional), dikirim apa adanya
+    'fetch_details': True,  # False: cukup data search_items (tanpa deskripsi & atribut)
+    'max_retries': 3,
+    'retry_delay_seconds': 5,
+    'max_workers': 8,
+    'requests_per_second': 5.0,  # Anggaran token bucket per host
+    'burst': 10,
+}
+
+
+# ==============================================================================
+# REQUEST JSON
+# ==============================================================================
+
+def request_headers(config, keyword=None):
+    headers = dict(config['headers'])
+    headers['Referer'] = f"{config['base_url']}/search?keyword={quote(keyword)}" if keyword else config['base_url']
+    cookie = os.environ.get(config['cookie_env'])
+    if cookie:
+        headers['Cookie'] = cookie
+    return headers
+
+
+def fetch_json(config, url, headers):
+    """GET JSON API Shopee; None jika request gagal atau API mengembalikan kode error."""
+    try:
+        response = http_get(url, headers=headers, use_cache=False)
+        response.raise_for_status()
+        data = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"        -> Gagal mengambil {url}: {e}")
+        return None
+    if data.get('error'):
+        print(f"        -> API menolak {url}: error {data['error']} {data.get('error_msg') or ''}".rstrip())
+        return None
+    return data
+
+
+def search_url(config, keyword, page_num):
+    params = dict(config['search_params'], keyword=keyword, limit=config['page_size'],
+                  newest=page_num * config['page_size'])
+    return f"{config['base_url']}{config['search_path']}?{urlencode(params, quote_via=quote)}"
+
+
+def item_url(config, shop_id, item_id):
+    return f"{config['base_url']}{config['item_path']}?{urlencode({'itemid': item_id, 'shopid': shop_id})}"
+
+
+# ==============================================================================
+# PARSING ITEM
+# ==============================================================================
+
+def product_url(shop_id, item_id):
+    """URL produk permanen (tetap sama walau nama listing diganti penjual)."""
+    return f"https://shopee.co.id/product/{shop_id}/{item_id}"
+
+
+def to_rupiah(value, divisor):
+    return int(round(value / divisor)) if isinstance(value, (int, float)) and value > 0 else None
+
+
+def parse_item(config, item):
+    """
+    Mengubah `item_basic` (search_items) atau `data` (item/get) menjadi dict produk terstruktur.
+    Deskripsi dan `specs` hanya terisi dari item/get.
+    """
+    divisor = config['price_divisor']
+    rating = item.get('item_rating') or {}
+    rating_counts = rating.get('rating_count') or []
+    price_min = to_rupiah(item.get('price_min') or item.get('price'), divisor)
+    return {
+        'item_id': item['itemid'],
+        'shop_id': item['shopid'],
+        'name': (item.get('name') or '').strip() or None,
+        'brand': item.get('brand') or None,
+        'price': to_rupiah(item.get('price'), divisor) or price_min,
+        'price_min': price_min,
+        'price_max': to_rupiah(item.get('price_max'), divisor) or price_min,
+        'price_before_discount': to_rupiah(item.get('price_before_discount'), divisor),
+        'sold': item.get('historical_sold'),
+        'sold_30d': item.get('sold'),
+        'rating': round(rating['rating_star'], 2) if rating.get('rating_star') else None,
+        'reviews': rating_counts[0] if rating_counts else item.get('cmt_count'),
+        'stock': item.get('stock'),
+        'location': item.get('shop_location') or None,
+        'description': (item.get('description') or '').strip() or None,
+        'specs': {attr['name']: str(attr['value']) for attr in item.get('attributes') or []
+                  if attr.get('name') and attr.get('value') not in (None, '')},
+        'url': product_url(item['shopid'], item['itemid']),
+    }
+
+
+def format_rupiah(value):
+    return f"Rp{value:,}".replace(',', '.') if value else None
+
+
+def flat_row(product):
+    """Baris format `shopee.py` plus kolom angka; spesifikasi digabung 'Judul: Nilai | ...'."""
+    price_text = format_rupiah(product['price_min'])
+    if product['price_max'] and product['price_max'] != product['price_min']:
+        price_text = f"{price_text} - {format_rupiah(product['price_max'])}"
+    return {
+        "Product Name": product['name'] or "N/A",
+        "Brand": product['brand'] or "N/A",
+        "Price (IDR)": product['price'] or "N/A",
+        "Price Max (IDR)": product['price_max'] or "N/A",
+        "Price (string)": price_text or "N/A",
+        "Rating": product['rating'] or "N/A",
+        "Total Reviews": product['reviews'] if product['reviews'] is not None else "N/A",
+        "Total Sold": product['sold'] if product['sold'] is not None else "N/A",
+        "Stock": product['stock'] if product['stock'] is not None else "N/A",
+        "Shop Location": product['location'] or "N/A",
+        "Description": product['description'] or "N/A",
+        "Specifications": " | ".join(f"{title}: {value}" for title, value in product['specs'].items()) or "N/A",
+        "Product URL": product['url']
+    }
+
+
+# ==============================================================================
+# ENGINE
+# ==============================================================================
+
+def search_listing(config, keyword, max_pages, rate_limiter):
+    """
+    Semua `item_basic` hasil pencarian: halaman pertama menentukan total hasil, halaman
+    berikutnya diambil paralel. Mengembalikan None jika halaman pertama ditolak/gagal, termasuk
+    soft-block Shopee (status 200 dengan `items: null` dan tanpa `total_count`).
+    """
+    headers = request_headers(config, keyword)
+    first_url = search_url(config, keyword, 0)
+    rate_limiter.wait(first_url)
+    first = fetch_json(config, first_url, headers)
+    if first is None:
+        return None
+    if not first.get('items') and not first.get('total_count'):
+        print("    ⚠️ search_items kosong tanpa total_count (kemungkinan soft-block).")
+        return None
+    items = {}
+    pages = {0: first.get('items') or []}
+    total_pages = min(max_pages, math.ceil((first.get('total_count') or 0) / config['page_size']))
+    print(f"    ✅ search_items: {first.get('total_count') or 0} hasil, mengambil {max(total_pages, 1)} halaman.")
+
+    page_urls = {search_url(config, keyword, n): n for n in range(1, total_pages)}
+    if not first.get('nomore'):
+        for url, data in fetch_concurrently(list(page_urls), lambda url: fetch_json(config, url, headers),
+                                            max_workers=config['max_workers'], rate_limiter=rate_limiter,
+                                            max_retries=config['max_retries'],
+                                            retry_delay_seconds=config['retry_delay_seconds']):
+            if data is None:
+                print(f"    ❌ Gagal mengambil halaman {page_urls[url] + 1}. Melewati halaman ini.")
+                continue
+            pages[page_urls[url]] = data.get('items') or []
+    # Urutan relevansi dipertahankan; item yang muncul di dua halaman hanya disimpan sekali
+    for page_num in sorted(pages):
+        for entry in pages[page_num]:
+            item = entry.get('item_basic') or entry
+            if item.get('itemid') and item.get('shopid'):
+                items.setdefault((item['shopid'], item['itemid']), item)
+    return list(items.values())
+
+
+def crawl_search(keyword, config=None, max_pages=None):
+    """
+    Mengambil hasil pencarian Shopee tanpa browser. Menghasilkan list dict produk (lihat
+    `parse_item`) sesuai urutan relevansi, atau None jika API menolak (fallback Selenium).
+    """
+    config = config or SHOPEE_API_CONFIG
+    max_pages = max_pages or config['max_pages']
+    rate_limiter = HostRateLimiter(config['requests_per_second'], config['burst'])
+    set_host_pool_size(config['base_url'], config['max_workers'])
+
+    print(f"📊 Mengambil hasil pencarian Shopee via API JSON: '{keyword}'")
+    listing = search_listing(config, keyword, max_pages, rate_limiter)
+    if listing is None:
+        return None
+    products = {(item['shopid'], item['itemid']): parse_item(config, item) for item in listing}
+    if not config['fetch_details']:
+        return list(products.values())
+
+    print(f"🕵️  Mengambil {len(products)} detail item secara paralel ({config['max_workers']} worker)...")
+    headers = request_headers(config, keyword)
+    urls = {item_url(config, shop_id, item_id): (shop_id, item_id) for shop_id, item_id in products}
+    results = fetch_concurrently(list(urls), lambda url: fetch_json(config, url, headers),
+                                 max_workers=config['max_workers'], rate_limiter=rate_limiter,
+                                 max_retries=config['max_retries'], retry_delay_seconds=config['retry_delay_seconds'])
+    failed = 0
+    for url, data in results:
+        if data and data.get('data'):
+            products[urls[url]] = parse_item(config, data['data'])
+        else:
+            failed += 1  # Data dari search_items (tanpa deskripsi & atribut) tetap dipakai
+    if failed:
+        print(f"    ⚠️ {failed} detail gagal diambil; memakai data ringkas dari search_items.")
+    return list(products.values())
+
+
+# ==============================================================================
+# CLI NON-INTERAKTIF
+# ==============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sumber Shopee lewat API JSON search_items & item/get.")
+    parser.add_argument('--keyword', default="laptop hp")
+    parser.add_argument('--pages', type=int, default=SHOPEE_API_CONFIG['max_pages'])
+    parser.add_argument('--workers', type=int, default=SHOPEE_API_CONFIG['max_workers'])
+    parser.add_argument('--rps', type=float, default=SHOPEE_API_CONFIG['requests_per_second'])
+    parser.add_argument('--no-details', action='store_true', help="Hanya data search_items (tanpa item/get).")
+    parser.add_argument('--base-url', default=SHOPEE_API_CONFIG['base_url'],
+                        help="Host API (misal server fixture lokal).")
+    parser.add_argument('--fixtures', action='store_true', help="Jalankan server fixture lokal dan pakai itu.")
+    parser.add_argument('--synthetic', type=int, default=0, help="Dengan --fixtures: perbanyak fixture menjadi N item.")
+    args = parser.parse_args(argv)
+    config = dict(SHOPEE_API_CONFIG, base_url=args.base_url.rstrip('/'), max_workers=args.workers,
+                  requests_per_second=args.rps, fetch_details=not args.no_details)
+
+    server = None
+    if args.fixtures:
+        from sources.shopee_fixture import load_items, start_fixture_server, synthetic_items
+        items = synthetic_items(load_items(), args.synthetic) if args.synthetic else None
+        server, config['base_url'] = start_fixture_server(items)
+        print(f"🧪 Memakai fixture lokal di {config['base_url']}")
+
+    try:
+        start = time.perf_counter()
+        products = crawl_search(args.keyword, config, args.pages)
+        elapsed = time.perf_counter() - start
+    finally:
+        if server is not None:
+            server.shutdown()
+    if products is None:
+        print("❌ API Shopee menolak request. Isi SHOPEE_COOKIE atau gunakan shopee.py (Selenium).")
+        return None
+    print(f"⏱️  {len(products)} listing dalam {elapsed:.1f} detik ({len(products) / max(elapsed, 1e-9) * 60:.0f}/menit).")
+    slug = re.sub(r'[^a-z0-9]+', '_', args.keyword.lower()).strip('_')
+    writer = StreamingRowWriter(f"shopee_{slug}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                                first_columns=['Product Name', 'Price (IDR)', 'Product URL'],
+                                catalogue_source=None if args.fixtures else 'shopee')
+    writer.write_many(flat_row(product) for product in products)
+    if writer.close():
+        print(f"✅ {len(writer)} produk disimpan ke '{writer.output_file}'")
+    return products
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Pengganti lokal API JSON Shopee (`search_items` & `item/get`) berbasis fixture, untuk mencoba
+`sources.shopee_api` tanpa akses ke shopee.co.id (tanpa cookie, tanpa anti-bot).
+
+Item diambil dari `fixtures/shopee_items.json` (format `data` milik `item/get`). Pencarian
+mencocokkan semua kata kunci dengan nama item dan memotong hasil sesuai `newest`/`limit`,
+sama seperti API aslinya. `--synthetic N` memperbanyak fixture menjadi N item untuk uji beban.
+
+    python -m sources.shopee_fixture --port 8770 --synthetic 600
+    python -m sources.shopee_api --base-url http://127.0.0.1:8770 --keyword "laptop hp"
+"""
+import argparse
+import copy
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'shopee_items.json')
+
+# Field `item_basic` yang dikembalikan search_items (subset data item/get, tanpa deskripsi & atribut)
+ITEM_BASIC_FIELDS = ('itemid', 'shopid', 'name', 'brand', 'price', 'price_min', 'price_max',
+                     'price_before_discount', 'currency', 'stock', 'historical_sold', 'sold', 'liked_count',
+                     'cmt_count', 'shop_location', 'item_rating')
+
+
+def load_items(path=FIXTURE_PATH):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def synthetic_items(items, count):
+    """Memperbanyak item fixture menjadi `count` item dengan itemid unik."""
+    result = []
+    for i in range(count):
+        item = copy.deepcopy(items[i % len(items)])
+        if i >= len(items):
+            item['itemid'] = item['itemid'] * 1000 + i
+            item['name'] = f"{item['name']} #{i}"
+        result.append(item)
+    return result
+
+
+def make_handler(items):
+    by_id = {(str(item['shopid']), str(item['itemid'])): item for item in items}
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass  # Tidak mencetak log per request
+
+        def send_json(self, payload, status=200):
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            if url.path == '/api/v4/search/search_items':
+                keywords = query.get('keyword', '').lower().split()
+                matches = [item for item in items if all(k in item['name'].lower() for k in keywords)]
+                offset, limit = int(query.get('newest', 0)), int(query.get('limit', 60))
+                page = matches[offset:offset + limit]
+                self.send_json({
+                    'error': None, 'total_count': len(matches), 'nomore': offset + limit >= len(matches),
+                    'items': [{'itemid': item['itemid'], 'shopid': item['shopid'],
+                               'item_basic': {key: item[key] for key in ITEM_BASIC_FIELDS if key in item}}
+                              for item in page],
+                })
+            elif url.path == '/api/v4/item/get':
+                item = by_id.get((query.get('shopid'), query.get('itemid')))
+                if item is None:
+                    self.send_json({'error': 4, 'error_msg': 'item not found', 'data': None})
+                else:
+                    self.send_json({'error': None, 'data': item})
+            else:
+                self.send_json({'error': 404, 'error_msg': 'not found'}, status=404)
+
+    return FixtureHandler
+
+
+def start_fixture_server(items=None, port=0, host='127.0.0.1'):
+    """
+    Menjalankan server fixture di thread latar. Mengembalikan (server, base_url);
+    panggil `server.shutdown()` setelah selesai.
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(load_items() if items is None else items))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Server fixture lokal untuk API JSON Shopee.")
+    parser.add_argument('--port', type=int, default=8770)
+    parser.add_argument('--synthetic', type=int, default=0, help="Perbanyak fixture menjadi N item.")
+    args = parser.parse_args(argv)
+    items = load_items()
+    if args.synthetic:
+        items = synthetic_items(items, args.synthetic)
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), make_handler(items))
+    print(f"🧪 Fixture Shopee ({len(items)} item) di http://127.0.0.1:{args.port} — Ctrl-C untuk berhenti.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
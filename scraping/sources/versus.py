@@ -0,0 +1,385 @@
+"""
+Ekspor katalog Versus.com lewat API pencarian situsnya (`/api/search/search`), tanpa browser.
+
+Halaman pertama tiap kategori (facet `category.id`: laptop, smartphone, tablet, ...) memberi
+`nbPages`; semua halaman sisanya dari semua kategori lalu diambil paralel dengan jumlah worker
+dan token bucket terbatas. Hit digabung menjadi satu dataset bertipe (skor sebagai angka,
+tanggal rilis ISO, field bersarang diratakan) dan menggantikan infinite scroll di
+`Versus ( Laptop ).py` untuk menemukan daftar produk.
+
+Detail produk diambil dari state JSON Next.js (`script#__NEXT_DATA__`) di HTML halaman produk,
+lalu diratakan ke skema kolom `{kategori}_{spesifikasi}` yang sama dengan scraper Selenium;
+tidak ada lagi satu WebDriver round-trip per baris spesifikasi. Halaman yang state-nya tidak
+bisa dibaca ditandai agar diambil dengan browser pool.
+
+Contoh (dari folder 'scraping'):
+    python -m sources.versus --categories laptop smartphone tablet --workers 4
+    python -m sources.versus --categories laptop --details
+"""
+import argparse
+import json
+import re
+from datetime import datetime, timezone
+
+import pandas as pd
+import requests
+
+from common.fetcher import fetch_concurrently
+from common.html_parser import parse_html
+from common.http_cache import enable_cache
+from common.http_session import http_get, http_post, set_host_pool_size
+from common.rate_limiter import HostRateLimiter
+from common.row_sink import StreamingRowWriter
+
+# ==============================================================================
+# KONFIGURASI TERPUSAT UNTUK API VERSUS.COM
+# ==============================================================================
+VERSUS_CONFIG = {
+    'base_url': "https://versus.com",
+    'search_api_url': "https://versus.com/api/search/search",
+    'locale': "en",  # Prefix URL produk (sama dengan halaman yang dibuka `Versus ( Laptop ).py`)
+    'categories': ('laptop', 'smartphone', 'tablet'),  # Nilai facet `category.id`
+    'hits_per_page': 30,
+    'sort': "totalScore:desc",
+    'headers': {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36',
+        'Content-Type': 'application/json'
+    },
+    'max_retries': 3,
+    'retry_delay_seconds': 10,
+    'max_workers': 4,  # Jumlah halaman API yang diminta bersamaan
+    'requests_per_second': 3.0,  # Anggaran token bucket per host
+    'burst': 4,
+    'write_parquet': False,  # Tulis juga salinan Parquet bertipe (butuh pyarrow) di samping CSV
+    # Halaman detail: nama key di state JSON Next.js yang berisi grup & baris spesifikasi
+    'next_data_selector': "script#__NEXT_DATA__",
+    'detail_keys': {
+        'groups': ('propGroups', 'propertyGroups', 'specGroups', 'groups'),
+        'properties': ('properties', 'props', 'specs', 'items'),
+        'title': ('name', 'title', 'label'),
+        'value': ('formattedValue', 'displayValue', 'value'),
+        'unit': ('unit', 'unitName'),
+        'product_name': ('fullname', 'fullName', 'name'),
+        'score': ('totalScore', 'score'),
+    },
+    'detail_workers': 8,  # Jumlah halaman detail yang diambil bersamaan
+    'detail_requests_per_second': 4.0,
+    'use_http_cache': True  # Halaman detail disimpan di disk; refresh berikutnya cukup 304
+}
+
+# Penanda halaman detail tanpa state JSON yang terbaca (truthy agar tidak diulang oleh fetcher)
+NEEDS_BROWSER = 'needs_browser'
+
+# Kolom utama dataset; kolom lain dari hit ikut disimpan apa adanya (diratakan)
+FIRST_COLUMNS = ['fullname', 'brand', 'category', 'totalScore', 'releaseDate', 'url']
+
+
+# ==============================================================================
+# REQUEST API PENCARIAN
+# ==============================================================================
+
+def search_payload(config, category, page):
+    """Payload API pencarian; `page` dimulai dari 0 (halaman 1 di situs = page 0)."""
+    return {
+        "query": "",
+        "page": page,
+        "hitsPerPage": config['hits_per_page'],
+        "facetFilters": [[f"category.id:{category}"]],
+        "sort": config['sort']
+    }
+
+
+def search_page(config, category, page):
+    """Satu halaman hasil: dict {'hits', 'nbPages', 'nbHits'}, atau None jika request gagal."""
+    try:
+        response = http_post(config['search_api_url'], headers=config['headers'],
+                             json=search_payload(config, category, page))
+        response.raise_for_status()
+        data = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"        -> Gagal mengambil {category} halaman {page + 1}: {e}")
+        return None
+    # Lokasi data: resultGroups -> elemen pertama [0] -> hits (nbPages di grup atau di akar)
+    group = (data.get('resultGroups') or [{}])[0]
+    return {
+        'hits': group.get('hits') or [],
+        'nbPages': group.get('nbPages', data.get('nbPages', 1)),
+        'nbHits': group.get('nbHits', data.get('nbHits')),
+    }
+
+
+def page_key(config, category, page):
+    """Kunci unik per request (URL API + fragmen) untuk fetcher dan token bucket per host."""
+    return f"{config['search_api_url']}#{category}/{page}"
+
+
+# ==============================================================================
+# DATASET BERTIPE
+# ==============================================================================
+
+def flatten(value, prefix, row):
+    """Meratakan dict bersarang menjadi kolom 'a_b'; list nilai sederhana digabung dengan '; '."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            flatten(item, f"{prefix}_{key}" if prefix else key, row)
+    elif isinstance(value, list):
+        if all(not isinstance(item, (dict, list)) for item in value):
+            row[prefix] = "; ".join(str(item) for item in value)
+    elif value is not None:
+        row[prefix] = value
+
+
+def release_date(value):
+    """releaseDate dari API (ISO string atau epoch detik/milidetik) menjadi 'YYYY-MM-DD'."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        seconds = value / 1000 if value > 1e11 else value
+        return datetime.fromtimestamp(seconds, tz=timezone.utc).strftime('%Y-%m-%d')
+    parsed = pd.to_datetime(value, errors='coerce', utc=True) if value else pd.NaT
+    return None if pd.isna(parsed) else parsed.strftime('%Y-%m-%d')
+
+
+def hit_row(config, category, hit):
+    """Satu hit API menjadi baris datar bertipe; `url` menjadi URL produk lengkap."""
+    row = {}
+    flatten({key: value for key, value in hit.items() if not key.startswith('_')}, '', row)
+    row['category'] = category
+    url = hit.get('url') or ''
+    row['url'] = url if url.startswith('http') else f"{config['base_url']}/{config['locale']}{url}"
+    if row.get('totalScore') is not None:
+        row['totalScore'] = float(row['totalScore'])
+    if 'releaseDate' in row:
+        row['releaseDate'] = release_date(row['releaseDate'])
+    return row
+
+
+def hits_frame(rows):
+    """DataFrame bertipe dari baris hit: skor float, tanggal datetime, brand/kategori categorical."""
+    df = pd.DataFrame(rows)
+    if 'totalScore' in df.columns:
+        df['totalScore'] = pd.to_numeric(df['totalScore'], errors='coerce')
+    if 'releaseDate' in df.columns:
+        df['releaseDate'] = pd.to_datetime(df['releaseDate'], errors='coerce')
+    for column in ('brand', 'category'):
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    return df
+
+
+# ==============================================================================
+# DETAIL PRODUK DARI __NEXT_DATA__
+# ==============================================================================
+
+def spec_column(category, spec_name):
+    """Nama kolom `{kategori}_{spesifikasi}` (sama persis dengan scraper Selenium)."""
+    category = category.replace(' ', '_').replace('&', 'and') if category else "General"
+    return f"{category}_{re.sub(r'[^A-Za-z0-9_]+', '', spec_name.replace(' ', '_'))}"
+
+
+def first_key(obj, keys):
+    return next((obj[key] for key in keys if obj.get(key) not in (None, '', [], {})), None)
+
+
+def find_product(data, keys):
+    """Objek produk di state JSON: dict pertama yang punya list grup spesifikasi."""
+    stack = [data]
+    while stack:
+        obj = stack.pop(0)
+        if isinstance(obj, dict):
+            groups = first_key(obj, keys['groups'])
+            if isinstance(groups, list) and any(isinstance(group, dict) and first_key(group, keys['properties'])
+                                                for group in groups):
+                return obj, groups
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+    return None, None
+
+
+def format_spec_value(prop, keys):
+    value = first_key(prop, keys['value'])
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    if isinstance(value, dict):  # Misal {"value": 16, "unit": "GB"}
+        return format_spec_value(value, keys)
+    if isinstance(value, list):
+        return ", ".join(str(item) for item in value if item not in (None, ''))
+    if value is None:
+        return None
+    unit = first_key(prop, keys['unit'])
+    return f"{value} {unit}" if unit and isinstance(value, (int, float)) else str(value)
+
+
+def parse_detail_page(config, html, url):
+    """
+    Baris detail (Product URL, Device Name, Versus Score, `{kategori}_{spesifikasi}`) dari
+    `__NEXT_DATA__` halaman produk, atau None jika state JSON/grup spesifikasi tidak ada.
+    """
+    keys = config['detail_keys']
+    script = parse_html(html).select_one(config['next_data_selector'])
+    try:
+        data = json.loads(script.text()) if script is not None else None
+    except ValueError:
+        data = None
+    product, groups = find_product(data, keys) if data else (None, None)
+    if product is None:
+        return None
+
+    score = first_key(product, keys['score'])
+    row = {"Product URL": url, "Device Name": first_key(product, keys['product_name']) or "",
+           "Versus Score": score if score is not None else "N/A"}
+    for group in groups:
+        if not isinstance(group, dict):
+            continue
+        category = first_key(group, keys['title'])
+        for prop in first_key(group, keys['properties']) or []:
+            if not isinstance(prop, dict):
+                continue
+            spec_name, value = first_key(prop, keys['title']), format_spec_value(prop, keys)
+            if spec_name and value not in (None, ''):
+                row[spec_column(category, str(spec_name))] = value
+    return row
+
+
+def scrape_detail(config, url):
+    try:
+        response = http_get(url, headers=config['headers'])
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"        -> Terjadi error saat scraping detail: {e}")
+        return None
+    # Retry tidak membantu halaman tanpa state JSON; cukup ditandai untuk browser pool
+    return parse_detail_page(config, response.text, url) or NEEDS_BROWSER
+
+
+# ==============================================================================
+# ENGINE
+# ==============================================================================
+
+def crawl_catalogue(categories=None, config=None):
+    """
+    Semua produk untuk setiap kategori: halaman pertama per kategori menentukan `nbPages`,
+    lalu semua halaman lain diambil paralel. Mengembalikan list baris (lihat `hit_row`) tanpa
+    duplikat URL, berurutan per kategori dan skor; None jika API tidak bisa diakses sama sekali.
+    """
+    config = config or VERSUS_CONFIG
+    categories = list(categories or config['categories'])
+    rate_limiter = HostRateLimiter(config['requests_per_second'], config['burst'])
+    set_host_pool_size(config['search_api_url'], config['max_workers'])
+
+    print(f"📊 Mengambil katalog Versus via API pencarian: {', '.join(categories)}")
+    requests_by_key = {page_key(config, category, 0): (category, 0) for category in categories}
+    pages, remaining = {}, {}
+
+    def fetch_page(key):
+        category, page = requests_by_key[key]
+        return search_page(config, category, page)
+
+    # Tahap 1: halaman pertama semua kategori (sekaligus menemukan nbPages)
+    for key, result in fetch_concurrently(list(requests_by_key), fetch_page, max_workers=config['max_workers'],
+                                          rate_limiter=rate_limiter, max_retries=config['max_retries'],
+                                          retry_delay_seconds=config['retry_delay_seconds']):
+        category, _ = requests_by_key[key]
+        if result is None:
+            print(f"    ❌ Kategori '{category}' tidak bisa diambil. Melewati kategori ini.")
+            continue
+        pages[(category, 0)] = result['hits']
+        limit = result['nbPages'] * config['hits_per_page']
+        print(f"    ✅ {category}: {result['nbHits']} produk, {result['nbPages']} halaman API.")
+        if result['nbHits'] and result['nbHits'] > limit:
+            print(f"    ⚠️ {category}: API hanya membuka {limit} hit pertama (batas paginasi).")
+        for page in range(1, result['nbPages']):
+            remaining[page_key(config, category, page)] = (category, page)
+    if not pages:
+        return None
+
+    # Tahap 2: semua halaman sisanya dari semua kategori, paralel dengan batas worker
+    requests_by_key.update(remaining)
+    print(f"🕵️  Mengambil {len(remaining)} halaman API secara paralel ({config['max_workers']} worker)...")
+    for key, result in fetch_concurrently(list(remaining), fetch_page, max_workers=config['max_workers'],
+                                          rate_limiter=rate_limiter, max_retries=config['max_retries'],
+                                          retry_delay_seconds=config['retry_delay_seconds']):
+        category, page = requests_by_key[key]
+        if result is None:
+            print(f"    ❌ Gagal mengambil {category} halaman {page + 1}. Melewati halaman ini.")
+            continue
+        pages[(category, page)] = result['hits']
+
+    rows = {}
+    for category in categories:
+        for page in sorted(page for cat, page in pages if cat == category):
+            for hit in pages[(category, page)]:
+                row = hit_row(config, category, hit)
+                rows.setdefault(row['url'], row)
+    return list(rows.values())
+
+
+def crawl_details(urls, config=None):
+    """
+    Mengambil detail banyak produk secara paralel lewat HTTP. Menghasilkan (yield)
+    (url, baris) sesuai urutan selesai; baris bernilai NEEDS_BROWSER jika halaman perlu
+    dibuka dengan browser, atau None jika request gagal setelah semua percobaan.
+    """
+    config = config or VERSUS_CONFIG
+    rate_limiter = HostRateLimiter(config['detail_requests_per_second'], config['detail_workers'])
+    set_host_pool_size(config['base_url'], config['detail_workers'])
+    if config['use_http_cache']:
+        enable_cache()
+    yield from fetch_concurrently(list(urls), lambda url: scrape_detail(config, url),
+                                  max_workers=config['detail_workers'], rate_limiter=rate_limiter,
+                                  max_retries=config['max_retries'], retry_delay_seconds=config['retry_delay_seconds'])
+
+
+def product_links(category, config=None):
+    """URL produk lengkap satu kategori (pengganti infinite scroll); None jika API gagal."""
+    rows = crawl_catalogue([category], config)
+    return None if rows is None else [row['url'] for row in rows]
+
+
+# ==============================================================================
+# CLI NON-INTERAKTIF
+# ==============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ekspor katalog Versus.com lewat API pencarian.")
+    parser.add_argument('--categories', nargs='+', default=list(VERSUS_CONFIG['categories']),
+                        help="Nilai facet category.id (default: laptop smartphone tablet).")
+    parser.add_argument('--workers', type=int, default=VERSUS_CONFIG['max_workers'])
+    parser.add_argument('--rps', type=float, default=VERSUS_CONFIG['requests_per_second'])
+    parser.add_argument('--hits-per-page', type=int, default=VERSUS_CONFIG['hits_per_page'])
+    parser.add_argument('--api-url', default=VERSUS_CONFIG['search_api_url'])
+    parser.add_argument('--parquet', action='store_true', help="Tulis juga file Parquet bertipe (butuh pyarrow).")
+    parser.add_argument('--details', action='store_true',
+                        help="Ambil juga spesifikasi lengkap tiap produk dari halaman detailnya.")
+    parser.add_argument('--detail-workers', type=int, default=VERSUS_CONFIG['detail_workers'])
+    args = parser.parse_args(argv)
+    config = dict(VERSUS_CONFIG, max_workers=args.workers, requests_per_second=args.rps,
+                  hits_per_page=args.hits_per_page, search_api_url=args.api_url,
+                  write_parquet=VERSUS_CONFIG['write_parquet'] or args.parquet, detail_workers=args.detail_workers)
+
+    rows = crawl_catalogue(args.categories, config)
+    if rows is None:
+        print("❌ API pencarian Versus tidak bisa diakses.")
+        return None
+    if args.details:
+        print(f"🕵️  Mengambil detail {len(rows)} produk secara paralel ({config['detail_workers']} worker)...")
+        details, needs_browser = {}, 0
+        for i, (url, detail) in enumerate(crawl_details([row['url'] for row in rows], config), 1):
+            if isinstance(detail, dict):
+                details[url] = detail
+                print(f"    👍 [{i}/{len(rows)}] {detail['Device Name']}")
+            else:
+                needs_browser += detail == NEEDS_BROWSER
+        if needs_browser:
+            print(f"    ⚠️ {needs_browser} produk tanpa __NEXT_DATA__; ambil dengan 'Versus ( Laptop ).py'.")
+        rows = [{**row, **details.get(row['url'], {})} for row in rows]
+    writer = StreamingRowWriter(f"versus_{'_'.join(args.categories)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                                first_columns=FIRST_COLUMNS, write_parquet=config['write_parquet'],
+                                catalogue_source='versus')
+    writer.write_many(rows)
+    if writer.close():
+        print(f"✅ {len(writer)} produk disimpan ke '{writer.output_file}'")
+    return hits_frame(rows)
+
+
+if __name__ == '__main__':
+    main()